@@ -3,19 +3,82 @@ Channel Management Module for 7-Day Multi-Channel System
 Handles CRUD operations for channels and their configurations
 """
 
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from supabase_client import SupabaseClient
+import time
+from typing import Optional, List, Dict, Any, Tuple, Union
+from datetime import datetime, timezone
+import supabase_client as _supabase_module
+from supabase_client import SupabaseClient, get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+# Channel rows change rarely; cache lookups for this many seconds
+CHANNEL_CACHE_TTL = 60
+
+# list_channels results are reused for this many seconds
+CHANNEL_LIST_CACHE_TTL = 5
+
+
+def _resolve_client(supabase_client: Optional[SupabaseClient]) -> SupabaseClient:
+    """Default to the shared pooled client and warn about private ones"""
+    if supabase_client is None:
+        return get_supabase_client()
+
+    # Only compare against the shared client; never build it just for this check
+    shared = _supabase_module._shared_client
+    if shared is not None and supabase_client is not shared:
+        logger.warning(
+            "Manager created with a private SupabaseClient - "
+            "use get_supabase_client() to share the connection pool"
+        )
+    return supabase_client
+
 
 class ChannelManager:
     """Manages YouTube channel configurations"""
 
-    def __init__(self, supabase_client: SupabaseClient):
-        self.supabase = supabase_client.supabase
+    def __init__(self, supabase_client: Optional[SupabaseClient] = None):
+        self.supabase = _resolve_client(supabase_client).supabase
+
+        # get_channel / get_channel_by_id cache
+        # Format: {('name', channel_name) | ('id', channel_id): (expires_at, channel)}
+        self._channel_cache: Dict[Tuple[str, Any], Tuple[float, Dict[str, Any]]] = {}
+
+        # In-flight channel lookups, same keys as _channel_cache
+        self._inflight: Dict[Tuple[str, Any], asyncio.Future] = {}
+
+        # list_channels cache
+        # Format: {active_only: (expires_at, channels)}
+        self._list_cache: Dict[bool, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._list_lock = asyncio.Lock()
+
+    def _cache_channel(self, channel: Dict[str, Any]):
+        """Store a channel row under both its name and ID"""
+        expires_at = time.monotonic() + CHANNEL_CACHE_TTL
+        self._channel_cache[('name', channel['channel_name'])] = (expires_at, channel)
+        self._channel_cache[('id', channel['id'])] = (expires_at, channel)
+
+    def _get_cached_channel(self, key: Tuple[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return a cached channel row if present and not expired"""
+        entry = self._channel_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _invalidate_channel(self, channel_name: str):
+        """Drop a channel from the lookup cache and all cached lists"""
+        entry = self._channel_cache.pop(('name', channel_name), None)
+        if entry:
+            self._channel_cache.pop(('id', entry[1]['id']), None)
+        self._list_cache.clear()
+
+    def _get_cached_list(self, active_only: bool) -> Optional[List[Dict[str, Any]]]:
+        """Return a cached list_channels result if present and not expired"""
+        entry = self._list_cache.get(active_only)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
 
     async def add_channel(
         self,
@@ -61,6 +124,8 @@ class ChannelManager:
 
             if result.data:
                 logger.info(f"Channel added: {channel_name}")
+                self._list_cache.clear()
+                self._cache_channel(result.data[0])
                 return result.data[0]
             else:
                 raise Exception("Failed to add channel")
@@ -72,13 +137,18 @@ class ChannelManager:
     async def update_channel(
         self,
         channel_name: str,
+        filters: Optional[Dict[str, Any]] = None,
         **updates
     ) -> Dict[str, Any]:
         """
         Update channel configuration
 
+        Use filters instead of a separate lookup for conditional updates,
+        e.g. filters={'is_active': True} only touches an active channel.
+
         Args:
             channel_name: Channel to update
+            filters: Extra column values the row must match
             **updates: Fields to update
 
         Returns:
@@ -88,15 +158,23 @@ class ChannelManager:
             # Add updated timestamp
             updates['updated_at'] = datetime.utcnow().isoformat()
 
-            result = self.supabase.table('channels').update(updates).eq(
+            query = self.supabase.table('channels').update(updates).eq(
                 'channel_name', channel_name
-            ).execute()
+            )
+
+            for column, value in (filters or {}).items():
+                query = query.eq(column, value)
+
+            result = query.execute()
+
+            self._invalidate_channel(channel_name)
 
             if result.data:
                 logger.info(f"Channel updated: {channel_name}")
+                self._cache_channel(result.data[0])
                 return result.data[0]
             else:
-                raise Exception(f"Channel not found: {channel_name}")
+                raise Exception(f"Channel not found or filters not matched: {channel_name}")
 
         except Exception as e:
             logger.error(f"Error updating channel {channel_name}: {e}")
@@ -118,8 +196,11 @@ class ChannelManager:
                 'updated_at': datetime.utcnow().isoformat()
             }).eq('channel_name', channel_name).execute()
 
+            self._invalidate_channel(channel_name)
+
             if result.data:
                 logger.info(f"Channel deactivated: {channel_name}")
+                self._cache_channel(result.data[0])
                 return True
             return False
 
@@ -137,32 +218,51 @@ class ChannelManager:
         Returns:
             Channel data or None
         """
-        try:
-            result = self.supabase.table('channels').select('*').eq(
-                'channel_name', channel_name
-            ).execute()
-
-            if result.data:
-                return result.data[0]
-            return None
-
-        except Exception as e:
-            logger.error(f"Error getting channel {channel_name}: {e}")
-            return None
+        return await self._lookup_channel(('name', channel_name), 'channel_name', channel_name)
 
     async def get_channel_by_id(self, channel_id: int) -> Optional[Dict[str, Any]]:
         """Get channel by ID"""
+        return await self._lookup_channel(('id', channel_id), 'id', channel_id)
+
+    async def _lookup_channel(
+        self,
+        key: Tuple[str, Any],
+        column: str,
+        value: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Cached channel lookup; concurrent misses for the same key share
+        one in-flight query instead of each hitting Supabase
+        """
+        cached = self._get_cached_channel(key)
+        if cached:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_channel(column, value))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # shield: a cancelled waiter must not cancel the shared query
+        return await asyncio.shield(task)
+
+    async def _fetch_channel(self, column: str, value: Any) -> Optional[Dict[str, Any]]:
+        """Fetch a single channel row and cache it"""
         try:
-            result = self.supabase.table('channels').select('*').eq(
-                'id', channel_id
-            ).execute()
+            query = self.supabase.table('channels').select('*').eq(
+                column, value
+            ).limit(1).maybe_single()
 
-            if result.data:
-                return result.data[0]
+            result = await asyncio.to_thread(query.execute)
+
+            if result:
+                self._cache_channel(result.data)
+                return result.data
             return None
 
         except Exception as e:
-            logger.error(f"Error getting channel ID {channel_id}: {e}")
+            logger.error(f"Error getting channel {column}={value}: {e}")
             return None
 
     async def list_channels(self, active_only: bool = True) -> List[Dict[str, Any]]:
@@ -175,19 +275,29 @@ class ChannelManager:
         Returns:
             List of channel dicts
         """
-        try:
-            query = self.supabase.table('channels').select('*')
+        async with self._list_lock:
+            cached = self._get_cached_list(active_only)
+            if cached is not None:
+                return list(cached)
 
-            if active_only:
-                query = query.eq('is_active', True)
+            try:
+                query = self.supabase.table('channels').select('*')
 
-            result = query.order('channel_name').execute()
+                if active_only:
+                    query = query.eq('is_active', True)
 
-            return result.data if result.data else []
+                result = await asyncio.to_thread(query.order('channel_name').execute)
 
-        except Exception as e:
-            logger.error(f"Error listing channels: {e}")
-            return []
+                channels = result.data if result.data else []
+                self._list_cache[active_only] = (
+                    time.monotonic() + CHANNEL_LIST_CACHE_TTL,
+                    channels
+                )
+                return list(channels)
+
+            except Exception as e:
+                logger.error(f"Error listing channels: {e}")
+                return []
 
     async def set_reference_audio(
         self,
@@ -207,11 +317,12 @@ class ChannelManager:
             True if successful
         """
         try:
-            return await self.update_channel(
+            result = await self.update_channel(
                 channel_name,
                 reference_audio_id=audio_id,
                 reference_audio_url=audio_url
             )
+            return bool(result)
 
         except Exception as e:
             logger.error(f"Error setting reference audio for {channel_name}: {e}")
@@ -227,25 +338,65 @@ class ChannelManager:
         Returns:
             List of channel names
         """
-        channels = await self.list_channels(active_only)
-        return [ch['channel_name'] for ch in channels]
+        cached = self._get_cached_list(active_only)
+        if cached is not None:
+            return [ch['channel_name'] for ch in cached]
+
+        try:
+            query = self.supabase.table('channels').select('channel_name')
+
+            if active_only:
+                query = query.eq('is_active', True)
+
+            result = query.order('channel_name').execute()
+
+            return [ch['channel_name'] for ch in result.data] if result.data else []
+
+        except Exception as e:
+            logger.error(f"Error getting channel names: {e}")
+            return []
 
     async def get_channel_count(self, active_only: bool = True) -> int:
         """Get total channel count"""
-        channels = await self.list_channels(active_only)
-        return len(channels)
+        cached = self._get_cached_list(active_only)
+        if cached is not None:
+            return len(cached)
+
+        try:
+            query = self.supabase.table('channels').select('id', count='exact', head=True)
+
+            if active_only:
+                query = query.eq('is_active', True)
+
+            result = query.execute()
+
+            return result.count or 0
+
+        except Exception as e:
+            logger.error(f"Error counting channels: {e}")
+            return 0
 
     async def is_channel_active(self, channel_name: str) -> bool:
         """Check if channel is active"""
-        channel = await self.get_channel(channel_name)
-        return channel and channel.get('is_active', False)
+        try:
+            result = self.supabase.table('channels').select('is_active').eq(
+                'channel_name', channel_name
+            ).limit(1).maybe_single().execute()
+
+            return bool(result and result.data.get('is_active'))
+
+        except Exception as e:
+            logger.error(f"Error checking channel {channel_name}: {e}")
+            return False
 
     async def activate_channel(self, channel_name: str) -> bool:
         """Activate a channel"""
         try:
             result = await self.update_channel(channel_name, is_active=True)
             return bool(result)
-        except:
+        except Exception:
+            # Not bare: CancelledError / KeyboardInterrupt must propagate
+            logger.exception(f"Error activating channel {channel_name}")
             return False
 
     async def deactivate_channel(self, channel_name: str) -> bool:
@@ -253,7 +404,9 @@ class ChannelManager:
         try:
             result = await self.update_channel(channel_name, is_active=False)
             return bool(result)
-        except:
+        except Exception:
+            # Not bare: CancelledError / KeyboardInterrupt must propagate
+            logger.exception(f"Error deactivating channel {channel_name}")
             return False
 
     async def get_channel_stats(self, channel_name: str) -> Dict[str, Any]:
@@ -264,41 +417,112 @@ class ChannelManager:
             Dict with stats like total videos, completion rate, etc.
         """
         try:
-            channel = await self.get_channel(channel_name)
-            if not channel:
+            # Single aggregated round trip (get_channel_stats RPC)
+            try:
+                query = self.supabase.rpc('get_channel_stats', {'p_channel_name': channel_name})
+                result = await asyncio.to_thread(query.execute)
+                row = result.data[0] if result.data else None
+            except Exception as e:
+                logger.warning(f"get_channel_stats RPC unavailable, using fallback: {e}")
+                row = await self._query_channel_stats(channel_name)
+
+            if not row:
                 return {}
 
-            channel_id = channel['id']
+            return self._build_stats(channel_name, row)
 
-            # Get total daily_uploads for this channel
-            result = self.supabase.table('daily_uploads').select(
-                'video_status',
-                count='exact'
-            ).eq('channel_id', channel_id).execute()
+        except Exception as e:
+            logger.error(f"Error getting stats for {channel_name}: {e}")
+            return {}
+
+    async def get_all_channel_stats(self, active_only: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get statistics for every channel in one query
+
+        Args:
+            active_only: Only include active channels
 
-            total = result.count if hasattr(result, 'count') else 0
+        Returns:
+            List of stats dicts (same shape as get_channel_stats)
+        """
+        try:
+            try:
+                query = self.supabase.rpc('get_all_channel_stats', {'p_active_only': active_only})
+                result = await asyncio.to_thread(query.execute)
+                rows = result.data if result.data else []
+            except Exception as e:
+                logger.warning(f"get_all_channel_stats RPC unavailable, using fallback: {e}")
+                rows = await self._query_all_channel_stats(active_only)
 
-            # Get completed count
-            completed_result = self.supabase.table('daily_uploads').select(
-                'id',
-                count='exact'
-            ).eq('channel_id', channel_id).eq('video_status', 'completed').execute()
+            return [self._build_stats(row['channel_name'], row) for row in rows]
 
-            completed = completed_result.count if hasattr(completed_result, 'count') else 0
+        except Exception as e:
+            logger.error(f"Error getting stats for all channels: {e}")
+            return []
 
-            completion_rate = (completed / total * 100) if total > 0 else 0
+    @staticmethod
+    def _build_stats(channel_name: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the stats dict from an aggregated stats row"""
+        total = row.get('total_videos') or 0
+        completed = row.get('completed_videos') or 0
+        completion_rate = (completed / total * 100) if total > 0 else 0
+
+        return {
+            'channel_name': channel_name,
+            'total_videos': total,
+            'completed_videos': completed,
+            'completion_rate': round(completion_rate, 2),
+            'is_active': row['is_active']
+        }
+
+    async def _count_uploads(self, channel_id: int) -> Tuple[int, int]:
+        """(total, completed) daily_uploads for a channel via two concurrent HEAD counts"""
+        # HEAD counts: no rows on the wire and no max-rows truncation
+        total_query = self.supabase.table('daily_uploads').select(
+            'id', count='exact', head=True
+        ).eq('channel_id', channel_id)
+        completed_query = self.supabase.table('daily_uploads').select(
+            'id', count='exact', head=True
+        ).eq('channel_id', channel_id).eq('video_status', 'completed')
+
+        total_result, completed_result = await asyncio.gather(
+            asyncio.to_thread(total_query.execute),
+            asyncio.to_thread(completed_query.execute)
+        )
+        return total_result.count or 0, completed_result.count or 0
+
+    async def _query_channel_stats(self, channel_name: str) -> Optional[Dict[str, Any]]:
+        """Fallback for get_channel_stats when the RPC is not installed"""
+        # Cached lookup; usually no round trip
+        channel = await self.get_channel(channel_name)
+        if not channel:
+            return None
 
-            return {
-                'channel_name': channel_name,
+        total, completed = await self._count_uploads(channel['id'])
+
+        return {
+            'total_videos': total,
+            'completed_videos': completed,
+            'is_active': channel['is_active']
+        }
+
+    async def _query_all_channel_stats(self, active_only: bool) -> List[Dict[str, Any]]:
+        """Fallback for get_all_channel_stats when the RPC is not installed"""
+        channels = await self.list_channels(active_only)
+        if not channels:
+            return []
+
+        counts = await asyncio.gather(*(self._count_uploads(ch['id']) for ch in channels))
+
+        return [
+            {
+                'channel_name': ch['channel_name'],
                 'total_videos': total,
                 'completed_videos': completed,
-                'completion_rate': round(completion_rate, 2),
-                'is_active': channel['is_active']
+                'is_active': ch['is_active']
             }
-
-        except Exception as e:
-            logger.error(f"Error getting stats for {channel_name}: {e}")
-            return {}
+            for ch, (total, completed) in zip(channels, counts)
+        ]
 
     def format_channel_list(self, channels: List[Dict[str, Any]]) -> str:
         """
@@ -313,26 +537,163 @@ class ChannelManager:
         if not channels:
             return "No channels configured."
 
-        lines = ["📋 CONFIGURED CHANNELS:\n"]
+        body = "\n".join(
+            f"{'✅' if ch['is_active'] else '❌'} {ch['channel_name']} "
+            f"({ch.get('channel_display_name', ch['channel_name'])})\n"
+            f"   Videos/day: {ch.get('daily_video_target', 4)} | "
+            f"Voice: {'🎤' if ch.get('reference_audio_id') else '⚪'}"
+            for ch in channels
+        )
+
+        return "\n".join(["📋 CONFIGURED CHANNELS:\n", body])
+
+
+class _WriteBatcher:
+    """
+    Coalesces daily_uploads writes issued close together into few updates
 
-        for ch in channels:
-            status = "✅" if ch['is_active'] else "❌"
-            name = ch['channel_name']
-            display = ch.get('channel_display_name', name)
-            target = ch.get('daily_video_target', 4)
-            has_voice = "🎤" if ch.get('reference_audio_id') else "⚪"
+    Writes wait up to `window` seconds in a queue, are merged per upload
+    id and sent as one update ... in_('id', ids) per distinct set of
+    column values. Being a plain UPDATE, a missing row fails exactly like
+    the unbatched path instead of being created. Each caller awaits its
+    own future for the resulting row.
 
-            lines.append(f"{status} {name} ({display})")
-            lines.append(f"   Videos/day: {target} | Voice: {has_voice}")
+    Write-time columns (STAMP_COLUMNS) are restamped once per flush, so
+    rows that only differed in their call timestamp share one UPDATE.
+    """
 
-        return "\n".join(lines)
+    STAMP_COLUMNS = ('updated_at', 'script_received_at', 'processing_completed_at')
+
+    def __init__(self, supabase, window: float = 0.05, max_batch: int = 32):
+        self.supabase = supabase
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(
+        self,
+        upload_id: int,
+        fields: Dict[str, Any],
+        return_row: bool = True
+    ) -> Union[Dict[str, Any], bool]:
+        """Queue a write and wait for its row (or True without return_row)"""
+        # Started lazily: managers are built before the event loop runs.
+        # A dead worker has already failed everything it left queued
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((upload_id, fields, return_row, future))
+        return await future
+
+    async def _run(self):
+        batch = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+
+                # Give concurrent writers a moment to join this batch
+                await asyncio.sleep(self.window)
+                while len(batch) < self.max_batch and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+
+                await self._flush(batch)
+                batch = []
+        finally:
+            # Worker is going away (cancelled or crashed): nobody else will
+            # resolve these, so fail the batch in hand and everything queued
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(Exception("Upload write batcher stopped"))
+
+    async def _flush(self, batch: List[Tuple[int, Dict[str, Any], bool, asyncio.Future]]):
+        # Merge writes to the same row, later fields win
+        merged: Dict[int, Dict[str, Any]] = {}
+        waiters: Dict[int, List[Tuple[bool, asyncio.Future]]] = {}
+        for upload_id, fields, return_row, future in batch:
+            merged.setdefault(upload_id, {}).update(fields)
+            waiters.setdefault(upload_id, []).append((return_row, future))
+
+        # One write time for the whole flush
+        now = datetime.now(timezone.utc).isoformat()
+        for fields in merged.values():
+            for column in self.STAMP_COLUMNS:
+                if column in fields:
+                    fields[column] = now
+
+        # One UPDATE sets the same values on every matched row
+        groups: Dict[Tuple[Tuple[str, Any], ...], List[int]] = {}
+        for upload_id, fields in merged.items():
+            groups.setdefault(tuple(sorted(fields.items())), []).append(upload_id)
+
+        for ids in groups.values():
+            # Only ask for rows back if some caller wants them
+            need_rows = any(return_row for upload_id in ids for return_row, _ in waiters[upload_id])
+
+            try:
+                fields = merged[ids[0]]
+                if need_rows:
+                    query = self.supabase.table('daily_uploads').update(fields)
+                else:
+                    query = self.supabase.table('daily_uploads').update(
+                        fields, count='exact', returning='minimal'
+                    )
+                result = await asyncio.to_thread(query.in_('id', ids).execute)
+
+                if need_rows:
+                    returned = {row['id']: row for row in result.data or []}
+                elif result.count == len(ids):
+                    returned = dict.fromkeys(ids, True)
+                else:
+                    # Some rows are gone; find out which before failing their callers
+                    check = self.supabase.table('daily_uploads').select('id').in_('id', ids)
+                    existing = await asyncio.to_thread(check.execute)
+                    returned = {row['id']: True for row in existing.data or []}
+
+                for upload_id in ids:
+                    row = returned.get(upload_id)
+                    for return_row, future in waiters[upload_id]:
+                        if future.done():
+                            continue
+                        if row:
+                            future.set_result(row if return_row else True)
+                        else:
+                            future.set_exception(Exception("Upload entry not found"))
+
+            except Exception as e:
+                logger.error(f"Error flushing {len(ids)} batched upload writes: {e}")
+                for upload_id in ids:
+                    for _, future in waiters[upload_id]:
+                        if not future.done():
+                            future.set_exception(e)
 
 
 class DailyUploadManager:
     """Manages daily_uploads table operations"""
 
-    def __init__(self, supabase_client: SupabaseClient):
-        self.supabase = supabase_client.supabase
+    def __init__(
+        self,
+        supabase_client: Optional[SupabaseClient] = None,
+        batch_writes: bool = False,
+        channel_mgr: Optional[ChannelManager] = None
+    ):
+        self.supabase = _resolve_client(supabase_client).supabase
+
+        # Optional debounce queue for update_script/thumbnail/video_status
+        self._batcher = _WriteBatcher(self.supabase) if batch_writes else None
+
+        # Source of cached channel rows (see get_date_uploads)
+        self.channel_mgr = channel_mgr or ChannelManager(supabase_client)
+
+    @staticmethod
+    def _now_iso() -> str:
+        """Current UTC time as ISO string (timezone-aware)"""
+        return datetime.now(timezone.utc).isoformat()
 
     async def create_upload_entry(
         self,
@@ -352,20 +713,13 @@ class DailyUploadManager:
             Created entry data
         """
         try:
-            data = {
-                'channel_id': channel_id,
-                'upload_date': upload_date,
-                'video_number': video_number,
-                'script_status': 'pending',
-                'thumbnail_status': 'pending',
-                'video_status': 'pending',
-                'audio_status': 'pending'
-            }
+            data = self._pending_entry(channel_id, upload_date, video_number)
 
-            result = self.supabase.table('daily_uploads').upsert(
+            query = self.supabase.table('daily_uploads').upsert(
                 data,
                 on_conflict='channel_id,upload_date,video_number'
-            ).execute()
+            )
+            result = await asyncio.to_thread(query.execute)
 
             if result.data:
                 return result.data[0]
@@ -376,29 +730,137 @@ class DailyUploadManager:
             logger.error(f"Error creating upload entry: {e}")
             raise
 
+    async def create_upload_entries(
+        self,
+        entries: List[Tuple[int, str, int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many daily_upload entries with a single upsert
+
+        Args:
+            entries: List of (channel_id, upload_date, video_number)
+
+        Returns:
+            List of created entry data
+        """
+        if not entries:
+            return []
+
+        try:
+            data = [self._pending_entry(*entry) for entry in entries]
+
+            result = self.supabase.table('daily_uploads').upsert(
+                data,
+                on_conflict='channel_id,upload_date,video_number'
+            ).execute()
+
+            if result.data:
+                return result.data
+            else:
+                raise Exception("Failed to create upload entries")
+
+        except Exception as e:
+            logger.error(f"Error creating {len(entries)} upload entries: {e}")
+            raise
+
+    @staticmethod
+    def _pending_entry(channel_id: int, upload_date: str, video_number: int) -> Dict[str, Any]:
+        """Row data for a fresh daily_upload entry"""
+        return {
+            'channel_id': channel_id,
+            'upload_date': upload_date,
+            'video_number': video_number,
+            'script_status': 'pending',
+            'thumbnail_status': 'pending',
+            'video_status': 'pending',
+            'audio_status': 'pending'
+        }
+
+    def script_fields(self, script_text: str) -> Dict[str, Any]:
+        """Columns written when a script is received"""
+        now = self._now_iso()
+        return {
+            'script_text': script_text,
+            'script_status': 'received',
+            'script_received_at': now,
+            'updated_at': now
+        }
+
+    def thumbnail_fields(self, gdrive_id: str, gdrive_url: str) -> Dict[str, Any]:
+        """Columns written when a thumbnail is received"""
+        return {
+            'thumbnail_gdrive_id': gdrive_id,
+            'thumbnail_gdrive_url': gdrive_url,
+            'thumbnail_status': 'received',
+            'updated_at': self._now_iso()
+        }
+
+    async def bulk_upsert(
+        self,
+        channel_id: int,
+        upload_date: str,
+        rows: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Create entries and write their content in a single upsert
+
+        Equivalent to create_upload_entry followed by update_script /
+        update_thumbnail for each row, in one round trip
+
+        Args:
+            channel_id: Channel ID
+            upload_date: Date string
+            rows: Dicts with 'video_number' plus the content columns
+                (see script_fields / thumbnail_fields)
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        try:
+            data = [
+                {**self._pending_entry(channel_id, upload_date, row['video_number']), **row}
+                for row in rows
+            ]
+
+            result = self.supabase.table('daily_uploads').upsert(
+                data,
+                on_conflict='channel_id,upload_date,video_number',
+                count='exact',
+                returning='minimal'
+            ).execute()
+
+            logger.info(f"Bulk upserted {len(data)} entries for {channel_id}/{upload_date}")
+            return result.count if result.count is not None else len(data)
+
+        except Exception as e:
+            logger.error(f"Error bulk upserting {len(rows)} entries: {e}")
+            raise
+
     async def update_script(
         self,
         channel_id: int,
         upload_date: str,
         video_number: int,
-        script_text: str
-    ) -> Dict[str, Any]:
-        """Update script for an upload"""
+        script_text: str,
+        upload_id: Optional[int] = None,
+        return_row: bool = False
+    ) -> Union[Dict[str, Any], bool]:
+        """
+        Update script for an upload (by primary key if upload_id given)
+
+        Returns True, or the updated row when return_row is set
+        """
         try:
-            result = self.supabase.table('daily_uploads').update({
-                'script_text': script_text,
-                'script_status': 'received',
-                'script_received_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat()
-            }).eq('channel_id', channel_id).eq(
-                'upload_date', upload_date
-            ).eq('video_number', video_number).execute()
+            row = await self._write(
+                self.script_fields(script_text),
+                upload_id, channel_id, upload_date, video_number, return_row
+            )
 
-            if result.data:
-                logger.info(f"Script updated for {channel_id}/{upload_date}/V{video_number}")
-                return result.data[0]
-            else:
-                raise Exception("Upload entry not found")
+            logger.info(f"Script updated for {channel_id}/{upload_date}/V{video_number}")
+            return row
 
         except Exception as e:
             logger.error(f"Error updating script: {e}")
@@ -410,24 +872,23 @@ class DailyUploadManager:
         upload_date: str,
         video_number: int,
         gdrive_id: str,
-        gdrive_url: str
-    ) -> Dict[str, Any]:
-        """Update thumbnail for an upload"""
+        gdrive_url: str,
+        upload_id: Optional[int] = None,
+        return_row: bool = False
+    ) -> Union[Dict[str, Any], bool]:
+        """
+        Update thumbnail for an upload (by primary key if upload_id given)
+
+        Returns True, or the updated row when return_row is set
+        """
         try:
-            result = self.supabase.table('daily_uploads').update({
-                'thumbnail_gdrive_id': gdrive_id,
-                'thumbnail_gdrive_url': gdrive_url,
-                'thumbnail_status': 'received',
-                'updated_at': datetime.utcnow().isoformat()
-            }).eq('channel_id', channel_id).eq(
-                'upload_date', upload_date
-            ).eq('video_number', video_number).execute()
+            row = await self._write(
+                self.thumbnail_fields(gdrive_id, gdrive_url),
+                upload_id, channel_id, upload_date, video_number, return_row
+            )
 
-            if result.data:
-                logger.info(f"Thumbnail updated for {channel_id}/{upload_date}/V{video_number}")
-                return result.data[0]
-            else:
-                raise Exception("Upload entry not found")
+            logger.info(f"Thumbnail updated for {channel_id}/{upload_date}/V{video_number}")
+            return row
 
         except Exception as e:
             logger.error(f"Error updating thumbnail: {e}")
@@ -441,13 +902,21 @@ class DailyUploadManager:
         status: str,
         video_gdrive_id: Optional[str] = None,
         video_gdrive_url: Optional[str] = None,
-        error_message: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Update video status"""
+        error_message: Optional[str] = None,
+        upload_id: Optional[int] = None,
+        return_row: bool = False
+    ) -> Union[Dict[str, Any], bool]:
+        """
+        Update video status (by primary key if upload_id given)
+
+        Returns True, or the updated row when return_row is set
+        """
         try:
+            now = self._now_iso()
+
             updates = {
                 'video_status': status,
-                'updated_at': datetime.utcnow().isoformat()
+                'updated_at': now
             }
 
             if video_gdrive_id:
@@ -457,21 +926,94 @@ class DailyUploadManager:
             if error_message:
                 updates['error_message'] = error_message
             if status == 'completed':
-                updates['processing_completed_at'] = datetime.utcnow().isoformat()
-
-            result = self.supabase.table('daily_uploads').update(updates).eq(
-                'channel_id', channel_id
-            ).eq('upload_date', upload_date).eq('video_number', video_number).execute()
+                updates['processing_completed_at'] = now
 
-            if result.data:
-                return result.data[0]
-            else:
-                raise Exception("Upload entry not found")
+            return await self._write(
+                updates, upload_id, channel_id, upload_date, video_number, return_row
+            )
 
         except Exception as e:
             logger.error(f"Error updating video status: {e}")
             raise
 
+    async def update_by_id(
+        self,
+        upload_id: int,
+        fields: Dict[str, Any],
+        return_row: bool = False
+    ) -> Union[Dict[str, Any], bool]:
+        """
+        Update an upload entry by primary key
+
+        Args:
+            upload_id: daily_uploads.id (returned by create_upload_entry)
+            fields: Columns to update
+            return_row: Return the updated row instead of True
+
+        Returns:
+            True, or updated entry data when return_row is set
+        """
+        try:
+            return self._update_entry(fields, upload_id, return_row=return_row)
+
+        except Exception as e:
+            logger.error(f"Error updating upload entry {upload_id}: {e}")
+            raise
+
+    async def _write(
+        self,
+        fields: Dict[str, Any],
+        upload_id: Optional[int],
+        channel_id: int,
+        upload_date: str,
+        video_number: int,
+        return_row: bool
+    ) -> Union[Dict[str, Any], bool]:
+        """Apply an update_* write, through the batcher when enabled"""
+        # Batched writes are keyed by primary key; without one, write directly
+        if self._batcher and upload_id is not None:
+            return await self._batcher.submit(upload_id, fields, return_row)
+        return self._update_entry(
+            fields, upload_id, channel_id, upload_date, video_number, return_row
+        )
+
+    def _update_entry(
+        self,
+        fields: Dict[str, Any],
+        upload_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
+        upload_date: Optional[str] = None,
+        video_number: Optional[int] = None,
+        return_row: bool = True
+    ) -> Union[Dict[str, Any], bool]:
+        """
+        Update one daily_uploads row, by primary key when known,
+        otherwise by the (channel_id, upload_date, video_number) key.
+        Without return_row the row is not sent back (return=minimal)
+        and only the affected count is checked.
+        """
+        if return_row:
+            query = self.supabase.table('daily_uploads').update(fields)
+        else:
+            query = self.supabase.table('daily_uploads').update(
+                fields, count='exact', returning='minimal'
+            )
+
+        if upload_id is not None:
+            query = query.eq('id', upload_id)
+        else:
+            query = query.eq('channel_id', channel_id).eq(
+                'upload_date', upload_date
+            ).eq('video_number', video_number)
+
+        result = query.execute()
+
+        if not return_row and result.count:
+            return True
+        if return_row and result.data:
+            return result.data[0]
+        raise Exception("Upload entry not found")
+
     async def get_upload_entry(
         self,
         channel_id: int,
@@ -482,11 +1024,12 @@ class DailyUploadManager:
         try:
             result = self.supabase.table('daily_uploads').select('*').eq(
                 'channel_id', channel_id
-            ).eq('upload_date', upload_date).eq('video_number', video_number).execute()
+            ).eq('upload_date', upload_date).eq(
+                'video_number', video_number
+            ).limit(1).maybe_single().execute()
 
-            if result.data:
-                return result.data[0]
-            return None
+            # maybe_single() returns None when no row matches
+            return result.data if result else None
 
         except Exception as e:
             logger.error(f"Error getting upload entry: {e}")
@@ -495,11 +1038,39 @@ class DailyUploadManager:
     async def get_date_uploads(self, upload_date: str) -> List[Dict[str, Any]]:
         """Get all uploads for a specific date"""
         try:
-            result = self.supabase.table('daily_uploads').select(
-                '*, channels(channel_name, channel_display_name)'
-            ).eq('upload_date', upload_date).order('channel_id').order('video_number').execute()
+            # Channel names come from the cached channel list instead of
+            # being embedded (and repeated) in every upload row
+            query = self.supabase.table('daily_uploads').select('*').eq(
+                'upload_date', upload_date
+            ).order('channel_id').order('video_number')
 
-            return result.data if result.data else []
+            result, channels = await asyncio.gather(
+                asyncio.to_thread(query.execute),
+                self.channel_mgr.list_channels(active_only=False)
+            )
+
+            uploads = result.data if result.data else []
+
+            channel_info = {
+                ch['id']: {
+                    'channel_name': ch['channel_name'],
+                    'channel_display_name': ch.get('channel_display_name')
+                }
+                for ch in channels
+            }
+
+            # List failed (returns []) or predates a new channel: fall back to the embed
+            if any(upload['channel_id'] not in channel_info for upload in uploads):
+                query = self.supabase.table('daily_uploads').select(
+                    '*, channels(channel_name, channel_display_name)'
+                ).eq('upload_date', upload_date).order('channel_id').order('video_number')
+                result = await asyncio.to_thread(query.execute)
+                return result.data if result.data else []
+
+            for upload in uploads:
+                upload['channels'] = channel_info[upload['channel_id']]
+
+            return uploads
 
         except Exception as e:
             logger.error(f"Error getting date uploads: {e}")
@@ -508,11 +1079,18 @@ class DailyUploadManager:
     async def get_incomplete_items(self, upload_date: str) -> List[Dict[str, Any]]:
         """Get incomplete items for a date"""
         try:
-            result = self.supabase.table('daily_uploads').select(
-                '*, channels(channel_name)'
-            ).eq('upload_date', upload_date).or_(
-                'script_status.eq.pending,thumbnail_status.eq.pending,video_status.neq.completed'
-            ).execute()
+            # View encodes the filter so the partial index can be used
+            try:
+                result = self.supabase.table('daily_uploads_incomplete').select(
+                    '*, channels(channel_name)'
+                ).eq('upload_date', upload_date).execute()
+            except Exception as e:
+                logger.warning(f"daily_uploads_incomplete view unavailable, using fallback: {e}")
+                result = self.supabase.table('daily_uploads').select(
+                    '*, channels(channel_name)'
+                ).eq('upload_date', upload_date).or_(
+                    'script_status.eq.pending,thumbnail_status.eq.pending,video_status.neq.completed'
+                ).execute()
 
             return result.data if result.data else []
 
@@ -3,26 +3,72 @@ Google Drive 7-Day Folder Management System
 Auto-creates and maintains date/channel/video folder structure
 """
 
+import asyncio
+import base64
+import functools
+import json
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import date, timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import date, datetime, timedelta, timezone
+import google_auth_httplib2
+import httplib2
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaInMemoryUpload
 import os
 import pickle
 from supabase_client import SupabaseClient
 
 logger = logging.getLogger(__name__)
 
+FOLDER_MIME = 'application/vnd.google-apps.folder'
+
+# Query clause shared by every folder lookup
+_Q_FOLDER = f"mimeType='{FOLDER_MIME}' and trashed=false"
+
+# Drive batch requests accept at most 100 calls
+DRIVE_BATCH_LIMIT = 100
+
+# On-disk HTTP cache so unchanged metadata revalidates via ETag
+GDRIVE_HTTP_CACHE_DIR = '.gdrive_httpcache'
+
+# Concurrent Drive calls, kept under the per-user write rate limit
+DRIVE_CONCURRENCY = 10
+
+# Long-lived Drive workers: each keeps its AuthorizedHttp (and its open
+# TLS connection) across calls, so uploads don't re-handshake
+_DRIVE_EXECUTOR = ThreadPoolExecutor(max_workers=DRIVE_CONCURRENCY, thread_name_prefix='gdrive')
+
+# Files smaller than this go up in a single multipart request
+RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
+# Seconds a video folder ID stays cached (IDs never change once created)
+FOLDER_ID_CACHE_TTL = 3600
+
 
 class GDriveFolderManager:
     """Manages Google Drive folder structure for 7-day planning"""
 
+    # token source -> (creds, service, per-thread http), shared by all instances
+    _service_cache: Dict[str, Tuple[Credentials, Any, threading.local]] = {}
+
     def __init__(self, supabase_client: SupabaseClient, token_path: str = "token.pickle"):
         self.supabase = supabase_client.supabase
         self.token_path = token_path
         self.service = None
+        self.creds = None
+        self._thread_local = threading.local()
+        self._drive_sem = asyncio.Semaphore(DRIVE_CONCURRENCY)
+        self._base_folder_id_cache: Optional[str] = None
+        # (date, channel, video_number) -> (expires_at, folder_id)
+        self._folder_id_cache: Dict[Tuple[str, str, int], Tuple[float, str]] = {}
+        # (date, channel) -> (expires_at, web view link)
+        self._folder_link_cache: Dict[Tuple[str, Optional[str]], Tuple[float, str]] = {}
+        # folder ID -> webViewLink, as returned by Drive list/create calls
+        self._web_links: Dict[str, str] = {}
         self._initialize_service()
 
     def _initialize_service(self):
@@ -31,24 +77,92 @@ class GDriveFolderManager:
             # Try to load from base64 environment variable first
             token_base64 = os.getenv('GDRIVE_TOKEN_BASE64')
             if token_base64:
-                import base64
-                token_data = base64.b64decode(token_base64)
-                creds = pickle.loads(token_data)
-                self.service = build('drive', 'v3', credentials=creds)
-                logger.info("✅ Google Drive service initialized from ENV")
+                source = 'ENV'
+            elif os.path.exists(self.token_path):
+                source = self.token_path
+            else:
+                logger.warning(f"⚠️ Token not found - Google Drive features disabled")
                 return
 
-            # Fallback to file
-            if os.path.exists(self.token_path):
-                with open(self.token_path, 'rb') as token:
-                    creds = pickle.load(token)
-                    self.service = build('drive', 'v3', credentials=creds)
-                    logger.info("✅ Google Drive service initialized from file")
+            # Reuse the service (and its connections) built by another instance
+            cached = self._service_cache.get(source)
+            if cached:
+                self.creds, self.service, self._thread_local = cached
+                return
+
+            if token_base64:
+                token_data = base64.b64decode(token_base64)
             else:
-                logger.warning(f"⚠️ Token not found - Google Drive features disabled")
+                with open(self.token_path, 'rb') as token:
+                    token_data = token.read()
+
+            self.creds = self._load_credentials(token_data)
+            if self.creds.expired and self.creds.refresh_token:
+                self.creds.refresh(google_auth_httplib2.Request(httplib2.Http()))
+
+            self.service = self._build_service()
+            self._service_cache[source] = (self.creds, self.service, self._thread_local)
+            logger.info(f"✅ Google Drive service initialized from {'ENV' if token_base64 else 'file'}")
         except Exception as e:
             logger.error(f"Error initializing Drive service: {e}")
 
+    @staticmethod
+    def _load_credentials(token_data: bytes) -> Credentials:
+        """
+        Parse an authorized-user JSON token, falling back to the legacy
+        pickle format
+
+        Args:
+            token_data: Raw token contents
+
+        Returns:
+            OAuth credentials
+        """
+        try:
+            info = json.loads(token_data)
+        except ValueError:
+            logger.warning("⚠️ Pickled Drive token is deprecated - store it as authorized-user JSON (creds.to_json())")
+            return pickle.loads(token_data)
+
+        return Credentials.from_authorized_user_info(info)
+
+    def _build_service(self):
+        """Build the Drive client from the discovery doc bundled with googleapiclient"""
+        return build(
+            'drive', 'v3',
+            http=self._http(),
+            cache_discovery=False,
+            static_discovery=True
+        )
+
+    def _http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """
+        Authorized HTTP client for the current thread
+
+        httplib2.Http is not thread-safe, so each Drive worker thread keeps
+        its own connection and reuses it for every later call
+        """
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.creds,
+                http=httplib2.Http(cache=httplib2.FileCache(GDRIVE_HTTP_CACHE_DIR), timeout=30)
+            )
+            self._thread_local.http = http
+        return http
+
+    async def _run_drive(self, func, *args):
+        """Run a blocking Drive call on a Drive worker, bounded by DRIVE_CONCURRENCY"""
+        async with self._drive_sem:
+            return await asyncio.get_running_loop().run_in_executor(
+                _DRIVE_EXECUTOR, functools.partial(func, *args)
+            )
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        """Escape a value for use inside a quoted Drive query string"""
+        return value.replace("\\", "\\\\").replace("'", "\\'")
+
     def _create_folder(
         self,
         folder_name: str,
@@ -71,7 +185,7 @@ class GDriveFolderManager:
 
             file_metadata = {
                 'name': folder_name,
-                'mimeType': 'application/vnd.google-apps.folder'
+                'mimeType': FOLDER_MIME
             }
 
             if parent_id:
@@ -80,9 +194,10 @@ class GDriveFolderManager:
             folder = self.service.files().create(
                 body=file_metadata,
                 fields='id, name, webViewLink'
-            ).execute()
+            ).execute(http=self._http())
 
             folder_id = folder.get('id')
+            self._web_links[folder_id] = folder.get('webViewLink')
             logger.info(f"Created folder: {folder_name} (ID: {folder_id})")
 
             return folder_id
@@ -106,20 +221,21 @@ class GDriveFolderManager:
             if not self.service:
                 return None
 
-            query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
-
+            parts = [f"name='{self._escape(folder_name)}'", _Q_FOLDER]
             if parent_id:
-                query += f" and '{parent_id}' in parents"
+                parts.append(f"'{parent_id}' in parents")
+            query = ' and '.join(parts)
 
             results = self.service.files().list(
                 q=query,
                 spaces='drive',
-                fields='files(id, name)'
-            ).execute()
+                fields='files(id, name, webViewLink)'
+            ).execute(http=self._http())
 
             files = results.get('files', [])
 
             if files:
+                self._web_links[files[0]['id']] = files[0].get('webViewLink')
                 return files[0]['id']
             return None
 
@@ -138,6 +254,118 @@ class GDriveFolderManager:
             return folder_id
         return self._create_folder(folder_name, parent_id)
 
+    def _list_children(self, parent_ids: List[str]) -> Dict[Tuple[str, str], str]:
+        """
+        List every subfolder of the given parents using one (paginated)
+        list query, up to 1000 children per page
+
+        Args:
+            parent_ids: Parent folder IDs
+
+        Returns:
+            Dict of (parent_id, name) -> folder ID
+        """
+        found = {}
+        if not self.service or not parent_ids:
+            return found
+
+        parent_clause = " or ".join(f"'{pid}' in parents" for pid in parent_ids)
+        query = f"({parent_clause}) and {_Q_FOLDER}"
+
+        parents = set(parent_ids)
+        page_token = None
+
+        while True:
+            results = self.service.files().list(
+                q=query,
+                spaces='drive',
+                fields='nextPageToken, files(id, name, parents, webViewLink)',
+                pageSize=1000,
+                pageToken=page_token
+            ).execute(http=self._http())
+
+            for f in results.get('files', []):
+                for pid in f.get('parents', []):
+                    if pid in parents:
+                        # Keep the first match, like _folder_exists
+                        found.setdefault((pid, f['name']), f['id'])
+                self._web_links[f['id']] = f.get('webViewLink')
+
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                return found
+
+    def _batch_create_folders(self, folders: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+        """
+        Create folders through Drive batch requests (100 per HTTP call)
+
+        Args:
+            folders: List of (parent_id, name)
+
+        Returns:
+            Dict of (parent_id, name) -> folder ID for created folders
+        """
+        created = {}
+        if not self.service or not folders:
+            return created
+
+        def callback(request_id, response, exception):
+            parent_id, name = folders[int(request_id)]
+            if exception:
+                logger.error(f"Error creating folder {name}: {exception}")
+                return
+            created[(parent_id, name)] = response['id']
+            self._web_links[response['id']] = response.get('webViewLink')
+            logger.info(f"Created folder: {name} (ID: {response['id']})")
+
+        for start in range(0, len(folders), DRIVE_BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=callback)
+
+            for i in range(start, min(start + DRIVE_BATCH_LIMIT, len(folders))):
+                parent_id, name = folders[i]
+                batch.add(
+                    self.service.files().create(
+                        body={
+                            'name': name,
+                            'mimeType': FOLDER_MIME,
+                            'parents': [parent_id]
+                        },
+                        fields='id, name, webViewLink'
+                    ),
+                    request_id=str(i)
+                )
+
+            batch.execute(http=self._http())
+
+        return created
+
+    def _get_or_create_folders(self, folders: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+        """
+        Bulk version of _get_or_create_folder: one list call prefetches the
+        children of all parents, then only the missing ones are created
+        (batched)
+
+        Args:
+            folders: List of (parent_id, name)
+
+        Returns:
+            Dict of (parent_id, name) -> folder ID
+        """
+        try:
+            parent_ids = list(dict.fromkeys(pid for pid, _ in folders))
+            children = self._list_children(parent_ids)
+
+            folder_ids = {f: children[f] for f in folders if f in children}
+
+            missing = [f for f in folders if f not in folder_ids]
+            folder_ids.update(self._batch_create_folders(missing))
+
+            return folder_ids
+
+        except Exception as e:
+            logger.error(f"Error creating folders: {e}")
+            return {}
+
     async def get_base_folder_id(self) -> Optional[str]:
         """
         Get base folder ID from system_config
@@ -145,13 +373,18 @@ class GDriveFolderManager:
         Returns:
             Base folder ID or None
         """
+        # Only changes through set_base_folder_id, so serve it from memory
+        if self._base_folder_id_cache is not None:
+            return self._base_folder_id_cache
+
         try:
             result = self.supabase.table('system_config').select(
                 'gdrive_base_folder_id'
             ).eq('id', 1).execute()
 
             if result.data and result.data[0].get('gdrive_base_folder_id'):
-                return result.data[0]['gdrive_base_folder_id']
+                self._base_folder_id_cache = result.data[0]['gdrive_base_folder_id']
+                return self._base_folder_id_cache
 
             logger.warning("Base folder ID not set in system_config")
             return None
@@ -175,6 +408,7 @@ class GDriveFolderManager:
                 'gdrive_base_folder_id': folder_id
             }).eq('id', 1).execute()
 
+            self._base_folder_id_cache = folder_id
             logger.info(f"Set base folder ID: {folder_id}")
             return True
 
@@ -185,7 +419,8 @@ class GDriveFolderManager:
     async def create_date_structure(
         self,
         target_date: str,
-        channel_names: List[str]
+        channel_names: List[str],
+        existing: Optional[Dict[Tuple[Optional[str], Optional[int]], str]] = None
     ) -> Dict[str, Any]:
         """
         Create complete folder structure for a date
@@ -204,25 +439,45 @@ class GDriveFolderManager:
         Args:
             target_date: Date string (YYYY-MM-DD)
             channel_names: List of channel names
+            existing: Folders already recorded for this date, as
+                (channel_name, video_number) -> folder ID (see
+                _get_recorded_folders). These skip Drive entirely.
 
         Returns:
             Dict with created folder IDs
         """
         try:
+            existing = existing or {}
+            recorded = set(existing.values())
+
             base_folder_id = await self.get_base_folder_id()
             if not base_folder_id:
                 logger.error("Base folder not configured")
                 return {}
 
             # Create date folder
-            date_folder_id = self._get_or_create_folder(target_date, base_folder_id)
+            # Drive calls are blocking; run them in a worker thread so
+            # several dates can be processed concurrently
+            date_folder_id = existing.get((None, None)) or await self._run_drive(
+                self._get_or_create_folder, target_date, base_folder_id
+            )
             if not date_folder_id:
                 logger.error(f"Failed to create date folder: {target_date}")
                 return {}
 
-            # Store in database
-            await self._store_folder_info(
-                folder_date=target_date,
+            # Rows are collected and written in one upsert at the end;
+            # folders that are already recorded are not written again
+            rows = []
+
+            def add_row(**fields):
+                if fields['folder_id'] not in recorded:
+                    rows.append(self._folder_row(
+                        folder_date=target_date,
+                        web_view_link=self._web_links.get(fields['folder_id']),
+                        **fields
+                    ))
+
+            add_row(
                 folder_path=f"Videos/{target_date}",
                 folder_id=date_folder_id,
                 parent_folder_id=base_folder_id
@@ -233,41 +488,66 @@ class GDriveFolderManager:
                 'channels': {}
             }
 
-            # Create channel folders
-            for channel_name in channel_names:
-                channel_folder_id = self._get_or_create_folder(
-                    channel_name,
-                    date_folder_id
+            # Channel layer: one list + one batch for the unrecorded channels
+            channel_folder_ids = {
+                (date_folder_id, name): existing[(name, None)]
+                for name in channel_names
+                if (name, None) in existing
+            }
+            missing = [
+                (date_folder_id, name)
+                for name in channel_names
+                if (date_folder_id, name) not in channel_folder_ids
+            ]
+            if missing:
+                channel_folder_ids.update(
+                    await self._run_drive(self._get_or_create_folders, missing)
+                )
+
+            # Video layer: one list + one batch across all channel folders
+            video_folder_ids = {}
+            missing = []
+            for name in channel_names:
+                channel_folder_id = channel_folder_ids.get((date_folder_id, name))
+                if not channel_folder_id:
+                    continue
+                for video_num in range(1, 5):
+                    key = (channel_folder_id, f"Video_{video_num}")
+                    if (name, video_num) in existing:
+                        video_folder_ids[key] = existing[(name, video_num)]
+                    else:
+                        missing.append(key)
+            if missing:
+                video_folder_ids.update(
+                    await self._run_drive(self._get_or_create_folders, missing)
                 )
 
+            for channel_name in channel_names:
+                channel_folder_id = channel_folder_ids.get((date_folder_id, channel_name))
+
                 if not channel_folder_id:
                     logger.warning(f"Failed to create channel folder: {channel_name}")
                     continue
 
                 # Store channel folder
-                await self._store_folder_info(
-                    folder_date=target_date,
+                add_row(
                     folder_path=f"Videos/{target_date}/{channel_name}",
                     folder_id=channel_folder_id,
                     parent_folder_id=date_folder_id,
                     channel_name=channel_name
                 )
 
-                # Create video folders (1-4)
+                # Video folders (1-4)
                 video_folders = {}
                 for video_num in range(1, 5):
                     video_folder_name = f"Video_{video_num}"
-                    video_folder_id = self._get_or_create_folder(
-                        video_folder_name,
-                        channel_folder_id
-                    )
+                    video_folder_id = video_folder_ids.get((channel_folder_id, video_folder_name))
 
                     if video_folder_id:
                         video_folders[video_num] = video_folder_id
 
                         # Store video folder
-                        await self._store_folder_info(
-                            folder_date=target_date,
+                        add_row(
                             folder_path=f"Videos/{target_date}/{channel_name}/{video_folder_name}",
                             folder_id=video_folder_id,
                             parent_folder_id=channel_folder_id,
@@ -280,6 +560,8 @@ class GDriveFolderManager:
                     'video_folders': video_folders
                 }
 
+            await self._store_folder_rows(rows)
+
             logger.info(f"Created complete structure for {target_date}")
             return created_folders
 
@@ -287,31 +569,72 @@ class GDriveFolderManager:
             logger.error(f"Error creating date structure: {e}")
             return {}
 
-    async def _store_folder_info(
+    async def _get_recorded_folders(
         self,
+        dates: List[str]
+    ) -> Dict[str, Dict[Tuple[Optional[str], Optional[int]], str]]:
+        """
+        Fetch the active folders already recorded for the given dates in
+        one query
+
+        Args:
+            dates: Date strings (YYYY-MM-DD)
+
+        Returns:
+            Dict of date -> {(channel_name, video_number): folder ID}
+        """
+        recorded = {d: {} for d in dates}
+
+        try:
+            query = self.supabase.table('gdrive_folders').select(
+                'folder_date, channel_name, video_number, folder_id'
+            ).in_('folder_date', dates).eq('is_active', True)
+            result = await asyncio.to_thread(query.execute)
+
+            for row in result.data or []:
+                key = (row['channel_name'], row['video_number'])
+                recorded[row['folder_date']][key] = row['folder_id']
+
+        except Exception as e:
+            # Not fatal - every folder just goes through Drive
+            logger.error(f"Error fetching recorded folders: {e}")
+
+        return recorded
+
+    @staticmethod
+    def _folder_row(
         folder_date: str,
         folder_path: str,
         folder_id: str,
         parent_folder_id: Optional[str] = None,
         channel_name: Optional[str] = None,
-        video_number: Optional[int] = None
-    ) -> bool:
-        """Store folder info in database"""
-        try:
-            data = {
-                'folder_date': folder_date,
-                'folder_path': folder_path,
-                'folder_id': folder_id,
-                'parent_folder_id': parent_folder_id,
-                'channel_name': channel_name,
-                'video_number': video_number,
-                'is_active': True
-            }
+        video_number: Optional[int] = None,
+        web_view_link: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build a gdrive_folders row"""
+        return {
+            'folder_date': folder_date,
+            'folder_path': folder_path,
+            'folder_id': folder_id,
+            'parent_folder_id': parent_folder_id,
+            'channel_name': channel_name,
+            'video_number': video_number,
+            'web_view_link': web_view_link,
+            'is_active': True
+        }
+
+    async def _store_folder_rows(self, rows: List[Dict[str, Any]]) -> bool:
+        """Store many folder rows in one upsert"""
+        if not rows:
+            return True
 
-            self.supabase.table('gdrive_folders').upsert(
-                data,
-                on_conflict='folder_id'
-            ).execute()
+        try:
+            query = self.supabase.table('gdrive_folders').upsert(
+                rows,
+                on_conflict='folder_id',
+                returning='minimal'
+            )
+            await asyncio.to_thread(query.execute)
 
             return True
 
@@ -319,6 +642,27 @@ class GDriveFolderManager:
             logger.error(f"Error storing folder info: {e}")
             return False
 
+    async def _store_folder_info(
+        self,
+        folder_date: str,
+        folder_path: str,
+        folder_id: str,
+        parent_folder_id: Optional[str] = None,
+        channel_name: Optional[str] = None,
+        video_number: Optional[int] = None,
+        web_view_link: Optional[str] = None
+    ) -> bool:
+        """Store folder info in database"""
+        return await self._store_folder_rows([self._folder_row(
+            folder_date=folder_date,
+            folder_path=folder_path,
+            folder_id=folder_id,
+            parent_folder_id=parent_folder_id,
+            channel_name=channel_name,
+            video_number=video_number,
+            web_view_link=web_view_link
+        )])
+
     async def get_video_folder_id(
         self,
         target_date: str,
@@ -336,15 +680,22 @@ class GDriveFolderManager:
         Returns:
             Folder ID or None
         """
+        key = (target_date, channel_name, video_number)
+        entry = self._folder_id_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
         try:
             result = self.supabase.table('gdrive_folders').select('folder_id').eq(
                 'folder_date', target_date
             ).eq('channel_name', channel_name).eq(
                 'video_number', video_number
-            ).eq('is_active', True).execute()
+            ).eq('is_active', True).limit(1).maybe_single().execute()
 
-            if result.data:
-                return result.data[0]['folder_id']
+            if result and result.data:
+                folder_id = result.data['folder_id']
+                self._folder_id_cache[key] = (time.monotonic() + FOLDER_ID_CACHE_TTL, folder_id)
+                return folder_id
             return None
 
         except Exception as e:
@@ -361,13 +712,19 @@ class GDriveFolderManager:
         Returns:
             Number of dates processed
         """
-        count = 0
-        for i in range(7):
-            target_date = (date.today() + timedelta(days=i)).isoformat()
-            result = await self.create_date_structure(target_date, channel_names)
+        dates = [(date.today() + timedelta(days=i)).isoformat() for i in range(7)]
 
-            if result:
-                count += 1
+        # On a re-run most folders are already recorded; only the rest
+        # need Drive calls
+        recorded = await self._get_recorded_folders(dates)
+
+        # Dates are independent - build them concurrently
+        results = await asyncio.gather(
+            *[self.create_date_structure(d, channel_names, recorded[d]) for d in dates],
+            return_exceptions=True
+        )
+
+        count = sum(1 for r in results if r and not isinstance(r, Exception))
 
         logger.info(f"Created 7-day structure: {count} dates")
         return count
@@ -398,20 +755,45 @@ class GDriveFolderManager:
                 logger.error(f"File not found: {file_path}")
                 return None
 
+            # Resumable sessions cost an extra round trip; only worth it
+            # for large media
+            resumable = os.path.getsize(file_path) >= RESUMABLE_UPLOAD_THRESHOLD
+            media = MediaFileUpload(file_path, resumable=resumable)
+
+            return self._upload_media(
+                media,
+                folder_id,
+                file_name or os.path.basename(file_path)
+            )
+
+        except Exception as e:
+            logger.error(f"Error uploading file: {e}")
+            return None
+
+    def _upload_media(
+        self,
+        media,
+        folder_id: str,
+        file_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Create a file in the folder from a prepared media body"""
+        try:
+            if not self.service:
+                logger.error("Drive service not initialized")
+                return None
+
             file_metadata = {
-                'name': file_name or os.path.basename(file_path),
+                'name': file_name,
                 'parents': [folder_id]
             }
 
-            media = MediaFileUpload(file_path, resumable=True)
-
             file = self.service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id, name, webViewLink, webContentLink'
-            ).execute()
+            ).execute(http=self._http())
 
-            logger.info(f"Uploaded file: {file_metadata['name']} to folder {folder_id}")
+            logger.info(f"Uploaded file: {file_name} to folder {folder_id}")
 
             return {
                 'file_id': file.get('id'),
@@ -455,22 +837,19 @@ class GDriveFolderManager:
                 logger.error(f"Video folder not found: {target_date}/{channel_name}/V{video_number}")
                 return None
 
-            # Create temp file
-            temp_file = f"temp_script_{channel_name}_V{video_number}.txt"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                f.write(script_text)
-
-            # Upload
-            result = self.upload_file_to_folder(
-                temp_file,
+            # Upload straight from memory (blocking client call, keep it
+            # off the event loop)
+            media = MediaInMemoryUpload(
+                script_text.encode('utf-8'),
+                mimetype='text/plain'
+            )
+            result = await self._run_drive(
+                self._upload_media,
+                media,
                 folder_id,
                 'script.txt'
             )
 
-            # Cleanup
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-
             if result:
                 return result['file_id']
             return None
@@ -513,7 +892,8 @@ class GDriveFolderManager:
             _, ext = os.path.splitext(thumbnail_path)
             file_name = f"thumbnail{ext}"
 
-            result = self.upload_file_to_folder(
+            result = await self._run_drive(
+                self.upload_file_to_folder,
                 thumbnail_path,
                 folder_id,
                 file_name
@@ -545,33 +925,39 @@ class GDriveFolderManager:
         Returns:
             Web view link or None
         """
+        key = (target_date, channel_name)
+        entry = self._folder_link_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
         try:
-            query = self.supabase.table('gdrive_folders').select('folder_id').eq(
-                'folder_date', target_date
-            ).eq('is_active', True)
+            query = self.supabase.table('gdrive_folders').select(
+                'folder_id, web_view_link'
+            ).eq('folder_date', target_date).eq('is_active', True)
 
             if channel_name:
                 query = query.eq('channel_name', channel_name).is_('video_number', 'null')
             else:
                 query = query.is_('channel_name', 'null')
 
-            result = query.execute()
+            result = query.limit(1).maybe_single().execute()
 
-            if not result.data:
+            if not result or not result.data:
                 return None
 
-            folder_id = result.data[0]['folder_id']
+            link = result.data.get('web_view_link')
 
-            # Get link from Drive API
-            if self.service:
+            # Rows stored before web_view_link existed: ask Drive
+            if not link and self.service:
                 file = self.service.files().get(
-                    fileId=folder_id,
+                    fileId=result.data['folder_id'],
                     fields='webViewLink'
-                ).execute()
+                ).execute(http=self._http())
+                link = file.get('webViewLink')
 
-                return file.get('webViewLink')
-
-            return None
+            if link:
+                self._folder_link_cache[key] = (time.monotonic() + FOLDER_ID_CACHE_TTL, link)
+            return link
 
         except Exception as e:
             logger.error(f"Error getting folder link: {e}")
@@ -581,6 +967,9 @@ class GDriveFolderManager:
         """
         Archive folders older than specified days
 
+        Runs nightly via pg_cron (archive-old-gdrive-folders job); call this
+        for on-demand archival.
+
         Args:
             days_old: Days old threshold
 
@@ -588,16 +977,31 @@ class GDriveFolderManager:
             Number of folders archived
         """
         try:
-            cutoff_date = (date.today() - timedelta(days=days_old)).isoformat()
-
-            result = self.supabase.table('gdrive_folders').update({
-                'is_active': False,
-                'archived_at': datetime.utcnow().isoformat()
-            }).lt('folder_date', cutoff_date).eq('is_active', True).execute()
+            # Cutoff and UPDATE run in the database; only the count comes back
+            try:
+                result = self.supabase.rpc(
+                    'archive_old_folders',
+                    {'p_days_old': days_old}
+                ).execute()
+                count = result.data or 0
+            except Exception as e:
+                logger.warning(f"archive_old_folders RPC unavailable, using fallback: {e}")
+                cutoff_date = (date.today() - timedelta(days=days_old)).isoformat()
+
+                result = self.supabase.table('gdrive_folders').update({
+                    'is_active': False,
+                    'archived_at': datetime.now(timezone.utc).isoformat()
+                }, count='exact', returning='minimal').lt(
+                    'folder_date', cutoff_date
+                ).eq('is_active', True).execute()
+                count = result.count or 0
 
-            count = len(result.data) if result.data else 0
             logger.info(f"Archived {count} old folders")
 
+            # Archived folders must no longer resolve
+            self._folder_id_cache.clear()
+            self._folder_link_cache.clear()
+
             return count
 
         except Exception as e:
@@ -3,27 +3,108 @@ Inline Button Selection System for Multi-Date Channel Assignment
 Handles 3-step selection: Date → Channel → Video Number
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import date, timedelta, datetime
+import time
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import date, timedelta
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
-from telegram.ext import CallbackContext
+from telegram.ext import CallbackContext, filters
 from channel_manager import ChannelManager, DailyUploadManager
 from supabase_client import SupabaseClient
 
 logger = logging.getLogger(__name__)
 
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+def _fmt_ddmon(iso: str) -> str:
+    """Format a YYYY-MM-DD string as DD-Mon without parsing it"""
+    return f"{iso[8:10]}-{_MONTHS[int(iso[5:7]) - 1]}"
+
+
+# Text longer than this is treated as a script
+_SCRIPT_MIN_LEN = 50
+
+# Abandoned selections are dropped after this many seconds
+SELECTION_TTL = 300
+
+# Selections saved to Supabase at the same time; bursts of button
+# presses queue here instead of piling onto the database
+DB_CONCURRENCY = 32
+
+# Channel keyboard is reused for this many seconds
+CHANNEL_BUTTONS_TTL = 30
+
+# Shared navigation buttons (immutable, safe to reuse in every keyboard)
+_CANCEL_BTN = InlineKeyboardButton("❌ Cancel", callback_data="cancel")
+_BACK_TO_DATE_BTN = InlineKeyboardButton("⬅️ Back", callback_data="back_to_date")
+_BACK_TO_CHANNEL_BTN = InlineKeyboardButton("⬅️ Back", callback_data="back_to_channel")
+
+# Video number keyboard is static - built once at import
+_VIDEO_NUMBER_KB = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("Video 1", callback_data="video:1"),
+        InlineKeyboardButton("Video 2", callback_data="video:2")
+    ],
+    [
+        InlineKeyboardButton("Video 3", callback_data="video:3"),
+        InlineKeyboardButton("Video 4", callback_data="video:4")
+    ],
+    [_BACK_TO_CHANNEL_BTN, _CANCEL_BTN]
+])
+
 
 class InlineSelectionHandler:
     """Handles inline button selection workflow"""
 
-    def __init__(self, supabase_client: SupabaseClient):
+    def __init__(
+        self,
+        supabase_client: SupabaseClient,
+        channel_mgr: Optional[ChannelManager] = None,
+        upload_mgr: Optional[DailyUploadManager] = None
+    ):
         self.supabase_client = supabase_client
-        self.channel_mgr = ChannelManager(supabase_client)
-        self.upload_mgr = DailyUploadManager(supabase_client)
 
-        # Store pending selections in user_data
-        # Format: {user_id: {content_type, content_data, step, selections}}
+        # Pass the bot's managers so channel caches are shared and invalidated together
+        self.channel_mgr = channel_mgr or ChannelManager(supabase_client)
+        self.upload_mgr = upload_mgr or DailyUploadManager(
+            supabase_client, channel_mgr=self.channel_mgr
+        )
+
+        # Pending selection lives in the user's own user_data
+        # Format: user_data['selection'] = {content_type, content_data, step, ...}
+
+        # Date keyboard only changes when the day rolls over
+        self._date_kb_cache: Optional[Tuple[date, InlineKeyboardMarkup]] = None
+        # (today, target date) -> button label
+        self._label_cache: Dict[Tuple[date, date], str] = {}
+        # (expires_at, keyboard); the lock collapses concurrent misses
+        self._channel_kb_cache: Optional[Tuple[float, InlineKeyboardMarkup]] = None
+        self._channel_kb_lock = asyncio.Lock()
+        self._channel_btn_cache: Dict[str, InlineKeyboardButton] = {}
+        self._db_sem = asyncio.Semaphore(DB_CONCURRENCY)
+        # Strong refs so pending answer() tasks aren't garbage collected
+        self._bg_tasks: set = set()
+
+        # Callback data prefix -> handler
+        self._dispatch = {
+            'cancel': self._on_cancel,
+            'back_to_date': self._on_back_to_date,
+            'back_to_channel': self._on_back_to_channel,
+            'date': self._on_date,
+            'channel': self._on_channel,
+            'video': self._on_video
+        }
+        self._bulk_dispatch = {
+            'date': self._on_bulk_date,
+            'channel': self._on_bulk_channel
+        }
+
+    def invalidate_channel_buttons(self):
+        """Drop the cached channel keyboard (call after channel changes)"""
+        self._channel_kb_cache = None
 
     def get_date_buttons(self) -> InlineKeyboardMarkup:
         """
@@ -33,30 +114,46 @@ class InlineSelectionHandler:
             InlineKeyboardMarkup with date buttons
         """
         today = date.today()
+        if self._date_kb_cache and self._date_kb_cache[0] == today:
+            return self._date_kb_cache[1]
+
         buttons = []
 
+        # Drop labels from previous days
+        for key in [k for k in self._label_cache if k[0] != today]:
+            del self._label_cache[key]
+
         for i in range(7):
             target_date = today + timedelta(days=i)
             date_str = target_date.isoformat()
 
-            # Format display
-            if i == 0:
-                label = f"Today ({target_date.strftime('%d-%b')})"
-            elif i == 1:
-                label = f"Tomorrow ({target_date.strftime('%d-%b')})"
-            else:
-                label = target_date.strftime("%d-%b (%a)")
-
             button = InlineKeyboardButton(
-                label,
+                self._date_label(today, target_date),
                 callback_data=f"date:{date_str}"
             )
             buttons.append([button])
 
         # Add cancel button
-        buttons.append([InlineKeyboardButton("❌ Cancel", callback_data="cancel")])
-
-        return InlineKeyboardMarkup(buttons)
+        buttons.append([_CANCEL_BTN])
+
+        keyboard = InlineKeyboardMarkup(buttons)
+        self._date_kb_cache = (today, keyboard)
+        return keyboard
+
+    def _date_label(self, today: date, target_date: date) -> str:
+        """Button label for a date, computed once per day"""
+        key = (today, target_date)
+        label = self._label_cache.get(key)
+        if label is None:
+            days = (target_date - today).days
+            if days == 0:
+                label = f"Today ({target_date.strftime('%d-%b')})"
+            elif days == 1:
+                label = f"Tomorrow ({target_date.strftime('%d-%b')})"
+            else:
+                label = target_date.strftime("%d-%b (%a)")
+            self._label_cache[key] = label
+        return label
 
     async def get_channel_buttons(self) -> InlineKeyboardMarkup:
         """
@@ -65,32 +162,45 @@ class InlineSelectionHandler:
         Returns:
             InlineKeyboardMarkup with channel buttons
         """
+        cached = self._channel_kb_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        async with self._channel_kb_lock:
+            # Another caller may have rebuilt it while we waited
+            cached = self._channel_kb_cache
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+            keyboard = await self._build_channel_buttons()
+            self._channel_kb_cache = (time.monotonic() + CHANNEL_BUTTONS_TTL, keyboard)
+            return keyboard
+
+    async def _build_channel_buttons(self) -> InlineKeyboardMarkup:
+        """Build the channel keyboard from the active channels"""
         channels = await self.channel_mgr.list_channels(active_only=True)
 
-        buttons = []
-        row = []
+        flat = [self._channel_button(c['channel_name']) for c in channels]
 
-        for i, channel in enumerate(channels):
-            ch_name = channel['channel_name']
-            button = InlineKeyboardButton(
-                ch_name,
-                callback_data=f"channel:{ch_name}"
-            )
-            row.append(button)
-
-            # 3 buttons per row
-            if len(row) == 3 or i == len(channels) - 1:
-                buttons.append(row)
-                row = []
+        # 3 buttons per row
+        buttons = [flat[i:i + 3] for i in range(0, len(flat), 3)]
 
         # Add back and cancel buttons
-        buttons.append([
-            InlineKeyboardButton("⬅️ Back", callback_data="back_to_date"),
-            InlineKeyboardButton("❌ Cancel", callback_data="cancel")
-        ])
+        buttons.append([_BACK_TO_DATE_BTN, _CANCEL_BTN])
 
         return InlineKeyboardMarkup(buttons)
 
+    def _channel_button(self, ch_name: str) -> InlineKeyboardButton:
+        """Button for a channel, reused across keyboard rebuilds"""
+        button = self._channel_btn_cache.get(ch_name)
+        if button is None:
+            button = InlineKeyboardButton(
+                ch_name,
+                callback_data=f"channel:{ch_name}"
+            )
+            self._channel_btn_cache[ch_name] = button
+        return button
+
     def get_video_number_buttons(self) -> InlineKeyboardMarkup:
         """
         Create video number selection buttons (1-4)
@@ -98,22 +208,7 @@ class InlineSelectionHandler:
         Returns:
             InlineKeyboardMarkup with video number buttons
         """
-        buttons = [
-            [
-                InlineKeyboardButton("Video 1", callback_data="video:1"),
-                InlineKeyboardButton("Video 2", callback_data="video:2")
-            ],
-            [
-                InlineKeyboardButton("Video 3", callback_data="video:3"),
-                InlineKeyboardButton("Video 4", callback_data="video:4")
-            ],
-            [
-                InlineKeyboardButton("⬅️ Back", callback_data="back_to_channel"),
-                InlineKeyboardButton("❌ Cancel", callback_data="cancel")
-            ]
-        ]
-
-        return InlineKeyboardMarkup(buttons)
+        return _VIDEO_NUMBER_KB
 
     async def start_selection(
         self,
@@ -135,13 +230,8 @@ class InlineSelectionHandler:
             True if started successfully
         """
         try:
-            user_id = update.effective_user.id
-
             # Store selection state
-            if 'selections' not in context.user_data:
-                context.user_data['selections'] = {}
-
-            context.user_data['selections'][user_id] = {
+            state = context.user_data['selection'] = {
                 'content_type': content_type,
                 'content_data': content_data,
                 'step': 'date',
@@ -164,14 +254,41 @@ class InlineSelectionHandler:
                 reply_markup=keyboard
             )
 
-            context.user_data['selections'][user_id]['message_id'] = message.message_id
+            state['message_id'] = message.message_id
+            self._schedule_expiry(update, context, 'selection', state)
 
             return True
 
         except Exception as e:
-            logger.error(f"Error starting selection: {e}")
+            logger.error("Error starting selection: %s", e)
             return False
 
+    def _schedule_expiry(
+        self,
+        update: Update,
+        context: CallbackContext,
+        key: str,
+        state: Dict[str, Any]
+    ):
+        """Drop user_data[key] after SELECTION_TTL if it is still this selection"""
+        if context.job_queue is None:
+            return
+
+        context.job_queue.run_once(
+            self._expire_selection,
+            SELECTION_TTL,
+            data=(key, state),
+            user_id=update.effective_user.id,
+            chat_id=update.effective_chat.id
+        )
+
+    @staticmethod
+    async def _expire_selection(context: CallbackContext):
+        """Job callback: remove an abandoned selection"""
+        key, state = context.job.data
+        if context.user_data is not None and context.user_data.get(key) is state:
+            del context.user_data[key]
+
     async def handle_callback(
         self,
         update: Update,
@@ -189,101 +306,115 @@ class InlineSelectionHandler:
         """
         try:
             query = update.callback_query
-            await query.answer()
+            # Acknowledge without waiting; nothing below depends on it
+            self._answer_in_background(query)
 
-            user_id = update.effective_user.id
             data = query.data
 
             # Get selection state
-            if 'selections' not in context.user_data:
-                context.user_data['selections'] = {}
-
-            if user_id not in context.user_data['selections']:
+            state = context.user_data.get('selection')
+            if state is None:
                 await query.edit_message_text("❌ Selection expired. Please try again.")
                 return False
 
-            state = context.user_data['selections'][user_id]
-
-            # Handle cancel
-            if data == "cancel":
-                await query.edit_message_text("❌ Selection cancelled.")
-                del context.user_data['selections'][user_id]
-                return True
-
-            # Handle back buttons
-            if data == "back_to_date":
-                state['step'] = 'date'
-                state['selected_channel'] = None
-                keyboard = self.get_date_buttons()
-                await query.edit_message_text(
-                    "📅 Select upload date:",
-                    reply_markup=keyboard
-                )
-                return True
-
-            if data == "back_to_channel":
-                state['step'] = 'channel'
-                state['selected_video'] = None
-                keyboard = await self.get_channel_buttons()
-                await query.edit_message_text(
-                    f"📺 Select channel for {state['selected_date']}:",
-                    reply_markup=keyboard
-                )
-                return True
-
-            # Handle selections
-            if data.startswith("date:"):
-                selected_date = data.split(":")[1]
-                state['selected_date'] = selected_date
-                state['step'] = 'channel'
-
-                keyboard = await self.get_channel_buttons()
-                date_display = datetime.fromisoformat(selected_date).strftime("%d-%b")
-
-                await query.edit_message_text(
-                    f"📺 Select channel for {date_display}:",
-                    reply_markup=keyboard
-                )
-                return True
-
-            if data.startswith("channel:"):
-                selected_channel = data.split(":")[1]
-                state['selected_channel'] = selected_channel
-                state['step'] = 'video'
-
-                keyboard = self.get_video_number_buttons()
-
-                await query.edit_message_text(
-                    f"🎬 Select video number for {selected_channel}:",
-                    reply_markup=keyboard
-                )
-                return True
-
-            if data.startswith("video:"):
-                selected_video = int(data.split(":")[1])
-                state['selected_video'] = selected_video
-
-                # Complete selection - process the content
-                success = await self._process_selection(state, context)
-
-                if success:
-                    date_display = datetime.fromisoformat(state['selected_date']).strftime("%d-%b")
-                    await query.edit_message_text(
-                        f"✅ Saved for {date_display} / {state['selected_channel']} / Video {selected_video}"
-                    )
-                else:
-                    await query.edit_message_text("❌ Error saving. Please try again.")
-
-                # Cleanup
-                del context.user_data['selections'][user_id]
-                return True
+            # "prefix:arg" -> handler
+            prefix, _, arg = data.partition(':')
+            handler = self._dispatch.get(prefix)
+            if not handler:
+                return False
 
-            return False
+            return await handler(query, context, state, arg)
 
         except Exception as e:
-            logger.error(f"Error handling callback: {e}")
+            logger.error("Error handling callback: %s", e)
             return False
 
+    def _answer_in_background(self, query):
+        """Answer the callback query as a background task"""
+        task = asyncio.create_task(query.answer())
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_answer_done)
+
+    def _on_answer_done(self, task: asyncio.Task):
+        """Forget a finished answer() task, logging any failure"""
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.warning("Failed to answer callback query: %s", task.exception())
+
+    async def _on_cancel(self, query, context, state, arg) -> bool:
+        """Cancel the selection"""
+        await query.edit_message_text("❌ Selection cancelled.")
+        context.user_data.pop('selection', None)
+        return True
+
+    async def _on_back_to_date(self, query, context, state, arg) -> bool:
+        """Go back to date selection"""
+        state['step'] = 'date'
+        state['selected_channel'] = None
+        keyboard = self.get_date_buttons()
+        await query.edit_message_text("📅 Select upload date:", reply_markup=keyboard)
+        return True
+
+    async def _on_back_to_channel(self, query, context, state, arg) -> bool:
+        """Go back to channel selection"""
+        state['step'] = 'channel'
+        state['selected_video'] = None
+        keyboard = await self.get_channel_buttons()
+        date_display = _fmt_ddmon(state['selected_date'])
+
+        await query.edit_message_text(
+            f"📺 Select channel for {date_display}:",
+            reply_markup=keyboard
+        )
+        return True
+
+    async def _on_date(self, query, context, state, selected_date) -> bool:
+        """Date picked - ask for channel"""
+        state['selected_date'] = selected_date
+        state['step'] = 'channel'
+
+        keyboard = await self.get_channel_buttons()
+        date_display = _fmt_ddmon(selected_date)
+
+        await query.edit_message_text(
+            f"📺 Select channel for {date_display}:",
+            reply_markup=keyboard
+        )
+        return True
+
+    async def _on_channel(self, query, context, state, selected_channel) -> bool:
+        """Channel picked - ask for video number"""
+        state['selected_channel'] = selected_channel
+        state['step'] = 'video'
+
+        keyboard = self.get_video_number_buttons()
+
+        await query.edit_message_text(
+            f"🎬 Select video number for {selected_channel}:",
+            reply_markup=keyboard
+        )
+        return True
+
+    async def _on_video(self, query, context, state, arg) -> bool:
+        """Video picked - complete selection and process the content"""
+        selected_video = int(arg)
+        state['selected_video'] = selected_video
+
+        async with self._db_sem:
+            success = await self._process_selection(state, context)
+
+        if success:
+            date_display = _fmt_ddmon(state['selected_date'])
+            await query.edit_message_text(
+                f"✅ Saved for {date_display} / {state['selected_channel']} / Video {selected_video}"
+            )
+        else:
+            await query.edit_message_text("❌ Error saving. Please try again.")
+
+        # Cleanup
+        context.user_data.pop('selection', None)
+        return True
+
     async def _process_selection(
         self,
         state: Dict[str, Any],
@@ -309,13 +440,13 @@ class InlineSelectionHandler:
             # Get channel ID
             channel = await self.channel_mgr.get_channel(selected_channel)
             if not channel:
-                logger.error(f"Channel not found: {selected_channel}")
+                logger.error("Channel not found: %s", selected_channel)
                 return False
 
             channel_id = channel['id']
 
             # Ensure upload entry exists
-            await self.upload_mgr.create_upload_entry(
+            entry = await self.upload_mgr.create_upload_entry(
                 channel_id,
                 selected_date,
                 selected_video
@@ -327,10 +458,11 @@ class InlineSelectionHandler:
                     channel_id,
                     selected_date,
                     selected_video,
-                    content_data
+                    content_data,
+                    upload_id=entry['id']
                 )
 
-                logger.info(f"Script saved: {selected_date}/{selected_channel}/V{selected_video}")
+                logger.info("Script saved: %s/%s/V%s", selected_date, selected_channel, selected_video)
                 return bool(result)
 
             elif content_type == 'thumbnail':
@@ -340,16 +472,17 @@ class InlineSelectionHandler:
                     selected_date,
                     selected_video,
                     content_data['file_id'],
-                    content_data['url']
+                    content_data['url'],
+                    upload_id=entry['id']
                 )
 
-                logger.info(f"Thumbnail saved: {selected_date}/{selected_channel}/V{selected_video}")
+                logger.info("Thumbnail saved: %s/%s/V%s", selected_date, selected_channel, selected_video)
                 return bool(result)
 
             return False
 
         except Exception as e:
-            logger.error(f"Error processing selection: {e}")
+            logger.error("Error processing selection: %s", e)
             return False
 
     async def handle_bulk_selection(
@@ -377,13 +510,8 @@ class InlineSelectionHandler:
             # For bulk, show date and channel selection
             # Then auto-assign to Video 1, 2, 3, 4
 
-            user_id = update.effective_user.id
-
             # Store bulk state
-            if 'bulk_selections' not in context.user_data:
-                context.user_data['bulk_selections'] = {}
-
-            context.user_data['bulk_selections'][user_id] = {
+            state = context.user_data['bulk_selection'] = {
                 'content_type': content_type,
                 'items': items,
                 'step': 'date',
@@ -396,11 +524,12 @@ class InlineSelectionHandler:
             text = f"📅 Select date for {len(items)} {content_type}s:"
 
             message = await update.message.reply_text(text, reply_markup=keyboard)
+            self._schedule_expiry(update, context, 'bulk_selection', state)
 
             return True
 
         except Exception as e:
-            logger.error(f"Error handling bulk selection: {e}")
+            logger.error("Error handling bulk selection: %s", e)
             return False
 
     async def handle_bulk_callback(
@@ -411,55 +540,54 @@ class InlineSelectionHandler:
         """Handle bulk selection callbacks"""
         try:
             query = update.callback_query
-            await query.answer()
-
-            user_id = update.effective_user.id
+            # Acknowledge without waiting; nothing below depends on it
+            self._answer_in_background(query)
 
-            if 'bulk_selections' not in context.user_data:
+            state = context.user_data.get('bulk_selection')
+            if state is None:
                 return False
 
-            if user_id not in context.user_data['bulk_selections']:
+            prefix, _, arg = query.data.partition(':')
+            handler = self._bulk_dispatch.get(prefix)
+            if not handler:
                 return False
 
-            state = context.user_data['bulk_selections'][user_id]
-            data = query.data
-
-            if data.startswith("date:"):
-                selected_date = data.split(":")[1]
-                state['selected_date'] = selected_date
-                state['step'] = 'channel'
+            return await handler(query, context, state, arg)
 
-                keyboard = await self.get_channel_buttons()
-                await query.edit_message_text(
-                    f"📺 Select channel for bulk upload:",
-                    reply_markup=keyboard
-                )
-                return True
+        except Exception as e:
+            logger.error("Error handling bulk callback: %s", e)
+            return False
 
-            if data.startswith("channel:"):
-                selected_channel = data.split(":")[1]
-                state['selected_channel'] = selected_channel
+    async def _on_bulk_date(self, query, context, state, selected_date) -> bool:
+        """Bulk date picked - ask for channel"""
+        state['selected_date'] = selected_date
+        state['step'] = 'channel'
 
-                # Process all items
-                success_count = await self._process_bulk(state)
+        keyboard = await self.get_channel_buttons()
+        await query.edit_message_text(
+            f"📺 Select channel for bulk upload:",
+            reply_markup=keyboard
+        )
+        return True
 
-                date_display = datetime.fromisoformat(state['selected_date']).strftime("%d-%b")
+    async def _on_bulk_channel(self, query, context, state, selected_channel) -> bool:
+        """Bulk channel picked - process all items"""
+        state['selected_channel'] = selected_channel
 
-                await query.edit_message_text(
-                    f"✅ Saved {success_count}/{len(state['items'])} items\n"
-                    f"Date: {date_display}\n"
-                    f"Channel: {selected_channel}\n"
-                    f"Videos: 1-{success_count}"
-                )
+        async with self._db_sem:
+            success_count = await self._process_bulk(state)
 
-                del context.user_data['bulk_selections'][user_id]
-                return True
+        date_display = _fmt_ddmon(state['selected_date'])
 
-            return False
+        await query.edit_message_text(
+            f"✅ Saved {success_count}/{len(state['items'])} items\n"
+            f"Date: {date_display}\n"
+            f"Channel: {selected_channel}\n"
+            f"Videos: 1-{success_count}"
+        )
 
-        except Exception as e:
-            logger.error(f"Error handling bulk callback: {e}")
-            return False
+        context.user_data.pop('bulk_selection', None)
+        return True
 
     async def _process_bulk(self, state: Dict[str, Any]) -> int:
         """Process bulk items - auto-assign to Video 1-4"""
@@ -476,47 +604,78 @@ class InlineSelectionHandler:
 
             channel_id = channel['id']
 
-            success_count = 0
-
-            for i, item in enumerate(items[:4]):  # Max 4 items
-                video_number = i + 1
-
-                try:
-                    # Create entry
-                    await self.upload_mgr.create_upload_entry(
-                        channel_id,
-                        selected_date,
-                        video_number
-                    )
-
-                    if content_type == 'script':
-                        await self.upload_mgr.update_script(
-                            channel_id,
-                            selected_date,
-                            video_number,
-                            item
-                        )
-                    elif content_type == 'thumbnail':
-                        await self.upload_mgr.update_thumbnail(
-                            channel_id,
-                            selected_date,
-                            video_number,
-                            item['file_id'],
-                            item['url']
-                        )
+            # One upsert for all items (Max 4 items)
+            rows = []
+            for i, item in enumerate(items[:4]):
+                if content_type == 'script':
+                    fields = self.upload_mgr.script_fields(item)
+                elif content_type == 'thumbnail':
+                    fields = self.upload_mgr.thumbnail_fields(item['file_id'], item['url'])
+                else:
+                    continue
+                rows.append({'video_number': i + 1, **fields})
+
+            try:
+                await self.upload_mgr.bulk_upsert(channel_id, selected_date, rows)
+                return len(rows)
+            except Exception as e:
+                logger.warning("Bulk upsert failed, saving items individually: %s", e)
+
+            # Fallback: items are independent, save them concurrently
+            results = await asyncio.gather(
+                *[
+                    self._process_one_bulk_item(channel_id, selected_date, i + 1, item, content_type)
+                    for i, item in enumerate(items[:4])
+                ],
+                return_exceptions=True
+            )
 
+            success_count = 0
+            for i, result in enumerate(results):
+                if isinstance(result, Exception):
+                    logger.error("Error processing bulk item %s: %s", i, result)
+                else:
                     success_count += 1
 
-                except Exception as e:
-                    logger.error(f"Error processing bulk item {i}: {e}")
-                    continue
-
             return success_count
 
         except Exception as e:
-            logger.error(f"Error in bulk processing: {e}")
+            logger.error("Error in bulk processing: %s", e)
             return 0
 
+    async def _process_one_bulk_item(
+        self,
+        channel_id: int,
+        selected_date: str,
+        video_number: int,
+        item: Any,
+        content_type: str
+    ):
+        """Create the entry for one bulk item and save its content"""
+        entry = await self.upload_mgr.create_upload_entry(
+            channel_id,
+            selected_date,
+            video_number
+        )
+
+        if content_type == 'script':
+            await self.upload_mgr.update_script(
+                channel_id,
+                selected_date,
+                video_number,
+                item,
+                upload_id=entry['id']
+            )
+        elif content_type == 'thumbnail':
+            await self.upload_mgr.update_thumbnail(
+                channel_id,
+                selected_date,
+                video_number,
+                item['file_id'],
+                item['url'],
+                upload_id=entry['id']
+            )
+
 
 # Helper function to check if message contains script or thumbnail
 def detect_content_type(message) -> Optional[str]:
@@ -529,17 +688,40 @@ def detect_content_type(message) -> Optional[str]:
     Returns:
         'script', 'thumbnail', or None
     """
-    if message.text and len(message.text) > 50:
+    text = message.text
+    photo = message.photo
+    document = message.document
+
+    # Most messages carry none of these
+    if not (text or photo or document):
+        return None
+
+    if text and len(text) > _SCRIPT_MIN_LEN:
         # Likely a script
         return 'script'
 
-    if message.photo:
+    if photo:
         # Thumbnail image
         return 'thumbnail'
 
-    if message.document:
+    if document:
         # Check if image file
-        if message.document.mime_type and message.document.mime_type.startswith('image/'):
+        if (document.mime_type or '').partition('/')[0] == 'image':
             return 'thumbnail'
 
     return None
+
+
+class _ScriptFilter(filters.MessageFilter):
+    """Matches text messages long enough to be a script"""
+
+    __slots__ = ()
+
+    def filter(self, message) -> bool:
+        return len(message.text or '') > _SCRIPT_MIN_LEN
+
+
+# Message filters for the two content types detect_content_type() recognizes,
+# so PTB only dispatches messages that are worth handling
+SCRIPT_FILTER = filters.TEXT & ~filters.COMMAND & _ScriptFilter(name='SCRIPT')
+THUMBNAIL_FILTER = filters.PHOTO | filters.Document.IMAGE
@@ -7,14 +7,13 @@ Audio/Video generation NAHI karega
 import logging
 import os
 import asyncio
-from datetime import datetime
+from datetime import date, timedelta
 from telegram import Update
 from telegram.ext import (
     Application,
     CommandHandler,
     MessageHandler,
     CallbackQueryHandler,
-    filters,
     ContextTypes
 )
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -22,12 +21,18 @@ from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 import pytz
 
+# Optional faster event loop (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Import our managers
-from supabase_client import SupabaseClient
+from supabase_client import get_supabase_client
 from channel_manager import ChannelManager, DailyUploadManager
 from schedule_manager import ScheduleManager, ReminderManager
 from gdrive_folder_manager import GDriveFolderManager
-from inline_selection_handler import InlineSelectionHandler, detect_content_type
+from inline_selection_handler import InlineSelectionHandler, SCRIPT_FILTER, THUMBNAIL_FILTER
 
 # Setup logging
 logging.basicConfig(
@@ -36,6 +41,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Today / tomorrow ISO strings, recomputed only when the date changes
+_DATE_CACHE = {'stamp': None, 'today': None, 'tomorrow': None}
+
+# Chat IDs that receive reminders: CHAT_IDS="id1,id2,..." (falls back to CHAT_ID_1)
+CHAT_IDS = tuple(
+    int(cid)
+    for cid in (os.getenv('CHAT_IDS') or os.getenv('CHAT_ID_1', '')).split(',')
+    if cid.strip().lstrip('-').isdigit() and int(cid) != 0
+)
+
+# /start reply
+_START_MSG = (
+    "🤖 Orchestrator Bot Active!\n\n"
+    "Commands:\n"
+    "/setup_7day - Initialize system\n"
+    "/week_status - 7-day overview\n"
+    "/today_status - Today's status\n"
+    "/tomorrow_status - Tomorrow's status\n"
+    "/list_channels - Show channels\n\n"
+    "Send scripts or thumbnails to organize!"
+)
+
+# Per-channel line of the morning checklist
+_CHECKLIST_LINE = "{} {}: {}/{}"
+
+
+def _dates():
+    """Return (today, tomorrow) as ISO date strings"""
+    t = date.today()
+    if _DATE_CACHE['stamp'] != t:
+        _DATE_CACHE.update(
+            stamp=t,
+            today=t.isoformat(),
+            tomorrow=(t + timedelta(days=1)).isoformat()
+        )
+    return _DATE_CACHE['today'], _DATE_CACHE['tomorrow']
+
 
 class OrchestratorBot:
     """
@@ -50,67 +92,77 @@ class OrchestratorBot:
         if not self.bot_token:
             raise ValueError("TELEGRAM_BOT_TOKEN not set!")
 
-        # Active chat IDs (update with your actual IDs)
-        self.active_chat_ids = [
-            int(os.getenv('CHAT_ID_1', '0')),
-            # Add more if needed
-        ]
-        self.active_chat_ids = [cid for cid in self.active_chat_ids if cid != 0]
+        # Active chat IDs (parsed once at import)
+        self.active_chat_ids = CHAT_IDS
+        if not self.active_chat_ids:
+            logger.warning("No active chat IDs; scheduled jobs will exit early")
 
-        # Supabase client
-        self.supabase_client = SupabaseClient()
+        # Supabase client (shared, pooled)
+        self.supabase_client = get_supabase_client()
 
         # Managers
         self.channel_mgr = ChannelManager(self.supabase_client)
-        self.upload_mgr = DailyUploadManager(self.supabase_client)
+        self.upload_mgr = DailyUploadManager(self.supabase_client, channel_mgr=self.channel_mgr)
         self.schedule_mgr = ScheduleManager(self.supabase_client)
-        self.reminder_mgr = ReminderManager(self.supabase_client)
+        self.reminder_mgr = ReminderManager(self.supabase_client, schedule_mgr=self.schedule_mgr)
         self.gdrive_mgr = GDriveFolderManager(self.supabase_client)
-        self.inline_handler = InlineSelectionHandler(self.supabase_client)
+        self.inline_handler = InlineSelectionHandler(
+            self.supabase_client,
+            channel_mgr=self.channel_mgr,
+            upload_mgr=self.upload_mgr
+        )
 
         # Scheduler for reminders
         self.scheduler = AsyncIOScheduler(timezone=pytz.timezone('Asia/Kolkata'))
 
+        # Realtime subscription for the global image folder (started in post_init)
+        self._folder_watch = None
+
         # Application
-        self.application = Application.builder().token(self.bot_token).build()
+        # concurrent_updates: handlers are I/O-bound (Supabase/Telegram), so let
+        # updates from different users run as concurrent tasks
+        self.application = (
+            Application.builder()
+            .token(self.bot_token)
+            .concurrent_updates(True)
+            .connection_pool_size(20)
+            .pool_timeout(5)
+            .build()
+        )
 
         logger.info("OrchestratorBot initialized")
 
     def setup_handlers(self):
         """Register all command handlers"""
 
-        # Setup commands
-        self.application.add_handler(CommandHandler("start", self.cmd_start))
-        self.application.add_handler(CommandHandler("setup_7day", self.cmd_setup_7day))
-
-        # Channel management
-        self.application.add_handler(CommandHandler("add_channel", self.cmd_add_channel))
-        self.application.add_handler(CommandHandler("list_channels", self.cmd_list_channels))
-
-        # Status commands
-        self.application.add_handler(CommandHandler("week_status", self.cmd_week_status))
-        self.application.add_handler(CommandHandler("today_status", self.cmd_today_status))
-        self.application.add_handler(CommandHandler("tomorrow_status", self.cmd_tomorrow_status))
-        self.application.add_handler(CommandHandler("day_status", self.cmd_day_status))
-
-        # Manual updates
-        self.application.add_handler(CommandHandler("mark_complete", self.cmd_mark_complete))
-
-        # Message handlers (script/thumbnail detection)
-        self.application.add_handler(
-            MessageHandler(
-                filters.TEXT & ~filters.COMMAND,
-                self.handle_message
-            )
+        # (command, callback, block) - read-only commands run with
+        # block=False so concurrent invocations don't serialize
+        commands = (
+            # Setup commands
+            ("start", self.cmd_start, True),
+            ("setup_7day", self.cmd_setup_7day, True),
+
+            # Channel management
+            ("add_channel", self.cmd_add_channel, True),
+            ("list_channels", self.cmd_list_channels, False),
+
+            # Status commands
+            ("week_status", self.cmd_week_status, False),
+            ("today_status", self.cmd_today_status, False),
+            ("tomorrow_status", self.cmd_tomorrow_status, False),
+            ("day_status", self.cmd_day_status, False),
+
+            # Manual updates
+            ("mark_complete", self.cmd_mark_complete, True),
         )
-
-        self.application.add_handler(
-            MessageHandler(
-                filters.PHOTO | filters.Document.IMAGE,
-                self.handle_message
-            )
+        self.application.add_handlers(
+            [CommandHandler(name, callback, block=block) for name, callback, block in commands]
         )
 
+        # Message handlers (script/thumbnail detection happens in the filters)
+        self.application.add_handler(MessageHandler(SCRIPT_FILTER, self.handle_script))
+        self.application.add_handler(MessageHandler(THUMBNAIL_FILTER, self.handle_thumbnail))
+
         # Callback query handler for inline buttons
         self.application.add_handler(CallbackQueryHandler(self.handle_callback))
 
@@ -119,12 +171,17 @@ class OrchestratorBot:
     def setup_scheduler(self):
         """Setup APScheduler for reminders"""
         try:
+            # Missed fires (e.g. during a redeploy) collapse into one run,
+            # and a slow run never overlaps the next
+            job_defaults = {'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 60}
+
             # Tomorrow incomplete (every 30 min)
             self.scheduler.add_job(
                 self.job_tomorrow_incomplete,
                 trigger=IntervalTrigger(minutes=30),
                 id='tomorrow_incomplete',
-                replace_existing=True
+                replace_existing=True,
+                **job_defaults
             )
 
             # Today ready (every 3 hours)
@@ -132,7 +189,8 @@ class OrchestratorBot:
                 self.job_today_ready,
                 trigger=IntervalTrigger(hours=3),
                 id='today_ready',
-                replace_existing=True
+                replace_existing=True,
+                **job_defaults
             )
 
             # Morning checklist (6 AM)
@@ -140,7 +198,8 @@ class OrchestratorBot:
                 self.job_morning_checklist,
                 trigger=CronTrigger(hour=6, minute=0),
                 id='morning_checklist',
-                replace_existing=True
+                replace_existing=True,
+                **job_defaults
             )
 
             # Daily overview (9 AM)
@@ -148,14 +207,15 @@ class OrchestratorBot:
                 self.job_daily_overview,
                 trigger=CronTrigger(hour=9, minute=0),
                 id='daily_overview',
-                replace_existing=True
+                replace_existing=True,
+                **job_defaults
             )
 
             # Don't start here - will be started by Application's post_init
             logger.info("Scheduler jobs configured (4 jobs)")
 
         except Exception as e:
-            logger.error(f"Scheduler setup error: {e}")
+            logger.error("Scheduler setup error: %s", e)
 
     # ================================================================
     # COMMAND HANDLERS
@@ -163,27 +223,18 @@ class OrchestratorBot:
 
     async def cmd_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Start command"""
-        await update.message.reply_text(
-            "🤖 Orchestrator Bot Active!\n\n"
-            "Commands:\n"
-            "/setup_7day - Initialize system\n"
-            "/week_status - 7-day overview\n"
-            "/today_status - Today's status\n"
-            "/tomorrow_status - Tomorrow's status\n"
-            "/list_channels - Show channels\n\n"
-            "Send scripts or thumbnails to organize!"
-        )
+        await update.message.reply_text(_START_MSG)
 
     async def cmd_setup_7day(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Setup 7-day system"""
         try:
             await update.message.reply_text("🔧 Setting up 7-day system...")
 
-            # Initialize 7 days
-            days = await self.schedule_mgr.initialize_7days()
-
-            # Get channels
-            channels = await self.channel_mgr.list_channels(active_only=True)
+            # Initialize 7 days and fetch channels concurrently (independent)
+            days, channels = await asyncio.gather(
+                self.schedule_mgr.initialize_7days(),
+                self.channel_mgr.list_channels(active_only=True)
+            )
             channel_names = [ch['channel_name'] for ch in channels]
 
             # Create GDrive folders
@@ -199,7 +250,7 @@ class OrchestratorBot:
             )
 
         except Exception as e:
-            logger.error(f"Setup error: {e}")
+            logger.error("Setup error: %s", e)
             await update.message.reply_text(f"❌ Error: {str(e)}")
 
     async def cmd_add_channel(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -220,12 +271,13 @@ class OrchestratorBot:
             )
 
             if result:
+                self.inline_handler.invalidate_channel_buttons()
                 await update.message.reply_text(f"✅ Channel added: {channel_name}")
             else:
                 await update.message.reply_text("❌ Failed to add channel")
 
         except Exception as e:
-            logger.error(f"Add channel error: {e}")
+            logger.error("Add channel error: %s", e)
             await update.message.reply_text(f"❌ Error: {str(e)}")
 
     async def cmd_list_channels(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -236,7 +288,7 @@ class OrchestratorBot:
             await update.message.reply_text(formatted)
 
         except Exception as e:
-            logger.error(f"List channels error: {e}")
+            logger.error("List channels error: %s", e)
             await update.message.reply_text(f"❌ Error: {str(e)}")
 
     async def cmd_week_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -254,16 +306,19 @@ class OrchestratorBot:
             await update.message.reply_text(formatted)
 
         except Exception as e:
-            logger.error(f"Week status error: {e}")
+            logger.error("Week status error: %s", e)
             await update.message.reply_text(f"❌ Error: {str(e)}")
 
     async def cmd_today_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show today's status"""
         try:
-            from datetime import date
-            today = date.today().isoformat()
+            today = _dates()[0]
 
-            status = await self.schedule_mgr.get_day_status(today)
+            # Status and GDrive link are independent - fetch together
+            status, gdrive_link = await asyncio.gather(
+                self.schedule_mgr.get_day_status(today),
+                self.gdrive_mgr.get_folder_link(today)
+            )
 
             if not status:
                 await update.message.reply_text("No data for today.")
@@ -272,23 +327,25 @@ class OrchestratorBot:
             formatted = self.schedule_mgr.format_day_status(status, include_details=True)
 
             # Add GDrive link
-            gdrive_link = await self.gdrive_mgr.get_folder_link(today)
             if gdrive_link:
                 formatted += f"\n\n📁 GDrive: {gdrive_link}"
 
             await update.message.reply_text(formatted)
 
         except Exception as e:
-            logger.error(f"Today status error: {e}")
+            logger.error("Today status error: %s", e)
             await update.message.reply_text(f"❌ Error: {str(e)}")
 
     async def cmd_tomorrow_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show tomorrow's status"""
         try:
-            from datetime import date, timedelta
-            tomorrow = (date.today() + timedelta(days=1)).isoformat()
+            tomorrow = _dates()[1]
 
-            status = await self.schedule_mgr.get_day_status(tomorrow)
+            # Status and deadline are independent - fetch together
+            status, (days, hours, mins) = await asyncio.gather(
+                self.schedule_mgr.get_day_status(tomorrow),
+                self.schedule_mgr.calculate_time_remaining(tomorrow)
+            )
 
             if not status:
                 await update.message.reply_text("No data for tomorrow.")
@@ -297,13 +354,12 @@ class OrchestratorBot:
             formatted = self.schedule_mgr.format_day_status(status, include_details=True)
 
             # Add time remaining
-            days, hours, mins = await self.schedule_mgr.calculate_time_remaining(tomorrow)
             formatted += f"\n\n⏰ Time until upload: {days}d {hours}h {mins}m"
 
             await update.message.reply_text(formatted)
 
         except Exception as e:
-            logger.error(f"Tomorrow status error: {e}")
+            logger.error("Tomorrow status error: %s", e)
             await update.message.reply_text(f"❌ Error: {str(e)}")
 
     async def cmd_day_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -325,7 +381,7 @@ class OrchestratorBot:
             await update.message.reply_text(formatted)
 
         except Exception as e:
-            logger.error(f"Day status error: {e}")
+            logger.error("Day status error: %s", e)
             await update.message.reply_text(f"❌ Error: {str(e)}")
 
     async def cmd_mark_complete(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -355,83 +411,94 @@ class OrchestratorBot:
                 await update.message.reply_text("❌ Failed")
 
         except Exception as e:
-            logger.error(f"Mark complete error: {e}")
+            logger.error("Mark complete error: %s", e)
             await update.message.reply_text(f"❌ Error: {str(e)}")
 
     # ================================================================
     # MESSAGE HANDLERS
     # ================================================================
 
-    async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle script or thumbnail messages"""
+    async def handle_script(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle script messages (matched by SCRIPT_FILTER)"""
         try:
-            content_type = detect_content_type(update.message)
-
-            if not content_type:
-                return
+            await self.inline_handler.start_selection(
+                update,
+                context,
+                'script',
+                update.message.text
+            )
 
-            if content_type == 'script':
-                script_text = update.message.text
-                await self.inline_handler.start_selection(
-                    update,
-                    context,
-                    'script',
-                    script_text
-                )
+        except Exception as e:
+            logger.error("Handle script error: %s", e)
 
-            elif content_type == 'thumbnail':
-                if update.message.photo:
-                    photo = update.message.photo[-1]
-                    file_id = photo.file_id
-                elif update.message.document:
-                    file_id = update.message.document.file_id
-                else:
-                    return
-
-                content_data = {
-                    'file_id': file_id,
-                    'url': None
-                }
-
-                await self.inline_handler.start_selection(
-                    update,
-                    context,
-                    'thumbnail',
-                    content_data
-                )
+    async def handle_thumbnail(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle thumbnail messages (matched by THUMBNAIL_FILTER)"""
+        try:
+            message = update.message
+            if message.photo:
+                file_id = message.photo[-1].file_id
+            else:
+                file_id = message.document.file_id
+
+            content_data = {
+                'file_id': file_id,
+                'url': None
+            }
+
+            await self.inline_handler.start_selection(
+                update,
+                context,
+                'thumbnail',
+                content_data
+            )
 
         except Exception as e:
-            logger.error(f"Handle message error: {e}")
+            logger.error("Handle thumbnail error: %s", e)
 
     async def handle_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle inline button callbacks"""
         try:
             await self.inline_handler.handle_callback(update, context)
         except Exception as e:
-            logger.error(f"Callback error: {e}")
+            logger.error("Callback error: %s", e)
 
     # ================================================================
     # SCHEDULED JOBS
     # ================================================================
 
+    async def _broadcast(self, message: str):
+        """Send message to all active chats concurrently"""
+        send = self.application.bot.send_message
+        results = await asyncio.gather(
+            *[send(chat_id=chat_id, text=message) for chat_id in self.active_chat_ids],
+            return_exceptions=True
+        )
+
+        for chat_id, result in zip(self.active_chat_ids, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to send message to %s: %s", chat_id, result)
+
+        return results
+
     async def job_tomorrow_incomplete(self):
         """Check tomorrow's incomplete items (every 30 min)"""
+        if not self.active_chat_ids:
+            return
+
         try:
             should_send, incomplete = await self.reminder_mgr.should_send_tomorrow_reminder()
 
             if not should_send or not incomplete:
                 return
 
-            from datetime import date, timedelta
-            tomorrow = (date.today() + timedelta(days=1)).isoformat()
+            tomorrow = _dates()[1]
 
             message = self.reminder_mgr.format_tomorrow_incomplete_reminder(incomplete, tomorrow)
 
-            for chat_id in self.active_chat_ids:
-                await self.application.bot.send_message(chat_id=chat_id, text=message)
+            await self._broadcast(message)
 
             # Log reminder
-            channels_mentioned = list(set([item['channel_name'] for item in incomplete]))
+            channels_mentioned = list({item['channel_name'] for item in incomplete})
             await self.reminder_mgr.log_reminder(
                 'tomorrow_incomplete',
                 tomorrow,
@@ -441,34 +508,37 @@ class OrchestratorBot:
             )
 
         except Exception as e:
-            logger.error(f"Tomorrow incomplete job error: {e}")
+            logger.error("Tomorrow incomplete job error: %s", e)
 
     async def job_today_ready(self):
         """Check if today ready (every 3 hours)"""
+        if not self.active_chat_ids:
+            return
+
         try:
             should_send, status = await self.reminder_mgr.should_send_today_reminder()
 
             if not should_send or not status:
                 return
 
-            from datetime import date
-            today = date.today().isoformat()
+            today = _dates()[0]
 
             message = self.reminder_mgr.format_today_ready_reminder(status)
 
-            for chat_id in self.active_chat_ids:
-                await self.application.bot.send_message(chat_id=chat_id, text=message)
+            await self._broadcast(message)
 
             await self.reminder_mgr.log_reminder('today_ready', today, message, 0, [])
 
         except Exception as e:
-            logger.error(f"Today ready job error: {e}")
+            logger.error("Today ready job error: %s", e)
 
     async def job_morning_checklist(self):
         """Morning 6 AM checklist"""
+        if not self.active_chat_ids:
+            return
+
         try:
-            from datetime import date
-            today = date.today().isoformat()
+            today = _dates()[0]
 
             status = await self.schedule_mgr.get_day_status(today)
 
@@ -478,11 +548,11 @@ class OrchestratorBot:
             message_lines = ["🔍 MORNING CHECKLIST\n"]
             message_lines.append(f"Upload Date: {today}\n")
 
+            line = _CHECKLIST_LINE.format
             for ch_name, ch_data in status['channels'].items():
-                completed = ch_data['completed']
-                total = ch_data['total']
+                completed, total = ch_data['completed'], ch_data['total']
                 emoji = "✅" if completed == total else "⚠️"
-                message_lines.append(f"{emoji} {ch_name}: {completed}/{total}")
+                message_lines.append(line(emoji, ch_name, completed, total))
 
             message_lines.append(f"\nOverall: {status['videos_completed']}/{status['total_videos']}")
             message_lines.append(f"Status: {status['status_text']}")
@@ -490,14 +560,16 @@ class OrchestratorBot:
 
             message = "\n".join(message_lines)
 
-            for chat_id in self.active_chat_ids:
-                await self.application.bot.send_message(chat_id=chat_id, text=message)
+            await self._broadcast(message)
 
         except Exception as e:
-            logger.error(f"Morning checklist job error: {e}")
+            logger.error("Morning checklist job error: %s", e)
 
     async def job_daily_overview(self):
         """Daily 9 AM overview"""
+        if not self.active_chat_ids:
+            return
+
         try:
             overview = await self.schedule_mgr.get_week_overview()
 
@@ -507,11 +579,10 @@ class OrchestratorBot:
             message = self.schedule_mgr.format_week_overview(overview)
             message = "🌅 GOOD MORNING - WEEKLY OVERVIEW\n\n" + message
 
-            for chat_id in self.active_chat_ids:
-                await self.application.bot.send_message(chat_id=chat_id, text=message)
+            await self._broadcast(message)
 
         except Exception as e:
-            logger.error(f"Daily overview job error: {e}")
+            logger.error("Daily overview job error: %s", e)
 
     # ================================================================
     # RUN
@@ -533,14 +604,30 @@ class OrchestratorBot:
                 self.scheduler.start()
                 logger.info("Scheduler started with 4 jobs")
 
+                # Drop the image folder cache as soon as another instance switches it
+                self._folder_watch = asyncio.create_task(
+                    self.supabase_client.watch_image_folder()
+                )
+
+            async def post_shutdown(app):
+                if self._folder_watch is not None:
+                    self._folder_watch.cancel()
+                await self.supabase_client.unwatch_image_folder()
+
             self.application.post_init = post_init
+            self.application.post_shutdown = post_shutdown
+
+            # Use uvloop when installed
+            if uvloop is not None:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+                logger.info("Using uvloop event loop")
 
             # Start polling
             logger.info("Bot polling started")
             self.application.run_polling(drop_pending_updates=True)
 
         except Exception as e:
-            logger.error(f"Run error: {e}")
+            logger.exception("Run error: %s", e)
             raise
 
 
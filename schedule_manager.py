@@ -3,13 +3,87 @@
 Handles schedule tracking, reminders, and status calculations
 """
 
+import asyncio
+import functools
+import io
 import logging
+import time
+from collections import defaultdict
 from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, timezone
 from supabase_client import SupabaseClient
 
 logger = logging.getLogger(__name__)
 
+# Smallest completion % that counts as "some progress" (i.e. > 0)
+_ANY_PROGRESS = 1e-9
+
+# (minimum completion %, emoji, text) - first match wins
+_STATUS_THRESHOLDS = (
+    (100, "✅", "READY"),
+    (80, "🟢", "ALMOST READY"),
+    (50, "🟡", "IN PROGRESS"),
+    (_ANY_PROGRESS, "🔵", "STARTED"),
+    (float('-inf'), "⚪", "NOT STARTED"),
+)
+
+# (minimum completion %, emoji) for channel breakdown lines
+_CHANNEL_THRESHOLDS = (
+    (100, "✅"),
+    (_ANY_PROGRESS, "🟡"),
+    (float('-inf'), "⚪"),
+)
+
+# get_day_status results are reused for this many seconds
+DAY_STATUS_TTL = 5.0
+
+
+def _parse_pg_ts(value: str) -> datetime:
+    """Parse a Postgres/PostgREST timestamp as an aware UTC-based datetime"""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        # Naive values are stored in UTC
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@functools.lru_cache(maxsize=8)
+def _format_week(
+    days: Tuple[Tuple[str, str, float, int, int], ...],
+    total_completed: int,
+    total_videos: int,
+    total_pct: float,
+    today: str
+) -> str:
+    """Build the week overview text from its hashable key (see format_week_overview)"""
+    buf = io.StringIO()
+    w = buf.write
+    w("📅 7-DAY SCHEDULE OVERVIEW\n")
+
+    tomorrow = (date.fromisoformat(today) + timedelta(days=1)).isoformat()
+
+    for date_str, emoji, pct, completed, total in days:
+        # Add day name
+        dt = datetime.fromisoformat(date_str)
+        day_name = dt.strftime("%a")
+
+        # Mark today/tomorrow
+        if date_str == today:
+            suffix = " [TODAY]"
+        elif date_str == tomorrow:
+            suffix = " [TOMORROW]"
+        else:
+            suffix = ""
+
+        w(f"\n{day_name} {date_str}{suffix}: {emoji} {pct}% ({completed}/{total})")
+
+    # Overall stats
+    w(f"\n\nOverall: {total_completed}/{total_videos} ({total_pct}%)")
+
+    return buf.getvalue()
+
 
 class ScheduleManager:
     """Manages 7-day upload schedules and tracking"""
@@ -17,20 +91,28 @@ class ScheduleManager:
     def __init__(self, supabase_client: SupabaseClient):
         self.supabase = supabase_client.supabase
 
-    def get_date_range(self, days_ahead: int = 7) -> List[str]:
+        # target_date -> (monotonic timestamp, status)
+        self._status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # target_date -> load in progress (concurrent callers share it)
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def get_date_range(self, days_ahead: int = 7, start_date: Optional[str] = None) -> List[str]:
         """
-        Get list of dates from today to N days ahead
+        Get list of dates from today (or start_date) to N days ahead
 
         Args:
             days_ahead: Number of days to include
+            start_date: First date (defaults to today)
 
         Returns:
             List of date strings (YYYY-MM-DD)
         """
-        today = date.today()
-        return [(today + timedelta(days=i)).isoformat() for i in range(days_ahead)]
+        start = date.fromisoformat(start_date) if start_date else date.today()
+        base = start.toordinal()
+        return [date.fromordinal(base + i).isoformat() for i in range(days_ahead)]
 
-    async def initialize_date(self, target_date: str) -> bool:
+    async def initialize_date(self, target_date: str) -> Optional[Dict[str, Any]]:
         """
         Initialize schedule skeleton for a date
         Creates upload_schedule and daily_uploads entries
@@ -39,21 +121,32 @@ class ScheduleManager:
             target_date: Date string (YYYY-MM-DD)
 
         Returns:
-            True if successful
+            The date's upload_schedules row ({} if none), None on error
         """
         try:
-            # Call Supabase function to create skeleton
-            result = self.supabase.rpc(
-                'create_daily_uploads_skeleton',
-                {'target_date': target_date}
-            ).execute()
+            # Create skeleton and get the schedule row back in one round trip
+            try:
+                query = self.supabase.rpc('init_upload_schedule', {'p_date': target_date})
+                result = await asyncio.to_thread(query.execute)
+            except Exception as e:
+                logger.warning(f"init_upload_schedule RPC unavailable, using fallback: {e}")
+                query = self.supabase.rpc(
+                    'create_daily_uploads_skeleton',
+                    {'target_date': target_date}
+                )
+                await asyncio.to_thread(query.execute)
+
+                query = self.supabase.table('upload_schedules').select('*').eq(
+                    'upload_date', target_date
+                )
+                result = await asyncio.to_thread(query.execute)
 
             logger.info(f"Initialized schedule for {target_date}")
-            return True
+            return result.data[0] if result.data else {}
 
         except Exception as e:
             logger.error(f"Error initializing date {target_date}: {e}")
-            return False
+            return None
 
     async def initialize_7days(self) -> int:
         """
@@ -63,118 +156,339 @@ class ScheduleManager:
             Number of days initialized
         """
         try:
-            result = self.supabase.rpc('create_next_7days_skeleton').execute()
+            await asyncio.to_thread(self.supabase.rpc('create_next_7days_skeleton').execute)
             logger.info("Initialized 7-day schedule")
-            return 7
-
         except Exception as e:
             logger.error(f"Error initializing 7 days: {e}")
             return 0
 
-    async def get_day_status(self, target_date: str) -> Dict[str, Any]:
+        # Prime the status cache from the write path so a following week
+        # overview / day status needs no further round trips
+        try:
+            dates = self.get_date_range(8)
+            end_date = dates.pop()
+            schedules_by_date, uploads_by_date = await self._fetch_week_raw(dates[0], end_date)
+
+            now = time.monotonic()
+            for d, schedule in schedules_by_date.items():
+                # Settled days carry no channel breakdown - leave those to get_day_status
+                if not self._is_settled(schedule):
+                    self._status_cache[d] = (
+                        now,
+                        self._compute_day_status(schedule, uploads_by_date.get(d, []), d)
+                    )
+
+            return len(schedules_by_date)
+
+        except Exception as e:
+            logger.warning(f"Could not prime status cache after 7-day init: {e}")
+            return 7
+
+    async def get_day_status(self, target_date: str, verbose: bool = False) -> Dict[str, Any]:
         """
         Get comprehensive status for a specific date
 
         Args:
             target_date: Date string
+            verbose: Also return the raw daily_uploads rows under 'uploads'
+                     (otherwise counters come pre-aggregated from the database)
 
         Returns:
             Dict with status info
         """
+        if verbose:
+            status = await self._load_day_status(target_date, verbose)
+        else:
+            entry = self._status_cache.get(target_date)
+            if entry and time.monotonic() - entry[0] < DAY_STATUS_TTL:
+                return entry[1]
+
+            # Join a load that is already running for this date
+            task = self._inflight.get(target_date)
+            if task is None:
+                task = asyncio.ensure_future(self._load_day_status(target_date, verbose))
+                self._inflight[target_date] = task
+                task.add_done_callback(lambda _t, d=target_date: self._inflight.pop(d, None))
+
+            # shield: one caller being cancelled must not cancel the shared load
+            status = await asyncio.shield(task)
+
+        if status:
+            now = time.monotonic()
+            if len(self._status_cache) > 32:
+                self._status_cache = {
+                    d: entry for d, entry in self._status_cache.items()
+                    if now - entry[0] < DAY_STATUS_TTL
+                }
+            self._status_cache[target_date] = (now, status)
+
+        return status
+
+    async def _load_day_status(self, target_date: str, verbose: bool) -> Dict[str, Any]:
+        """get_day_status() without the cache"""
         try:
             # Get upload_schedule
-            schedule_result = self.supabase.table('upload_schedules').select('*').eq(
+            schedule_query = self.supabase.table('upload_schedules').select('*').eq(
                 'upload_date', target_date
-            ).execute()
-
-            if not schedule_result.data:
-                # Create if doesn't exist
-                await self.initialize_date(target_date)
-                schedule_result = self.supabase.table('upload_schedules').select('*').eq(
-                    'upload_date', target_date
-                ).execute()
+            )
+            schedule_result = await asyncio.to_thread(schedule_query.execute)
 
-            schedule = schedule_result.data[0] if schedule_result.data else {}
+            if schedule_result.data:
+                schedule = schedule_result.data[0]
+            else:
+                # Create if doesn't exist (returns the new row)
+                schedule = (await self.initialize_date(target_date)) or {}
+
+            if not verbose:
+                # Counters + channel breakdown aggregated in Postgres
+                try:
+                    query = self.supabase.rpc('get_day_status_v1', {'target_date': target_date})
+                    result = await asyncio.to_thread(query.execute)
+                    row = result.data[0] if result.data else {}
+                    return self._build_day_status(
+                        schedule,
+                        target_date,
+                        row.get('total') or 0,
+                        row.get('scripts_ready') or 0,
+                        row.get('thumbnails_ready') or 0,
+                        row.get('videos_completed') or 0,
+                        dict(sorted((row.get('channels') or {}).items())),
+                        []
+                    )
+                except Exception as e:
+                    logger.warning(f"get_day_status_v1 RPC unavailable, using fallback: {e}")
 
             # Get daily_uploads breakdown
-            uploads_result = self.supabase.table('daily_uploads').select(
+            uploads_query = self.supabase.table('daily_uploads').select(
                 '*, channels(channel_name)'
-            ).eq('upload_date', target_date).execute()
+            ).eq('upload_date', target_date)
+            uploads_result = await asyncio.to_thread(uploads_query.execute)
 
             uploads = uploads_result.data if uploads_result.data else []
 
-            # Calculate stats
-            total = len(uploads)
-            scripts_ready = sum(1 for u in uploads if u['script_status'] in ['received', 'processed'])
-            thumbnails_ready = sum(1 for u in uploads if u['thumbnail_status'] == 'received')
-            videos_completed = sum(1 for u in uploads if u['video_status'] == 'completed')
-
-            completion_pct = (videos_completed / total * 100) if total > 0 else 0
-
-            # Determine status emoji
-            if completion_pct == 100:
-                status_emoji = "✅"
-                status_text = "READY"
-            elif completion_pct >= 80:
-                status_emoji = "🟢"
-                status_text = "ALMOST READY"
-            elif completion_pct >= 50:
-                status_emoji = "🟡"
-                status_text = "IN PROGRESS"
-            elif completion_pct > 0:
-                status_emoji = "🔵"
-                status_text = "STARTED"
-            else:
-                status_emoji = "⚪"
-                status_text = "NOT STARTED"
-
-            # Group by channel
-            channels_status = {}
-            for upload in uploads:
-                ch_name = upload['channels']['channel_name']
-                if ch_name not in channels_status:
-                    channels_status[ch_name] = {
-                        'total': 0,
-                        'completed': 0,
-                        'scripts': 0,
-                        'thumbnails': 0,
-                        'missing': []
-                    }
-
-                channels_status[ch_name]['total'] += 1
-                if upload['video_status'] == 'completed':
-                    channels_status[ch_name]['completed'] += 1
-                if upload['script_status'] in ['received', 'processed']:
-                    channels_status[ch_name]['scripts'] += 1
-                if upload['thumbnail_status'] == 'received':
-                    channels_status[ch_name]['thumbnails'] += 1
-
-                # Track missing items
-                video_num = upload['video_number']
-                if upload['script_status'] == 'pending':
-                    channels_status[ch_name]['missing'].append(f"V{video_num} script")
-                if upload['thumbnail_status'] == 'pending':
-                    channels_status[ch_name]['missing'].append(f"V{video_num} thumbnail")
-
-            return {
-                'date': target_date,
-                'status_emoji': status_emoji,
-                'status_text': status_text,
-                'completion_percentage': round(completion_pct, 1),
-                'total_videos': total,
-                'videos_completed': videos_completed,
-                'scripts_ready': scripts_ready,
-                'thumbnails_ready': thumbnails_ready,
-                'all_complete': schedule.get('all_complete', False),
-                'channels': channels_status,
-                'uploads': uploads,
-                'schedule': schedule
-            }
+            return self._compute_day_status(schedule, uploads, target_date)
 
         except Exception as e:
             logger.error(f"Error getting day status for {target_date}: {e}")
             return {}
 
+    @staticmethod
+    def _compute_day_status(
+        schedule: Dict[str, Any],
+        uploads: List[Dict[str, Any]],
+        target_date: str
+    ) -> Dict[str, Any]:
+        """
+        Aggregate a date's schedule row and daily_uploads rows into a status dict
+
+        Args:
+            schedule: upload_schedules row ({} if missing)
+            uploads: daily_uploads rows with channels(channel_name)
+            target_date: Date string
+
+        Returns:
+            Dict with status info (see get_day_status)
+        """
+        # Calculate stats and group by channel in a single pass
+        total = len(uploads)
+        scripts_ready = 0
+        thumbnails_ready = 0
+        videos_completed = 0
+
+        channels_status = defaultdict(lambda: {
+            'total': 0,
+            'completed': 0,
+            'scripts': 0,
+            'thumbnails': 0,
+            'missing': []
+        })
+        for upload in uploads:
+            script_status = upload['script_status']
+            thumbnail_status = upload['thumbnail_status']
+
+            bucket = channels_status[upload['channels']['channel_name']]
+
+            bucket['total'] += 1
+            if upload['video_status'] == 'completed':
+                videos_completed += 1
+                bucket['completed'] += 1
+            if script_status in ('received', 'processed'):
+                scripts_ready += 1
+                bucket['scripts'] += 1
+            if thumbnail_status == 'received':
+                thumbnails_ready += 1
+                bucket['thumbnails'] += 1
+
+            # Track missing items
+            if script_status == 'pending' or thumbnail_status == 'pending':
+                missing = bucket['missing']
+                v_label = f"V{upload['video_number']}"
+                if script_status == 'pending':
+                    missing.append(v_label + " script")
+                if thumbnail_status == 'pending':
+                    missing.append(v_label + " thumbnail")
+
+        return ScheduleManager._build_day_status(
+            schedule,
+            target_date,
+            total,
+            scripts_ready,
+            thumbnails_ready,
+            videos_completed,
+            dict(channels_status),
+            uploads
+        )
+
+    @staticmethod
+    def _build_day_status(
+        schedule: Dict[str, Any],
+        target_date: str,
+        total: int,
+        scripts_ready: int,
+        thumbnails_ready: int,
+        videos_completed: int,
+        channels_status: Dict[str, Dict[str, Any]],
+        uploads: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Assemble the status dict (shared by the RPC and row-aggregation paths)"""
+        completion_pct = (videos_completed / total * 100) if total > 0 else 0
+
+        # Determine status emoji
+        status_emoji, status_text = next(
+            (emoji, text) for threshold, emoji, text in _STATUS_THRESHOLDS
+            if completion_pct >= threshold
+        )
+
+        return {
+            'date': target_date,
+            'status_emoji': status_emoji,
+            'status_text': status_text,
+            'completion_percentage': round(completion_pct, 1),
+            'total_videos': total,
+            'videos_completed': videos_completed,
+            'scripts_ready': scripts_ready,
+            'thumbnails_ready': thumbnails_ready,
+            'all_complete': schedule.get('all_complete', False),
+            'channels': channels_status,
+            'uploads': uploads,
+            'schedule': schedule
+        }
+
+    @staticmethod
+    def _is_settled(schedule: Dict[str, Any]) -> bool:
+        """True if a schedule row is complete and carries its own video counters"""
+        return bool(schedule.get('all_complete')) and bool(schedule.get('total_videos'))
+
+    @staticmethod
+    def _settled_day_status(schedule: Dict[str, Any], target_date: str) -> Dict[str, Any]:
+        """
+        Status for a completed day built from the schedule row alone
+        (no per-channel breakdown - the week overview doesn't show one)
+
+        Args:
+            schedule: upload_schedules row that passes _is_settled()
+            target_date: Date string
+
+        Returns:
+            Dict with the same keys as get_day_status
+        """
+        total = schedule['total_videos']
+        return {
+            'date': target_date,
+            'status_emoji': "✅",
+            'status_text': "READY",
+            'completion_percentage': 100.0,
+            'total_videos': total,
+            'videos_completed': schedule.get('videos_completed') or total,
+            'scripts_ready': total,
+            'thumbnails_ready': total,
+            'all_complete': True,
+            'channels': {},
+            'uploads': [],
+            'schedule': schedule
+        }
+
+    async def _fetch_week_raw(
+        self,
+        start_date: str,
+        end_date: str
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """
+        Fetch upload_schedules and daily_uploads rows for a date range
+        daily_uploads is only read for dates that aren't settled already
+
+        Args:
+            start_date: First date (inclusive)
+            end_date: Last date (exclusive)
+
+        Returns:
+            Tuple of (schedules_by_date, uploads_by_date)
+        """
+        schedule_query = self.supabase.table('upload_schedules').select('*').gte(
+            'upload_date', start_date
+        ).lt('upload_date', end_date)
+        schedule_result = await asyncio.to_thread(schedule_query.execute)
+
+        schedules_by_date = {row['upload_date']: row for row in schedule_result.data or []}
+
+        open_dates = [d for d, row in schedules_by_date.items() if not self._is_settled(row)]
+
+        uploads_by_date = defaultdict(list)
+        if open_dates:
+            uploads_query = self.supabase.table('daily_uploads').select(
+                '*, channels(channel_name)'
+            ).in_('upload_date', open_dates)
+            uploads_result = await asyncio.to_thread(uploads_query.execute)
+
+            for upload in uploads_result.data or []:
+                uploads_by_date[upload['upload_date']].append(upload)
+
+        return schedules_by_date, uploads_by_date
+
+    async def _week_statuses(self, dates: List[str], end_date: str) -> List[Any]:
+        """
+        Per-date statuses for the week overview
+
+        Served from the status cache when every date is fresh there,
+        otherwise from (at most) two range queries
+
+        Args:
+            dates: Dates in the week
+            end_date: Day after the last date (exclusive range end)
+
+        Returns:
+            Status dict (or exception) per date, in order
+        """
+        now = time.monotonic()
+        cached = [self._status_cache.get(d) for d in dates]
+        if all(entry and now - entry[0] < DAY_STATUS_TTL for entry in cached):
+            return [entry[1] for entry in cached]
+
+        # Whole week in (at most) two queries, bucketed by date
+        schedules_by_date, uploads_by_date = await self._fetch_week_raw(dates[0], end_date)
+
+        # Dates without a schedule row go through get_day_status (which
+        # initializes them), concurrently
+        missing = [d for d in dates if d not in schedules_by_date]
+        initialized = await asyncio.gather(
+            *(self.get_day_status(d) for d in missing),
+            return_exceptions=True
+        )
+        by_date = dict(zip(missing, initialized))
+
+        results = []
+        for d in dates:
+            if d in by_date:
+                results.append(by_date[d])
+            elif self._is_settled(schedules_by_date[d]):
+                results.append(self._settled_day_status(schedules_by_date[d], d))
+            else:
+                results.append(self._compute_day_status(
+                    schedules_by_date[d], uploads_by_date.get(d, []), d
+                ))
+
+        return results
+
     async def get_week_overview(self, start_date: Optional[str] = None) -> Dict[str, Any]:
         """
         Get 7-day overview
@@ -186,18 +500,20 @@ class ScheduleManager:
             Week overview dict
         """
         try:
-            if not start_date:
-                start_date = date.today().isoformat()
+            # One extra day gives the exclusive end of the range query
+            dates = self.get_date_range(8, start_date)
+            end_date = dates.pop()
 
-            dates = self.get_date_range(7)
+            results = await self._week_statuses(dates, end_date)
 
-            # Get status for each day
             days_status = []
             total_videos = 0
             total_completed = 0
 
-            for d in dates:
-                day_status = await self.get_day_status(d)
+            for d, day_status in zip(dates, results):
+                if isinstance(day_status, Exception):
+                    logger.error(f"Error getting day status for {d}: {day_status}")
+                    continue
                 if day_status:
                     days_status.append(day_status)
                     total_videos += day_status.get('total_videos', 0)
@@ -229,9 +545,10 @@ class ScheduleManager:
             List of incomplete upload dicts with details
         """
         try:
-            result = self.supabase.table('daily_uploads').select(
+            query = self.supabase.table('daily_uploads').select(
                 '*, channels(channel_name)'
-            ).eq('upload_date', target_date).execute()
+            ).eq('upload_date', target_date)
+            result = await asyncio.to_thread(query.execute)
 
             if not result.data:
                 return []
@@ -283,31 +600,32 @@ class ScheduleManager:
         total = status['total_videos']
 
         # Header
-        lines = [f"{emoji} {date_str} - {text} ({pct}%)"]
-        lines.append(f"Videos: {completed}/{total}")
+        buf = io.StringIO()
+        w = buf.write
+        w(f"{emoji} {date_str} - {text} ({pct}%)\nVideos: {completed}/{total}")
 
         if include_details and status.get('channels'):
-            lines.append("\nChannel Breakdown:")
+            w("\n\nChannel Breakdown:")
             for ch_name, ch_data in status['channels'].items():
                 ch_completed = ch_data['completed']
                 ch_total = ch_data['total']
 
-                if ch_completed == ch_total:
-                    ch_emoji = "✅"
-                elif ch_completed > 0:
-                    ch_emoji = "🟡"
-                else:
-                    ch_emoji = "⚪"
+                ch_pct = (ch_completed / ch_total * 100) if ch_total else 100
+                ch_emoji = next(
+                    symbol for threshold, symbol in _CHANNEL_THRESHOLDS if ch_pct >= threshold
+                )
 
-                lines.append(f"{ch_emoji} {ch_name}: {ch_completed}/{ch_total}")
+                w(f"\n{ch_emoji} {ch_name}: {ch_completed}/{ch_total}")
 
-                if ch_data['missing']:
-                    missing_str = ", ".join(ch_data['missing'][:3])  # Show first 3
-                    if len(ch_data['missing']) > 3:
-                        missing_str += f" +{len(ch_data['missing']) - 3} more"
-                    lines.append(f"   Missing: {missing_str}")
+                missing = ch_data['missing']
+                if missing:
+                    missing_str = ", ".join(missing[:3])  # Show first 3
+                    missing_count = len(missing)
+                    if missing_count > 3:
+                        missing_str += f" +{missing_count - 3} more"
+                    w(f"\n   Missing: {missing_str}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def format_week_overview(self, overview: Dict[str, Any]) -> str:
         """
@@ -322,42 +640,25 @@ class ScheduleManager:
         if not overview or not overview.get('days'):
             return "No schedule data available"
 
-        lines = ["📅 7-DAY SCHEDULE OVERVIEW\n"]
-
-        # Get today's date
-        today = date.today().isoformat()
-
-        for day in overview['days']:
-            date_str = day['date']
-            emoji = day['status_emoji']
-            pct = day['completion_percentage']
-            completed = day['videos_completed']
-            total = day['total_videos']
-
-            # Add day name
-            dt = datetime.fromisoformat(date_str)
-            day_name = dt.strftime("%a")
-
-            # Mark today/tomorrow
-            if date_str == today:
-                suffix = " [TODAY]"
-            elif date_str == (date.today() + timedelta(days=1)).isoformat():
-                suffix = " [TOMORROW]"
-            else:
-                suffix = ""
-
-            lines.append(
-                f"{day_name} {date_str}{suffix}: {emoji} {pct}% ({completed}/{total})"
+        # Only these fields reach the text, so they key the formatting cache
+        days = tuple(
+            (
+                day['date'],
+                day['status_emoji'],
+                day['completion_percentage'],
+                day['videos_completed'],
+                day['total_videos']
             )
+            for day in overview['days']
+        )
 
-        # Overall stats
-        total_pct = overview['completion_percentage']
-        total_completed = overview['total_completed']
-        total_videos = overview['total_videos']
-
-        lines.append(f"\nOverall: {total_completed}/{total_videos} ({total_pct}%)")
-
-        return "\n".join(lines)
+        return _format_week(
+            days,
+            overview['total_completed'],
+            overview['total_videos'],
+            overview['completion_percentage'],
+            date.today().isoformat()
+        )
 
     async def mark_complete(
         self,
@@ -378,9 +679,10 @@ class ScheduleManager:
         """
         try:
             # Get channel ID
-            ch_result = self.supabase.table('channels').select('id').eq(
+            ch_query = self.supabase.table('channels').select('id').eq(
                 'channel_name', channel_name
-            ).execute()
+            )
+            ch_result = await asyncio.to_thread(ch_query.execute)
 
             if not ch_result.data:
                 logger.error(f"Channel not found: {channel_name}")
@@ -388,19 +690,22 @@ class ScheduleManager:
 
             channel_id = ch_result.data[0]['id']
 
-            # Update status
-            result = self.supabase.table('daily_uploads').update({
+            # Update status (one timestamp for both columns)
+            now_iso = datetime.now(timezone.utc).isoformat()
+            query = self.supabase.table('daily_uploads').update({
                 'script_status': 'processed',
                 'thumbnail_status': 'received',
                 'video_status': 'completed',
                 'audio_status': 'completed',
-                'processing_completed_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat()
+                'processing_completed_at': now_iso,
+                'updated_at': now_iso
             }).eq('channel_id', channel_id).eq('upload_date', upload_date).eq(
                 'video_number', video_number
-            ).execute()
+            )
+            result = await asyncio.to_thread(query.execute)
 
             if result.data:
+                self._status_cache.pop(upload_date, None)
                 logger.info(f"Marked complete: {channel_name}/{upload_date}/V{video_number}")
                 return True
             return False
@@ -421,19 +726,17 @@ class ScheduleManager:
         """
         try:
             # Get deadline time from upload_schedule
-            schedule_result = self.supabase.table('upload_schedules').select(
+            query = self.supabase.table('upload_schedules').select(
                 'upload_deadline_time'
-            ).eq('upload_date', upload_date).execute()
+            ).eq('upload_date', upload_date)
+            schedule_result = await asyncio.to_thread(query.execute)
 
             deadline_time = "08:00:00"  # Default
             if schedule_result.data:
                 deadline_time = schedule_result.data[0].get('upload_deadline_time', deadline_time)
 
-            # Combine date and time
-            deadline_dt = datetime.strptime(
-                f"{upload_date} {deadline_time}",
-                "%Y-%m-%d %H:%M:%S"
-            )
+            # Combine date and time (fromisoformat also accepts HH:MM)
+            deadline_dt = datetime.fromisoformat(f"{upload_date}T{deadline_time}")
 
             # Calculate difference
             now = datetime.now()
@@ -456,9 +759,14 @@ class ScheduleManager:
 class ReminderManager:
     """Manages reminder logic and tracking"""
 
-    def __init__(self, supabase_client: SupabaseClient):
+    def __init__(
+        self,
+        supabase_client: SupabaseClient,
+        schedule_mgr: Optional[ScheduleManager] = None
+    ):
         self.supabase = supabase_client.supabase
-        self.schedule_mgr = ScheduleManager(supabase_client)
+        # Share the bot's ScheduleManager (and its status cache) when given
+        self.schedule_mgr = schedule_mgr or ScheduleManager(supabase_client)
 
     async def should_send_tomorrow_reminder(self) -> Tuple[bool, List[Dict[str, Any]]]:
         """
@@ -469,21 +777,24 @@ class ReminderManager:
         """
         try:
             tomorrow = (date.today() + timedelta(days=1)).isoformat()
-            incomplete = await self.schedule_mgr.get_incomplete_items_for_date(tomorrow)
+
+            # Incomplete items and last reminder time are independent reads
+            query = self.supabase.table('upload_schedules').select(
+                'last_reminder_sent_at, reminder_type'
+            ).eq('upload_date', tomorrow)
+            incomplete, schedule_result = await asyncio.gather(
+                self.schedule_mgr.get_incomplete_items_for_date(tomorrow),
+                asyncio.to_thread(query.execute)
+            )
 
             if not incomplete:
                 return (False, [])
 
-            # Check last reminder time
-            schedule_result = self.supabase.table('upload_schedules').select(
-                'last_reminder_sent_at, reminder_type'
-            ).eq('upload_date', tomorrow).execute()
-
             if schedule_result.data:
                 last_sent = schedule_result.data[0].get('last_reminder_sent_at')
                 if last_sent:
-                    last_dt = datetime.fromisoformat(last_sent.replace('Z', '+00:00'))
-                    now = datetime.utcnow()
+                    last_dt = _parse_pg_ts(last_sent)
+                    now = datetime.now(timezone.utc)
                     minutes_since = (now - last_dt).total_seconds() / 60
 
                     # Send every 30 minutes
@@ -510,18 +821,15 @@ class ReminderManager:
             if not status or not status.get('all_complete'):
                 return (False, {})
 
-            # Check last reminder
-            schedule_result = self.supabase.table('upload_schedules').select(
-                'last_reminder_sent_at, reminder_type'
-            ).eq('upload_date', today).execute()
-
-            if schedule_result.data:
-                last_sent = schedule_result.data[0].get('last_reminder_sent_at')
-                reminder_type = schedule_result.data[0].get('reminder_type')
+            # Check last reminder (the status already carries the schedule row)
+            schedule = status.get('schedule')
+            if schedule:
+                last_sent = schedule.get('last_reminder_sent_at')
+                reminder_type = schedule.get('reminder_type')
 
                 if last_sent and reminder_type == 'ready':
-                    last_dt = datetime.fromisoformat(last_sent.replace('Z', '+00:00'))
-                    now = datetime.utcnow()
+                    last_dt = _parse_pg_ts(last_sent)
+                    now = datetime.now(timezone.utc)
                     hours_since = (now - last_dt).total_seconds() / 3600
 
                     # Send every 3 hours
@@ -556,22 +864,38 @@ class ReminderManager:
             True if logged successfully
         """
         try:
-            # Insert into reminder_logs
-            log_data = {
-                'reminder_type': reminder_type,
-                'upload_date': upload_date,
-                'message_text': message_text,
-                'incomplete_count': incomplete_count,
-                'channels_mentioned': channels_mentioned or []
-            }
-
-            self.supabase.table('reminder_logs').insert(log_data).execute()
-
-            # Update upload_schedules
-            self.supabase.table('upload_schedules').update({
-                'last_reminder_sent_at': datetime.utcnow().isoformat(),
-                'reminder_type': reminder_type
-            }).eq('upload_date', upload_date).execute()
+            # Insert into reminder_logs + update upload_schedules atomically
+            # in one round trip (log_reminder_and_update RPC)
+            try:
+                query = self.supabase.rpc('log_reminder_and_update', {
+                    'p_reminder_type': reminder_type,
+                    'p_upload_date': upload_date,
+                    'p_message_text': message_text,
+                    'p_incomplete_count': incomplete_count,
+                    'p_channels_mentioned': channels_mentioned or []
+                })
+                await asyncio.to_thread(query.execute)
+            except Exception as e:
+                logger.warning(f"log_reminder_and_update RPC unavailable, using fallback: {e}")
+                log_data = {
+                    'reminder_type': reminder_type,
+                    'upload_date': upload_date,
+                    'message_text': message_text,
+                    'incomplete_count': incomplete_count,
+                    'channels_mentioned': channels_mentioned or []
+                }
+                insert_query = self.supabase.table('reminder_logs').insert(log_data)
+
+                update_query = self.supabase.table('upload_schedules').update({
+                    'last_reminder_sent_at': datetime.now(timezone.utc).isoformat(),
+                    'reminder_type': reminder_type
+                }).eq('upload_date', upload_date)
+
+                # Independent writes - run both at once
+                await asyncio.gather(
+                    asyncio.to_thread(insert_query.execute),
+                    asyncio.to_thread(update_query.execute)
+                )
 
             logger.info(f"Logged reminder: {reminder_type} for {upload_date}")
             return True
@@ -601,19 +925,18 @@ class ReminderManager:
         dt = datetime.fromisoformat(target_date)
         date_display = dt.strftime("%d-%b")
 
-        lines = [f"⚠️ TOMORROW ({date_display}) UPLOAD - INCOMPLETE\n"]
-        lines.append(f"Missing Items ({len(incomplete)} total):\n")
+        buf = io.StringIO()
+        w = buf.write
+        w(f"⚠️ TOMORROW ({date_display}) UPLOAD - INCOMPLETE\n")
+        w(f"\nMissing Items ({len(incomplete)} total):\n")
 
         # Group by channel
-        by_channel = {}
+        by_channel = defaultdict(list)
         for item in incomplete:
-            ch = item['channel_name']
-            if ch not in by_channel:
-                by_channel[ch] = []
-            by_channel[ch].append(item)
+            by_channel[item['channel_name']].append(item)
 
         for ch_name, items in sorted(by_channel.items()):
-            lines.append(f"• {ch_name}:")
+            w(f"\n• {ch_name}:")
             for item in items:
                 v_num = item['video_number']
                 missing = item['missing']
@@ -621,13 +944,13 @@ class ReminderManager:
                 script_status = "✅" if 'script' not in missing else "❌"
                 thumb_status = "✅" if 'thumbnail' not in missing else "❌"
 
-                lines.append(f"  Video {v_num}: Script {script_status} | Thumbnail {thumb_status}")
+                w(f"\n  Video {v_num}: Script {script_status} | Thumbnail {thumb_status}")
 
         # Add time remaining
 
-        lines.append("\nUse /mark_complete to update status")
+        w("\n\nUse /mark_complete to update status")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def format_today_ready_reminder(self, status: Dict[str, Any]) -> str:
         """
@@ -13,68 +13,93 @@ Handles all database operations including:
 
 import os
 import json
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from supabase import create_client, Client
-
-class SupabaseClient:
-    def __init__(self, url: Optional[str] = None, key: Optional[str] = None):
-        """Initialize Supabase client with URL and anon key"""
-        self.url = url or os.getenv("SUPABASE_URL")
-        self.key = key or os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_ANON_KEY")
-
-        if not self.url or not self.key:
-            print("⚠️ Supabase credentials not set. Use /set_supabase_url and /set_supabase_key commands.")
-            self.client = None
-            self.supabase = None
-        else:
-            try:
-                self.client: Client = create_client(self.url, self.key)
-                self.supabase = self.client  # Compatibility alias
-                print("✅ Supabase client initialized")
-            except Exception as e:
-                self.supabase = None
-                print(f"❌ Supabase connection error: {e}")
-                self.client = None
-
-    def is_connected(self) -> bool:
-        """Check if Supabase client is connected"""
-        return self.client is not None
-
-    # =============================================================================
-    # TABLE INITIALIZATION
-    # =============================================================================
-
-    def init_tables(self) -> bool:
-        """
-        Initialize all required tables.
-        NOTE: This assumes tables are already created in Supabase dashboard.
-        Returns True if tables exist, False otherwise.
-        """
-        if not self.is_connected():
-            return False
-
-        try:
-            # Check if tables exist by querying them
-            tables_to_check = [
-                'api_keys', 'youtube_channels', 'processed_videos',
-                'prompts', 'chat_configs', 'global_counter', 'audio_links',
-                'direct_script_audio'
-            ]
-
-            for table in tables_to_check:
-                self.client.table(table).select("*").limit(1).execute()
-
-            print("✅ All Supabase tables verified")
-            return True
-        except Exception as e:
-            print(f"⚠️ Table check failed: {e}")
-            print("📝 Please create tables using SQL schema in Supabase dashboard")
-            return False
-
-    def get_table_creation_sql(self) -> str:
-        """Return SQL for creating all required tables"""
-        return """
+import logging
+import time
+import asyncio
+import threading
+import importlib.util
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Tuple
+import httpx
+from supabase import create_client, Client, ClientOptions
+from realtime import AsyncRealtimeClient
+
+logger = logging.getLogger(__name__)
+
+# Optional: faster JSON decoding for legacy string-encoded videos_json rows
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: direct Postgres fast path through the Supavisor pooler
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
+
+# Transaction-mode Supavisor DSN (port 6543); the fast path stays off when unset
+SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL")
+
+# API keys, prompts and cached channels change rarely; reuse reads for this many seconds
+READ_CACHE_TTL = 60
+
+# The global image folder is read on every video settings lookup; reuse it for this many seconds
+IMAGE_FOLDER_CACHE_TTL = 30
+
+# The default reference row only changes on an admin re-upload
+DEFAULT_REFERENCE_CACHE_TTL = 300
+
+# API key last_used/usage_count bumps are batched into one write per this many seconds
+API_KEY_USAGE_FLUSH_SECONDS = 5
+
+# Columns returned by get_processed_scripts unless the caller asks for fewer
+PROCESSED_SCRIPT_FIELDS = (
+    'id', 'channel_folder', 'channel_shortform', 'script_filename', 'script_path',
+    'audio_counter', 'gofile_link', 'gdrive_file_id', 'processed_at'
+)
+
+# Rows per page when preloading processed script keys (PostgREST max-rows default)
+PROCESSED_SCRIPTS_PAGE_SIZE = 1000
+
+# Default page size for the pending audio queues
+PENDING_PAGE_SIZE = 500
+
+# Rows per bulk insert request
+INSERT_BATCH_SIZE = 500
+
+# Storage downloads: signed URL lifetime (seconds)
+DOWNLOAD_URL_EXPIRES = 300
+
+# Image folders by number: (name, env var). The env vars don't change at runtime,
+# so their ids are resolved once into the parallel _FOLDER_IDS tuple.
+_FOLDER_TABLE = (
+    ('Nature', 'GDRIVE_IMAGE_FOLDER_DEFAULT'),
+    ('Jesus', 'GDRIVE_IMAGE_FOLDER_JESUS'),
+    ('Shorts', 'GDRIVE_IMAGE_FOLDER_SHORTS'),
+)
+_FOLDER_IDS = tuple(os.getenv(env_var) for _, env_var in _FOLDER_TABLE)
+_DEFAULT_FOLDER = _FOLDER_IDS[0]
+_JESUS_FOLDER = _FOLDER_IDS[1]
+
+# Folder number → {id, name}, for get_folder_mapping callers
+_FOLDER_MAP = {
+    number: {'id': _FOLDER_IDS[number], 'name': name}
+    for number, (name, _) in enumerate(_FOLDER_TABLE)
+}
+
+# Tables init_tables probes for
+REQUIRED_TABLES = frozenset({
+    'api_keys', 'youtube_channels', 'processed_videos',
+    'prompts', 'chat_configs', 'global_counter', 'audio_links',
+    'direct_script_audio'
+})
+
+# Schema returned by get_table_creation_sql (paste into the Supabase SQL editor)
+_TABLE_SQL = """
 -- API Keys Table
 CREATE TABLE IF NOT EXISTS api_keys (
     id BIGSERIAL PRIMARY KEY,
@@ -86,6 +111,12 @@ CREATE TABLE IF NOT EXISTS api_keys (
     usage_count INTEGER DEFAULT 0
 );
 
+-- One row per key (also the store_api_key upsert conflict target)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_api_keys_key ON api_keys (api_key);
+
+-- Least-recently-used active key per type (partial index skips exhausted keys)
+CREATE INDEX IF NOT EXISTS idx_api_keys_active_lru ON api_keys (key_type, last_used) WHERE is_active;
+
 -- YouTube Channels Table
 CREATE TABLE IF NOT EXISTS youtube_channels (
     id BIGSERIAL PRIMARY KEY,
@@ -118,6 +149,9 @@ CREATE TABLE IF NOT EXISTS prompts (
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- One prompt per type (also the save_prompt upsert conflict target)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_prompts_type ON prompts (prompt_type);
+
 -- Chat Configs Table
 CREATE TABLE IF NOT EXISTS chat_configs (
     id BIGSERIAL PRIMARY KEY,
@@ -169,8 +203,497 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
     uploaded_at TIMESTAMPTZ DEFAULT NOW(),
     CHECK (id = 1)  -- Ensure only one row (single master reference)
 );
+
+-- =============================================================================
+-- Server-side timestamps
+-- =============================================================================
+
+-- Stamp updated_at on every UPDATE (and upsert conflict) instead of trusting client clocks
+CREATE OR REPLACE FUNCTION set_updated_at()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS t_touch_updated ON prompts;
+CREATE TRIGGER t_touch_updated BEFORE UPDATE ON prompts
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+DROP TRIGGER IF EXISTS t_touch_updated ON global_counter;
+CREATE TRIGGER t_touch_updated BEFORE UPDATE ON global_counter
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+-- =============================================================================
+-- API key usage
+-- =============================================================================
+
+-- Apply a batch of key hand-outs: newest last_used, usage_count += times used
+CREATE OR REPLACE FUNCTION bump_api_keys_used(p_keys TEXT[], p_ts TIMESTAMPTZ DEFAULT NOW())
+RETURNS VOID
+LANGUAGE sql AS $$
+    UPDATE api_keys k
+    SET last_used = GREATEST(k.last_used, p_ts),
+        usage_count = COALESCE(k.usage_count, 0) + u.uses
+    FROM (
+        SELECT key, COUNT(*) AS uses
+        FROM unnest(p_keys) AS key
+        GROUP BY key
+    ) u
+    WHERE k.api_key = u.key;
+$$;
+
+-- =============================================================================
+-- Processed videos
+-- =============================================================================
+
+-- IDs from p_ids NOT processed since p_cutoff (order preserved)
+CREATE OR REPLACE FUNCTION filter_unprocessed(p_ids TEXT[], p_cutoff TIMESTAMPTZ)
+RETURNS TABLE (video_id TEXT)
+LANGUAGE sql STABLE AS $$
+    SELECT v.id
+    FROM unnest(p_ids) WITH ORDINALITY AS v(id, ord)
+    WHERE NOT EXISTS (
+        SELECT 1 FROM processed_videos p
+        WHERE p.video_id = v.id AND p.processed_date >= p_cutoff
+    )
+    ORDER BY v.ord;
+$$;
+
+-- =============================================================================
+-- Atomic counters (global_counter)
+-- =============================================================================
+
+-- Increment the global counter in one statement (no lost updates across workers)
+CREATE OR REPLACE FUNCTION increment_global_counter()
+RETURNS INTEGER
+LANGUAGE sql AS $$
+    UPDATE global_counter
+    SET counter = counter + 1, updated_at = NOW()
+    WHERE id = 1
+    RETURNING counter;
+$$;
+"""
+
+# Indexes, functions and migrations for tables the schema script doesn't create (see get_migration_sql)
+_MIGRATION_SQL = """
+-- Run after the schema script, once these tables exist: processed_gdrive_scripts,
+-- video_settings, channel_counters, channels, daily_uploads, upload_schedules,
+-- reminder_logs and gdrive_folders. Every statement is safe to re-run.
+
+-- Processed Google Drive scripts: one row per (folder, filename), also the is_script_processed lookup
+CREATE UNIQUE INDEX IF NOT EXISTS idx_gdrive_scripts_folder_name
+    ON processed_gdrive_scripts (channel_folder, script_filename);
+
+-- =============================================================================
+-- Server-side timestamps (tables created outside the schema script)
+-- =============================================================================
+
+-- Inserts rely on DEFAULT NOW(); give these tables the same default
+ALTER TABLE processed_gdrive_scripts ALTER COLUMN processed_at SET DEFAULT NOW();
+ALTER TABLE video_settings ALTER COLUMN updated_at SET DEFAULT NOW();
+
+-- video_settings rows used to send updated_at themselves; backfill any gaps, then require it
+UPDATE video_settings SET updated_at = NOW() WHERE updated_at IS NULL;
+ALTER TABLE video_settings ALTER COLUMN updated_at SET NOT NULL;
+
+DROP TRIGGER IF EXISTS t_touch_updated ON channel_counters;
+CREATE TRIGGER t_touch_updated BEFORE UPDATE ON channel_counters
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+DROP TRIGGER IF EXISTS t_touch_updated ON video_settings;
+CREATE TRIGGER t_touch_updated BEFORE UPDATE ON video_settings
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+-- =============================================================================
+-- Video settings
+-- =============================================================================
+
+-- Per-chat lookups (and the 'global' row) stay index scans as chats grow
+CREATE INDEX IF NOT EXISTS idx_video_settings_chat_id ON video_settings (chat_id);
+
+-- Current global image folder as a bare scalar
+CREATE OR REPLACE FUNCTION get_global_folder()
+RETURNS TEXT
+LANGUAGE sql STABLE AS $$
+    SELECT gdrive_image_folder_id FROM video_settings WHERE chat_id = 'global' LIMIT 1;
+$$;
+
+-- =============================================================================
+-- Realtime
+-- =============================================================================
+
+-- Broadcast video_settings changes over Realtime (watch_image_folder)
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_publication_tables
+        WHERE pubname = 'supabase_realtime' AND tablename = 'video_settings'
+    ) THEN
+        ALTER PUBLICATION supabase_realtime ADD TABLE video_settings;
+    END IF;
+END;
+$$;
+
+-- =============================================================================
+-- Atomic counters (channel_counters)
+-- =============================================================================
+
+-- Conflict target for the per-channel counter upsert
+CREATE UNIQUE INDEX IF NOT EXISTS idx_channel_counters_name
+    ON channel_counters (channel_name);
+
+-- Create-or-increment a channel counter in one statement (new channels start at 1)
+CREATE OR REPLACE FUNCTION increment_channel_counter(p_channel_name TEXT)
+RETURNS INTEGER
+LANGUAGE sql AS $$
+    INSERT INTO channel_counters (channel_name, counter)
+    VALUES (p_channel_name, 1)
+    ON CONFLICT (channel_name) DO UPDATE
+    SET counter = channel_counters.counter + 1, updated_at = NOW()
+    RETURNING counter;
+$$;
+
+-- =============================================================================
+-- 7-Day Orchestrator helpers (channels / daily_uploads)
+-- =============================================================================
+
+-- Per-channel upload stats in one round trip
+CREATE OR REPLACE FUNCTION get_channel_stats(p_channel_name TEXT)
+RETURNS TABLE (
+    channel_name TEXT,
+    total_videos BIGINT,
+    completed_videos BIGINT,
+    is_active BOOLEAN
+)
+LANGUAGE sql STABLE AS $$
+    SELECT c.channel_name,
+           COUNT(u.id),
+           COUNT(u.id) FILTER (WHERE u.video_status = 'completed'),
+           c.is_active
+    FROM channels c
+    LEFT JOIN daily_uploads u ON u.channel_id = c.id
+    WHERE c.channel_name = p_channel_name
+    GROUP BY c.id;
+$$;
+
+-- Upload stats for every channel in one round trip
+CREATE OR REPLACE FUNCTION get_all_channel_stats(p_active_only BOOLEAN DEFAULT true)
+RETURNS TABLE (
+    channel_name TEXT,
+    total_videos BIGINT,
+    completed_videos BIGINT,
+    is_active BOOLEAN
+)
+LANGUAGE sql STABLE AS $$
+    SELECT c.channel_name,
+           COUNT(u.id),
+           COUNT(u.id) FILTER (WHERE u.video_status = 'completed'),
+           c.is_active
+    FROM channels c
+    LEFT JOIN daily_uploads u ON u.channel_id = c.id
+    WHERE NOT p_active_only OR c.is_active
+    GROUP BY c.id
+    ORDER BY c.channel_name;
+$$;
+
+-- Natural key for daily_uploads (also the upsert conflict target)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_daily_uploads_key
+    ON daily_uploads (channel_id, upload_date, video_number);
+
+-- Incomplete uploads (partial index + view with the same predicate)
+CREATE INDEX IF NOT EXISTS idx_daily_uploads_incomplete ON daily_uploads (upload_date)
+    WHERE script_status = 'pending'
+       OR thumbnail_status = 'pending'
+       OR video_status <> 'completed';
+
+CREATE OR REPLACE VIEW daily_uploads_incomplete AS
+    SELECT * FROM daily_uploads
+    WHERE script_status = 'pending'
+       OR thumbnail_status = 'pending'
+       OR video_status <> 'completed';
+
+-- =============================================================================
+-- 7-Day Orchestrator helpers (upload_schedules / reminders)
+-- =============================================================================
+
+-- Create a date's skeleton and return its schedule row in one round trip
+CREATE OR REPLACE FUNCTION init_upload_schedule(p_date DATE)
+RETURNS SETOF upload_schedules
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM create_daily_uploads_skeleton(p_date);
+    RETURN QUERY SELECT * FROM upload_schedules WHERE upload_date = p_date;
+END;
+$$;
+
+-- Day status counters and per-channel breakdown, aggregated server-side
+CREATE OR REPLACE FUNCTION get_day_status_v1(target_date DATE)
+RETURNS TABLE (
+    total BIGINT,
+    scripts_ready BIGINT,
+    thumbnails_ready BIGINT,
+    videos_completed BIGINT,
+    channels JSONB
+)
+LANGUAGE sql STABLE AS $$
+    WITH day_rows AS (
+        SELECT c.channel_name, u.video_number,
+               u.script_status, u.thumbnail_status, u.video_status
+        FROM daily_uploads u
+        JOIN channels c ON c.id = u.channel_id
+        WHERE u.upload_date = get_day_status_v1.target_date
+    ),
+    per_channel AS (
+        SELECT r.channel_name,
+               COUNT(*) AS total,
+               COUNT(*) FILTER (WHERE r.video_status = 'completed') AS completed,
+               COUNT(*) FILTER (WHERE r.script_status IN ('received', 'processed')) AS scripts,
+               COUNT(*) FILTER (WHERE r.thumbnail_status = 'received') AS thumbnails,
+               (
+                   SELECT COALESCE(jsonb_agg(m.item ORDER BY r2.video_number, m.ord), '[]'::jsonb)
+                   FROM day_rows r2
+                   CROSS JOIN LATERAL (VALUES
+                       (1, CASE WHEN r2.script_status = 'pending'
+                                THEN 'V' || r2.video_number || ' script' END),
+                       (2, CASE WHEN r2.thumbnail_status = 'pending'
+                                THEN 'V' || r2.video_number || ' thumbnail' END)
+                   ) AS m(ord, item)
+                   WHERE r2.channel_name = r.channel_name AND m.item IS NOT NULL
+               ) AS missing
+        FROM day_rows r
+        GROUP BY r.channel_name
+    )
+    SELECT COALESCE(SUM(total), 0)::BIGINT,
+           COALESCE(SUM(scripts), 0)::BIGINT,
+           COALESCE(SUM(thumbnails), 0)::BIGINT,
+           COALESCE(SUM(completed), 0)::BIGINT,
+           COALESCE(
+               jsonb_object_agg(
+                   channel_name,
+                   jsonb_build_object(
+                       'total', total,
+                       'completed', completed,
+                       'scripts', scripts,
+                       'thumbnails', thumbnails,
+                       'missing', missing
+                   )
+               ),
+               '{}'::jsonb
+           )
+    FROM per_channel;
+$$;
+
+-- Log a sent reminder and stamp the schedule in one transaction
+CREATE OR REPLACE FUNCTION log_reminder_and_update(
+    p_reminder_type TEXT,
+    p_upload_date DATE,
+    p_message_text TEXT,
+    p_incomplete_count INTEGER DEFAULT 0,
+    p_channels_mentioned TEXT[] DEFAULT '{}'
+)
+RETURNS VOID
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO reminder_logs (
+        reminder_type, upload_date, message_text, incomplete_count, channels_mentioned
+    )
+    VALUES (
+        p_reminder_type, p_upload_date, p_message_text, p_incomplete_count, p_channels_mentioned
+    );
+
+    UPDATE upload_schedules
+    SET last_reminder_sent_at = now(), reminder_type = p_reminder_type
+    WHERE upload_date = p_upload_date;
+END;
+$$;
+
+-- =============================================================================
+-- 7-Day Orchestrator helpers (gdrive_folders)
+-- =============================================================================
+
+-- Folder links are stored at creation time
+ALTER TABLE gdrive_folders ADD COLUMN IF NOT EXISTS web_view_link TEXT;
+
+-- Video folder lookup by (date, channel, video number)
+CREATE INDEX IF NOT EXISTS idx_gdrive_folders_lookup
+    ON gdrive_folders (folder_date, channel_name, video_number)
+    WHERE is_active;
+
+-- Archive folders older than p_days_old days, returning only the count
+CREATE OR REPLACE FUNCTION archive_old_folders(p_days_old INTEGER DEFAULT 1)
+RETURNS INTEGER
+LANGUAGE sql AS $$
+    WITH archived AS (
+        UPDATE gdrive_folders
+        SET is_active = false, archived_at = now()
+        WHERE folder_date < current_date - p_days_old
+          AND is_active
+        RETURNING 1
+    )
+    SELECT COUNT(*)::INTEGER FROM archived;
+$$;
+"""
+
+# Optional nightly archive_old_folders job (needs pg_cron enabled; see get_archive_cron_sql)
+_ARCHIVE_CRON_SQL = """
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+SELECT cron.schedule(
+    'archive-old-gdrive-folders',
+    '0 3 * * *',
+    $$ SELECT archive_old_folders(1) $$
+);
 """
 
+
+class SupabaseClient:
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        key: Optional[str] = None,
+        http_client: Optional[httpx.Client] = None
+    ):
+        """
+        Initialize Supabase client with URL and anon key.
+
+        Every instance runs on the process-wide keep-alive pool unless an
+        explicit http_client is passed, so building extra SupabaseClient
+        objects no longer costs a fresh TCP/TLS handshake per call.
+        """
+        self.url = url or os.getenv("SUPABASE_URL")
+        self.key = key or os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_ANON_KEY")
+
+        if not self.url or not self.key:
+            logger.warning("Supabase credentials not set. Use /set_supabase_url and /set_supabase_key commands.")
+            self.client = None
+            self.supabase = None
+        else:
+            try:
+                self._http = http_client or _get_http_client()
+                options = ClientOptions(httpx_client=self._http)
+                self.client: Client = create_client(self.url, self.key, options)
+                self.supabase = self.client  # Compatibility alias
+
+                # Prebuilt PostgREST URL/headers for the hottest reads (see _pgrst_get)
+                self._pgrst_base = f"{self.url.rstrip('/')}/rest/v1"
+                self._pgrst_headers = {'apikey': self.key, 'Authorization': f'Bearer {self.key}'}
+                self._pgrst_object_headers = {
+                    **self._pgrst_headers,
+                    'Accept': 'application/vnd.pgrst.object+json'
+                }
+
+                # Table builders for the per-message settings paths; each query
+                # method returns a fresh request, so reusing these is safe
+                self._t_video_settings = self.client.table('video_settings')
+                self._t_default_ref = self.client.table('default_reference_audio')
+                self._t_video_outputs = self.client.table('video_outputs')
+                logger.info("Supabase client initialized")
+            except Exception:
+                self.supabase = None
+                logger.exception("Supabase connection error")
+                self.client = None
+
+        # Small pool for overlapping independent round trips inside one call
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
+
+        # Single worker for fire-and-forget log inserts (keeps them in order)
+        self._log_pool = ThreadPoolExecutor(max_workers=1)
+
+        # (expires_at, folder_id) for get_current_image_folder
+        self._folder_cache: Tuple[float, Optional[str]] = (0.0, None)
+
+        # Realtime connection behind watch_image_folder (opt-in)
+        self._realtime: Optional[AsyncRealtimeClient] = None
+
+        # (expires_at, metadata) for get_default_reference
+        self._default_ref_cache: Tuple[float, Optional[Dict]] = (0.0, None)
+
+        # (method, arg) -> (expires_at, value) for read-mostly lookups
+        self._read_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+
+        # (channel_folder, script_filename) known to be processed; only ever grows
+        self._processed_scripts: Optional[set] = None
+
+        # API keys handed out since the last usage flush
+        self._key_usage: deque = deque()
+        self._key_usage_timer: Optional[threading.Timer] = None
+        self._key_usage_lock = threading.Lock()
+
+        # asyncpg pool for the hot async paths (created lazily on first use)
+        self._pg_pool = None
+        self._pg_pool_lock: Optional[asyncio.Lock] = None
+
+    def is_connected(self) -> bool:
+        """Check if Supabase client is connected"""
+        return self.client is not None
+
+    def _get_cached(self, key: Tuple[str, str]) -> Optional[Any]:
+        """Return a cached read if it has not expired"""
+        entry = self._read_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _set_cached(self, key: Tuple[str, str], value: Any):
+        """Cache a read for READ_CACHE_TTL seconds"""
+        self._read_cache[key] = (time.monotonic() + READ_CACHE_TTL, value)
+
+    def _invalidate_cached(self, method: str):
+        """Drop every cached read of one method"""
+        for key in [k for k in self._read_cache if k[0] == method]:
+            del self._read_cache[key]
+
+    # =============================================================================
+    # TABLE INITIALIZATION
+    # =============================================================================
+
+    def init_tables(self) -> bool:
+        """
+        Initialize all required tables.
+        NOTE: This assumes tables are already created in Supabase dashboard.
+        Returns True if tables exist, False otherwise.
+        """
+        if not self.is_connected():
+            return False
+
+        try:
+            # Check if tables exist by probing them concurrently (~1 round trip instead of 8)
+            def probe(table):
+                return self.client.table(table).select("id").limit(1).execute()
+
+            with ThreadPoolExecutor(max_workers=len(REQUIRED_TABLES)) as pool:
+                list(pool.map(probe, REQUIRED_TABLES))
+
+            logger.info("All Supabase tables verified")
+            return True
+        except Exception as e:
+            logger.warning("Table check failed: %s", e)
+            logger.warning("Please create tables using SQL schema in Supabase dashboard")
+            return False
+
+    def get_table_creation_sql(self) -> str:
+        """Return SQL for creating all required tables"""
+        return _TABLE_SQL
+
+    def get_migration_sql(self) -> str:
+        """
+        Return SQL for the tables created outside get_table_creation_sql
+        (video_settings, channel_counters, the 7-Day tables, ...): indexes,
+        triggers, RPC functions and the updated_at backfill. Run it after the
+        schema script, once those tables exist.
+        """
+        return _MIGRATION_SQL
+
+    def get_archive_cron_sql(self) -> str:
+        """
+        Return optional SQL that schedules archive_old_folders nightly inside
+        the database. Only for projects with the pg_cron extension available;
+        without it, call GDriveFolderManager.archive_old_folders on demand.
+        """
+        return _ARCHIVE_CRON_SQL
+
     # =============================================================================
     # API KEY MANAGEMENT
     # =============================================================================
@@ -181,27 +704,19 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             return False
 
         try:
-            # Check if key already exists
-            result = self.client.table('api_keys').select('*').eq('api_key', api_key).execute()
-
-            if result.data:
-                # Update existing key
-                self.client.table('api_keys').update({
-                    'is_active': True,
-                    'last_used': datetime.now().isoformat()
-                }).eq('api_key', api_key).execute()
-            else:
-                # Insert new key
-                self.client.table('api_keys').insert({
-                    'key_type': key_type,
-                    'api_key': api_key,
-                    'is_active': True
-                }).execute()
-
-            print(f"✅ {key_type} API key stored")
+            # Insert new key or reactivate an existing one in one round trip
+            self.client.table('api_keys').upsert({
+                'key_type': key_type,
+                'api_key': api_key,
+                'is_active': True,
+                'last_used': datetime.now(timezone.utc).isoformat()
+            }, on_conflict='api_key').execute()
+
+            self._invalidate_cached('get_active_api_key')
+            logger.info("%s API key stored", key_type)
             return True
-        except Exception as e:
-            print(f"❌ Error storing API key: {e}")
+        except Exception:
+            logger.exception("Error storing API key")
             return False
 
     def get_active_api_key(self, key_type: str) -> Optional[str]:
@@ -209,6 +724,12 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
         if not self.is_connected():
             return None
 
+        cache_key = ('get_active_api_key', key_type)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            self._record_key_usage(cached)
+            return cached
+
         try:
             result = self.client.table('api_keys')\
                 .select('api_key')\
@@ -220,17 +741,49 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
 
             if result.data:
                 key = result.data[0]['api_key']
-                # Update last_used
-                self.client.table('api_keys')\
-                    .update({'last_used': datetime.now().isoformat()})\
-                    .eq('api_key', key)\
-                    .execute()
+                self._record_key_usage(key)
+                self._set_cached(cache_key, key)
                 return key
             return None
-        except Exception as e:
-            print(f"❌ Error getting API key: {e}")
+        except Exception:
+            logger.exception("Error getting API key")
             return None
 
+    def _record_key_usage(self, api_key: str):
+        """Queue a last_used/usage_count bump; flushed in batches off the read path"""
+        self._key_usage.append(api_key)
+        with self._key_usage_lock:
+            if self._key_usage_timer is None:
+                self._key_usage_timer = threading.Timer(
+                    API_KEY_USAGE_FLUSH_SECONDS, self.flush_key_usage
+                )
+                self._key_usage_timer.daemon = True
+                self._key_usage_timer.start()
+
+    def flush_key_usage(self):
+        """Write queued API key usage in one round trip"""
+        with self._key_usage_lock:
+            self._key_usage_timer = None
+        keys = []
+        while self._key_usage:
+            keys.append(self._key_usage.popleft())
+        if not keys or not self.is_connected():
+            return
+
+        # One UTC timestamp for the whole batch
+        now_iso = datetime.now(timezone.utc).isoformat()
+        try:
+            self.client.rpc('bump_api_keys_used', {'p_keys': keys, 'p_ts': now_iso}).execute()
+        except Exception as e:
+            logger.warning("bump_api_keys_used RPC unavailable, using fallback: %s", e)
+            try:
+                self.client.table('api_keys')\
+                    .update({'last_used': now_iso})\
+                    .in_('api_key', list(set(keys)))\
+                    .execute()
+            except Exception:
+                logger.exception("Error updating API key usage")
+
     def mark_key_exhausted(self, api_key: str) -> bool:
         """Mark an API key as exhausted (inactive)"""
         if not self.is_connected():
@@ -241,10 +794,11 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
                 .update({'is_active': False})\
                 .eq('api_key', api_key)\
                 .execute()
-            print(f"⚠️ API key marked as exhausted")
+            self._invalidate_cached('get_active_api_key')
+            logger.warning("API key marked as exhausted")
             return True
-        except Exception as e:
-            print(f"❌ Error marking key exhausted: {e}")
+        except Exception:
+            logger.exception("Error marking key exhausted")
             return False
 
     def rotate_supadata_key(self) -> Optional[str]:
@@ -265,8 +819,8 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
                 .execute()
 
             return result.data if result.data else []
-        except Exception as e:
-            print(f"❌ Error getting API keys status: {e}")
+        except Exception:
+            logger.exception("Error getting API keys status")
             return []
 
     # =============================================================================
@@ -284,18 +838,19 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
                 'channel_url': channel_url,
                 'channel_id': channel_id,
                 'channel_name': channel_name,
-                'videos_json': json.dumps(videos),
-                'last_updated': datetime.now().isoformat()
+                'videos_json': videos,  # JSONB column: sent as native JSON, no double encoding
+                'last_updated': datetime.now(timezone.utc).isoformat()
             }
 
             # Upsert (insert or update) - use channel_url as conflict resolution key
             self.client.table('youtube_channels')\
                 .upsert(data, on_conflict='channel_url')\
                 .execute()
-            print(f"✅ Channel cached: {channel_name} ({len(videos)} videos)")
+            self._read_cache.pop(('get_youtube_channel', channel_url), None)
+            logger.info("Channel cached: %s (%s videos)", channel_name, len(videos))
             return True
-        except Exception as e:
-            print(f"❌ Error storing channel: {e}")
+        except Exception:
+            logger.exception("Error storing channel")
             return False
 
     def get_youtube_channel(self, channel_url: str) -> Optional[Dict]:
@@ -303,23 +858,70 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
         if not self.is_connected():
             return None
 
+        cache_key = ('get_youtube_channel', channel_url)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             result = self.client.table('youtube_channels')\
-                .select('*')\
+                .select('channel_url, channel_id, channel_name, videos_json, last_updated')\
                 .eq('channel_url', channel_url)\
                 .execute()
 
             if result.data:
                 channel = result.data[0]
-                # Parse videos JSON
-                if channel.get('videos_json'):
-                    channel['videos'] = json.loads(channel['videos_json'])
+                videos = self._decode_videos(channel.get('videos_json'))
+                if videos:
+                    channel['videos'] = videos
+                self._set_cached(cache_key, channel)
                 return channel
             return None
-        except Exception as e:
-            print(f"❌ Error getting channel: {e}")
+        except Exception:
+            logger.exception("Error getting channel")
+            return None
+
+    def get_youtube_channel_meta(self, channel_url: str) -> Optional[Dict]:
+        """Get cached channel id/name/last_updated without the videos_json payload"""
+        if not self.is_connected():
+            return None
+
+        try:
+            result = self.client.table('youtube_channels')\
+                .select('channel_url, channel_id, channel_name, last_updated')\
+                .eq('channel_url', channel_url)\
+                .execute()
+
+            return result.data[0] if result.data else None
+        except Exception:
+            logger.exception("Error getting channel")
             return None
 
+    def get_youtube_channel_videos(self, channel_url: str) -> List[Dict]:
+        """Get only the cached video list of a channel"""
+        if not self.is_connected():
+            return []
+
+        try:
+            result = self.client.table('youtube_channels')\
+                .select('videos_json')\
+                .eq('channel_url', channel_url)\
+                .execute()
+
+            if result.data:
+                return self._decode_videos(result.data[0].get('videos_json')) or []
+            return []
+        except Exception:
+            logger.exception("Error getting channel videos")
+            return []
+
+    @staticmethod
+    def _decode_videos(videos: Any) -> Optional[List[Dict]]:
+        """JSONB comes back parsed; rows written before native JSONB hold a JSON string"""
+        if isinstance(videos, str):
+            return orjson.loads(videos) if orjson else json.loads(videos)
+        return videos
+
     def mark_video_processed(self, video_id: str, video_url: str, channel_id: str,
                             chat_id: str, audio_counter: int) -> bool:
         """Mark a video as processed"""
@@ -331,14 +933,39 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
                 'video_id': video_id,
                 'video_url': video_url,
                 'channel_id': channel_id,
-                'processed_date': datetime.now().isoformat(),
                 'chat_id': chat_id,
                 'audio_counter': audio_counter
             }).execute()
-            print(f"✅ Video marked as processed: {video_id}")
+            logger.debug("Video marked as processed: %s", video_id)
             return True
-        except Exception as e:
-            print(f"❌ Error marking video processed: {e}")
+        except Exception:
+            logger.exception("Error marking video processed")
+            return False
+
+    def mark_videos_processed(self, rows: List[Dict]) -> bool:
+        """
+        Mark many videos as processed with one insert per INSERT_BATCH_SIZE rows.
+
+        Args:
+            rows: Dicts with video_id, video_url, channel_id, chat_id, audio_counter
+
+        Returns:
+            bool: True if every batch was stored
+        """
+        if not self.is_connected():
+            return False
+        if not rows:
+            return True
+
+        try:
+            for start in range(0, len(rows), INSERT_BATCH_SIZE):
+                self.client.table('processed_videos')\
+                    .insert(rows[start:start + INSERT_BATCH_SIZE])\
+                    .execute()
+            logger.debug("%d videos marked as processed", len(rows))
+            return True
+        except Exception:
+            logger.exception("Error marking videos processed")
             return False
 
     def get_unprocessed_videos(self, video_ids: List[str], days: int = 15) -> List[str]:
@@ -350,7 +977,18 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             return video_ids  # Return all if DB not connected
 
         try:
-            cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+            cutoff_date = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+
+            try:
+                # Server-side NOT EXISTS: only the unprocessed IDs come back
+                result = self.client.rpc(
+                    'filter_unprocessed', {'p_ids': video_ids, 'p_cutoff': cutoff_date}
+                ).execute()
+                unprocessed = [row['video_id'] for row in result.data or []]
+                logger.debug("Unprocessed videos: %d/%d (last %d days)", len(unprocessed), len(video_ids), days)
+                return unprocessed
+            except Exception as e:
+                logger.warning("filter_unprocessed RPC unavailable, using fallback: %s", e)
 
             # Get recently processed video IDs
             result = self.client.table('processed_videos')\
@@ -363,10 +1001,10 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
 
             # Return videos NOT in recent list
             unprocessed = [vid for vid in video_ids if vid not in recent_ids]
-            print(f"📊 Unprocessed videos: {len(unprocessed)}/{len(video_ids)} (last {days} days)")
+            logger.debug("Unprocessed videos: %d/%d (last %d days)", len(unprocessed), len(video_ids), days)
             return unprocessed
-        except Exception as e:
-            print(f"❌ Error checking processed videos: {e}")
+        except Exception:
+            logger.exception("Error checking processed videos")
             return video_ids  # Return all on error
 
     # =============================================================================
@@ -387,8 +1025,8 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             if result.data:
                 return result.data[0]['counter']
             return 0
-        except Exception as e:
-            print(f"❌ Error getting counter: {e}")
+        except Exception:
+            logger.exception("Error getting counter")
             return 0
 
     def increment_counter(self) -> int:
@@ -397,28 +1035,109 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             return 0
 
         try:
-            # Use PostgreSQL RPC for atomic increment
-            # This ensures no race conditions between workers
+            # Single UPDATE ... RETURNING on the server - no race between workers
             result = self.client.rpc('increment_global_counter').execute()
+            if result.data is None:
+                raise RuntimeError("increment_global_counter returned no row")
+            return result.data
+        except Exception:
+            logger.exception("Error incrementing counter")
+            # Emergency fallback: use timestamp-based unique ID
+            return int(time.time() * 1000) % 1000000
 
-            if result.data:
-                return result.data
+    # =============================================================================
+    # DIRECT POSTGRES FAST PATH (asyncpg via Supavisor transaction pooler)
+    # =============================================================================
 
-            # Fallback: If RPC not available, use non-atomic method
-            current = self.get_counter()
-            new_value = current + 1
+    async def _get_pg_pool(self):
+        """
+        Get the asyncpg pool, or None when asyncpg/SUPABASE_DB_URL are missing.
+        Callers fall back to the PostgREST methods in that case.
+        """
+        if asyncpg is None or not SUPABASE_DB_URL:
+            return None
+        if self._pg_pool is not None:
+            return self._pg_pool
+
+        if self._pg_pool_lock is None:
+            self._pg_pool_lock = asyncio.Lock()
+        async with self._pg_pool_lock:
+            if self._pg_pool is None:
+                try:
+                    # Supavisor transaction mode can't keep prepared statements
+                    self._pg_pool = await asyncpg.create_pool(
+                        dsn=SUPABASE_DB_URL,
+                        min_size=2,
+                        max_size=10,
+                        statement_cache_size=0
+                    )
+                    logger.info("Postgres pool initialized")
+                except Exception as e:
+                    logger.warning("Postgres pool unavailable, using REST: %s", e)
+                    return None
+        return self._pg_pool
+
+    async def aget_counter(self) -> int:
+        """Async get_counter: direct SQL when the pool is available"""
+        pool = await self._get_pg_pool()
+        if pool is None:
+            return await asyncio.to_thread(self.get_counter)
 
-            self.client.table('global_counter')\
-                .update({'counter': new_value, 'updated_at': datetime.now().isoformat()})\
-                .eq('id', 1)\
-                .execute()
+        try:
+            value = await pool.fetchval("SELECT counter FROM global_counter WHERE id = 1")
+            return value or 0
+        except Exception:
+            logger.exception("Error getting counter")
+            return 0
 
-            return new_value
+    async def aincrement_counter(self) -> int:
+        """Async increment_counter: one atomic UPDATE ... RETURNING"""
+        pool = await self._get_pg_pool()
+        if pool is None:
+            return await asyncio.to_thread(self.increment_counter)
+
+        try:
+            conn = await pool.acquire()
         except Exception as e:
-            print(f"❌ Error incrementing counter: {e}")
-            # Emergency fallback: use timestamp-based unique ID
-            import time
+            # No connection, so the UPDATE never ran: REST can't double count
+            logger.warning("Postgres connection unavailable, using REST: %s", e)
+            return await asyncio.to_thread(self.increment_counter)
+
+        try:
+            value = await conn.fetchval(
+                "UPDATE global_counter SET counter = counter + 1, updated_at = NOW() "
+                "WHERE id = 1 RETURNING counter"
+            )
+            if value is None:
+                raise RuntimeError("global_counter row missing")
+            return value
+        except Exception:
+            # The UPDATE may have committed; retrying over REST could count twice
+            logger.exception("Error incrementing counter")
+            # Emergency fallback: use timestamp-based unique ID (same as increment_counter)
             return int(time.time() * 1000) % 1000000
+        finally:
+            await pool.release(conn)
+
+    async def amark_video_processed(self, video_id: str, video_url: str, channel_id: str,
+                                    chat_id: str, audio_counter: int) -> bool:
+        """Async mark_video_processed: parameterized INSERT over the pool"""
+        pool = await self._get_pg_pool()
+        if pool is None:
+            return await asyncio.to_thread(
+                self.mark_video_processed, video_id, video_url, channel_id, chat_id, audio_counter
+            )
+
+        try:
+            await pool.execute(
+                "INSERT INTO processed_videos (video_id, video_url, channel_id, chat_id, audio_counter) "
+                "VALUES ($1, $2, $3, $4, $5)",
+                video_id, video_url, channel_id, chat_id, audio_counter
+            )
+            return True
+        except Exception:
+            logger.exception("Error marking video processed")
+            return False
 
     # =============================================================================
     # CHANNEL-SPECIFIC COUNTER (for channel-wise audio numbering)
@@ -438,8 +1157,8 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             if result.data and len(result.data) > 0:
                 return result.data[0]['counter']
             return 0
-        except Exception as e:
-            print(f"❌ Error getting channel counter for {channel_name}: {e}")
+        except Exception:
+            logger.exception("Error getting channel counter for %s", channel_name)
             return 0
 
     def increment_channel_counter(self, channel_name: str) -> int:
@@ -451,33 +1170,18 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             return 0
 
         try:
-            # Check if counter exists for this channel
-            current = self.get_channel_counter(channel_name)
-
-            if current > 0:
-                # Channel exists, increment counter
-                new_value = current + 1
-                self.client.table('channel_counters')\
-                    .update({'counter': new_value, 'updated_at': datetime.now().isoformat()})\
-                    .eq('channel_name', channel_name)\
-                    .execute()
-                print(f"✅ Channel '{channel_name}' counter: {current} → {new_value}")
-                return new_value
-            else:
-                # New channel, create entry with counter = 1
-                self.client.table('channel_counters')\
-                    .insert({
-                        'channel_name': channel_name,
-                        'counter': 1,
-                        'created_at': datetime.now().isoformat(),
-                        'updated_at': datetime.now().isoformat()
-                    })\
-                    .execute()
-                print(f"✅ New channel '{channel_name}' created with counter = 1")
-                return 1
+            # One upsert on the server: insert at 1 or bump the existing row
+            result = self.client.rpc(
+                'increment_channel_counter', {'p_channel_name': channel_name}
+            ).execute()
+            if result.data is None:
+                raise RuntimeError("increment_channel_counter returned no row")
+
+            logger.debug("Channel '%s' counter → %s", channel_name, result.data)
+            return result.data
 
-        except Exception as e:
-            print(f"❌ Error incrementing channel counter for {channel_name}: {e}")
+        except Exception:
+            logger.exception("Error incrementing channel counter for %s", channel_name)
             # Fallback: return timestamp-based counter
             return int(datetime.now().timestamp()) % 10000
 
@@ -485,21 +1189,53 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
     # GOOGLE DRIVE SCRIPT PROCESSING TRACKING
     # =============================================================================
 
+    def _load_processed_scripts(self) -> set:
+        """Load every processed (channel_folder, script_filename) key once, page by page"""
+        keys = set()
+        start = 0
+        while True:
+            result = self.client.table('processed_gdrive_scripts')\
+                .select('channel_folder, script_filename')\
+                .order('id')\
+                .range(start, start + PROCESSED_SCRIPTS_PAGE_SIZE - 1)\
+                .execute()
+            rows = result.data or []
+            keys.update((row['channel_folder'], row['script_filename']) for row in rows)
+            if len(rows) < PROCESSED_SCRIPTS_PAGE_SIZE:
+                return keys
+            start += PROCESSED_SCRIPTS_PAGE_SIZE
+
     def is_script_processed(self, channel_folder: str, script_filename: str) -> bool:
-        """Check if a Google Drive script has been processed"""
+        """
+        Check if a Google Drive script has been processed.
+
+        Processed scripts never become unprocessed, so keys seen once (preloaded
+        on first call or marked here) are answered locally. Misses still ask the
+        DB because another worker may have processed the script since.
+        """
         if not self.is_connected():
             return False
 
+        key = (channel_folder, script_filename)
         try:
+            if self._processed_scripts is None:
+                self._processed_scripts = self._load_processed_scripts()
+            if key in self._processed_scripts:
+                return True
+
+            # HEAD request: the count arrives in Content-Range, no row body
             result = self.client.table('processed_gdrive_scripts')\
-                .select('id')\
+                .select('id', count='exact', head=True)\
                 .eq('channel_folder', channel_folder)\
                 .eq('script_filename', script_filename)\
                 .execute()
 
-            return len(result.data) > 0
+            if result.count:
+                self._processed_scripts.add(key)
+                return True
+            return False
         except Exception as e:
-            print(f"⚠️ Error checking script status: {e}")
+            logger.warning("Error checking script status: %s", e)
             return False
 
     def mark_script_processed(self, channel_folder: str, channel_shortform: str,
@@ -517,32 +1253,34 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
                 'script_path': script_path,
                 'audio_counter': audio_counter,
                 'gofile_link': gofile_link,
-                'gdrive_file_id': gdrive_file_id,
-                'processed_at': datetime.now().isoformat()
+                'gdrive_file_id': gdrive_file_id
             }
 
             self.client.table('processed_gdrive_scripts').insert(data).execute()
-            print(f"✅ Marked {script_filename} as processed (counter: {audio_counter})")
+            if self._processed_scripts is not None:
+                self._processed_scripts.add((channel_folder, script_filename))
+            logger.debug("Marked %s as processed (counter: %s)", script_filename, audio_counter)
             return True
-        except Exception as e:
-            print(f"❌ Error marking script as processed: {e}")
+        except Exception:
+            logger.exception("Error marking script as processed")
             return False
 
-    def get_processed_scripts(self, channel_folder: str = None) -> list:
-        """Get list of processed scripts (optionally filtered by channel)"""
+    def get_processed_scripts(self, channel_folder: str = None,
+                              fields: Tuple[str, ...] = PROCESSED_SCRIPT_FIELDS) -> list:
+        """Get list of processed scripts (optionally filtered by channel, only `fields` columns)"""
         if not self.is_connected():
             return []
 
         try:
-            query = self.client.table('processed_gdrive_scripts').select('*')
+            query = self.client.table('processed_gdrive_scripts').select(', '.join(fields))
 
             if channel_folder:
                 query = query.eq('channel_folder', channel_folder)
 
             result = query.order('processed_at', desc=True).execute()
             return result.data
-        except Exception as e:
-            print(f"❌ Error fetching processed scripts: {e}")
+        except Exception:
+            logger.exception("Error fetching processed scripts")
             return []
 
     # =============================================================================
@@ -555,33 +1293,21 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             return False
 
         try:
-            # Upsert based on prompt_type
+            # Upsert based on prompt_type (updated_at is stamped by the DB)
             data = {
                 'prompt_type': prompt_type,
-                'prompt_text': prompt_text,
-                'updated_at': datetime.now().isoformat()
+                'prompt_text': prompt_text
             }
 
-            # Check if exists
-            result = self.client.table('prompts')\
-                .select('id')\
-                .eq('prompt_type', prompt_type)\
+            self.client.table('prompts')\
+                .upsert(data, on_conflict='prompt_type')\
                 .execute()
 
-            if result.data:
-                # Update existing
-                self.client.table('prompts')\
-                    .update(data)\
-                    .eq('prompt_type', prompt_type)\
-                    .execute()
-            else:
-                # Insert new
-                self.client.table('prompts').insert(data).execute()
-
-            print(f"✅ {prompt_type} prompt saved")
+            self._read_cache.pop(('get_prompt', prompt_type), None)
+            logger.info("%s prompt saved", prompt_type)
             return True
-        except Exception as e:
-            print(f"❌ Error saving prompt: {e}")
+        except Exception:
+            logger.exception("Error saving prompt")
             return False
 
     def get_prompt(self, prompt_type: str) -> Optional[str]:
@@ -589,6 +1315,11 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
         if not self.is_connected():
             return None
 
+        cache_key = ('get_prompt', prompt_type)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             result = self.client.table('prompts')\
                 .select('prompt_text')\
@@ -596,10 +1327,12 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
                 .execute()
 
             if result.data:
-                return result.data[0]['prompt_text']
+                prompt_text = result.data[0]['prompt_text']
+                self._set_cached(cache_key, prompt_text)
+                return prompt_text
             return None
-        except Exception as e:
-            print(f"❌ Error getting prompt: {e}")
+        except Exception:
+            logger.exception("Error getting prompt")
             return None
 
     # =============================================================================
@@ -619,10 +1352,10 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             }
 
             self.client.table('chat_configs').upsert(data).execute()
-            print(f"✅ Chat config saved: {chat_name} ({chat_id})")
+            logger.info("Chat config saved: %s (%s)", chat_name, chat_id)
             return True
-        except Exception as e:
-            print(f"❌ Error saving chat config: {e}")
+        except Exception:
+            logger.exception("Error saving chat config")
             return False
 
     def get_active_chats(self) -> List[Dict]:
@@ -632,13 +1365,13 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
 
         try:
             result = self.client.table('chat_configs')\
-                .select('*')\
+                .select('id, chat_id, chat_name, is_active')\
                 .eq('is_active', True)\
                 .execute()
 
             return result.data if result.data else []
-        except Exception as e:
-            print(f"❌ Error getting active chats: {e}")
+        except Exception:
+            logger.exception("Error getting active chats")
             return []
 
     # =============================================================================
@@ -652,29 +1385,57 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
 
         try:
             self.client.table('audio_links').insert({
-                'enhanced_link': enhanced_link,
-                'created_at': datetime.now().isoformat()
+                'enhanced_link': enhanced_link
             }).execute()
-            print(f"✅ Audio link saved to database")
+            logger.debug("Audio link saved to database")
             return True
-        except Exception as e:
-            print(f"❌ Error saving audio link: {e}")
+        except Exception:
+            logger.exception("Error saving audio link")
+            return False
+
+    def save_audio_links(self, enhanced_links: List[str]) -> bool:
+        """Save many enhanced audio links with one insert per INSERT_BATCH_SIZE links"""
+        if not self.is_connected():
+            return False
+        if not enhanced_links:
+            return True
+
+        try:
+            for start in range(0, len(enhanced_links), INSERT_BATCH_SIZE):
+                self.client.table('audio_links').insert([
+                    {'enhanced_link': link}
+                    for link in enhanced_links[start:start + INSERT_BATCH_SIZE]
+                ]).execute()
+            logger.debug("%d audio links saved to database", len(enhanced_links))
+            return True
+        except Exception:
+            logger.exception("Error saving audio links")
             return False
 
-    def get_pending_audio_links(self) -> List[Dict]:
-        """Fetch all pending audio links from database"""
+    def get_pending_audio_links(self, limit: int = PENDING_PAGE_SIZE,
+                                after: Optional[int] = None) -> List[Dict]:
+        """
+        Fetch one page of pending audio links, oldest first.
+
+        Args:
+            limit: Max rows per page
+            after: id of the last row of the previous page (keyset cursor)
+
+        Returns:
+            list: Up to `limit` rows; an empty list means the queue is drained
+        """
         if not self.is_connected():
             return []
 
         try:
-            result = self.client.table('audio_links')\
-                .select('id, enhanced_link')\
-                .order('created_at', desc=False)\
-                .execute()
+            query = self.client.table('audio_links').select('id, enhanced_link')
+            if after is not None:
+                query = query.gt('id', after)
+            result = query.order('id').limit(limit).execute()
 
             return result.data if result.data else []
-        except Exception as e:
-            print(f"❌ Error fetching audio links: {e}")
+        except Exception:
+            logger.exception("Error fetching audio links")
             return []
 
     def delete_audio_link(self, link_id: int) -> bool:
@@ -687,10 +1448,10 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
                 .delete()\
                 .eq('id', link_id)\
                 .execute()
-            print(f"✅ Audio link deleted from database (ID: {link_id})")
+            logger.debug("Audio link deleted from database (ID: %s)", link_id)
             return True
-        except Exception as e:
-            print(f"❌ Error deleting audio link: {e}")
+        except Exception:
+            logger.exception("Error deleting audio link")
             return False
 
     # =============================================================================
@@ -706,25 +1467,21 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             return None
 
         try:
-            import os
             filename = os.path.basename(file_path)
 
-            # Read file
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
-
-            # Upload to storage
+            # Upload to storage, streaming from the file handle (never held fully in RAM)
             storage_path = f"audio/{filename}"
-            result = self.client.storage.from_(bucket_name).upload(
-                path=storage_path,
-                file=file_data,
-                file_options={"content-type": "audio/wav"}
-            )
+            with open(file_path, 'rb') as f:
+                result = self.client.storage.from_(bucket_name).upload(
+                    path=storage_path,
+                    file=f,
+                    file_options={"content-type": "audio/wav"}
+                )
 
-            print(f"✅ Raw audio uploaded to Supabase Storage: {storage_path}")
+            logger.info("Raw audio uploaded to Supabase Storage: %s", storage_path)
             return storage_path
-        except Exception as e:
-            print(f"❌ Error uploading raw audio to Supabase: {e}")
+        except Exception:
+            logger.exception("Error uploading raw audio to Supabase")
             return None
 
     def save_direct_script_audio(self, filename: str, storage_path: str,
@@ -739,29 +1496,39 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
                 'filename': filename,
                 'storage_path': storage_path,
                 'gofile_link': gofile_link,
-                'file_size_mb': file_size_mb,
-                'created_at': datetime.now().isoformat()
+                'file_size_mb': file_size_mb
             }).execute()
-            print(f"✅ Direct script audio metadata saved")
+            logger.debug("Direct script audio metadata saved")
             return True
-        except Exception as e:
-            print(f"❌ Error saving direct script audio: {e}")
+        except Exception:
+            logger.exception("Error saving direct script audio")
             return False
 
-    def get_pending_downloads(self) -> List[Dict]:
-        """Fetch all pending audio files to download from Supabase"""
+    def get_pending_downloads(self, limit: int = PENDING_PAGE_SIZE,
+                              after: Optional[int] = None) -> List[Dict]:
+        """
+        Fetch one page of pending audio files to download from Supabase, oldest first.
+
+        Args:
+            limit: Max rows per page
+            after: id of the last row of the previous page (keyset cursor)
+
+        Returns:
+            list: Up to `limit` rows; an empty list means the queue is drained
+        """
         if not self.is_connected():
             return []
 
         try:
-            result = self.client.table('direct_script_audio')\
-                .select('id, filename, storage_path, gofile_link, file_size_mb, created_at')\
-                .order('created_at', desc=False)\
-                .execute()
+            query = self.client.table('direct_script_audio')\
+                .select('id, filename, storage_path, gofile_link, file_size_mb, created_at')
+            if after is not None:
+                query = query.gt('id', after)
+            result = query.order('id').limit(limit).execute()
 
             return result.data if result.data else []
-        except Exception as e:
-            print(f"❌ Error fetching pending downloads: {e}")
+        except Exception:
+            logger.exception("Error fetching pending downloads")
             return []
 
     def download_audio_file(self, storage_path: str, local_path: str,
@@ -774,22 +1541,40 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             return False
 
         try:
-            # Download from storage
-            result = self.client.storage.from_(bucket_name).download(storage_path)
-
-            # Save to local file
-            import os
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
-
-            with open(local_path, 'wb') as f:
-                f.write(result)
-
-            print(f"✅ Audio downloaded: {os.path.basename(local_path)}")
+            self._stream_download(bucket_name, storage_path, local_path)
+            logger.info("Audio downloaded: %s", os.path.basename(local_path))
             return True
-        except Exception as e:
-            print(f"❌ Error downloading audio: {e}")
+        except Exception:
+            logger.exception("Error downloading audio")
             return False
 
+    def _stream_download(self, bucket_name: str, storage_path: str, local_path: str):
+        """
+        Stream a storage object to local_path chunk by chunk as it arrives.
+        Writes to a .part file first so a failed download never leaves a truncated file.
+        """
+        signed = self.client.storage.from_(bucket_name).create_signed_url(
+            storage_path, DOWNLOAD_URL_EXPIRES
+        )
+
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        part_path = f"{local_path}.part"
+        try:
+            with _get_http_client().stream("GET", signed['signedURL']) as response:
+                response.raise_for_status()
+                with open(part_path, 'wb') as f:
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    # No chunk_size: writing network reads as-is skips httpx's re-chunking
+                    # copy, and reads larger than the file buffer go straight to write()
+                    for chunk in response.iter_bytes():
+                        f.write(chunk)
+            os.replace(part_path, local_path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+
     def delete_direct_script_audio(self, audio_id: int, storage_path: str,
                                    bucket_name: str = "raw_audio_files") -> bool:
         """
@@ -803,19 +1588,58 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             # Delete from storage
             try:
                 self.client.storage.from_(bucket_name).remove([storage_path])
-                print(f"✅ Audio deleted from Supabase Storage: {storage_path}")
+                logger.info("Audio deleted from Supabase Storage: %s", storage_path)
             except Exception as e:
-                print(f"⚠️ Storage deletion warning: {e}")
+                logger.warning("Storage deletion warning: %s", e)
 
             # Delete from database
             self.client.table('direct_script_audio')\
                 .delete()\
                 .eq('id', audio_id)\
                 .execute()
-            print(f"✅ Audio metadata deleted from database (ID: {audio_id})")
+            logger.debug("Audio metadata deleted from database (ID: %s)", audio_id)
             return True
-        except Exception as e:
-            print(f"❌ Error deleting direct script audio: {e}")
+        except Exception:
+            logger.exception("Error deleting direct script audio")
+            return False
+
+    def delete_direct_script_audios(self, rows: List[Tuple[int, str]],
+                                    bucket_name: str = "raw_audio_files") -> bool:
+        """
+        Delete many audio files from Supabase Storage and database.
+        Two round trips total (one storage remove, one DB delete) regardless of count.
+
+        Args:
+            rows: (audio_id, storage_path) pairs
+
+        Returns:
+            bool: True if the database rows were deleted
+        """
+        if not self.is_connected():
+            return False
+        if not rows:
+            return True
+
+        audio_ids = [audio_id for audio_id, _ in rows]
+        storage_paths = [storage_path for _, storage_path in rows]
+
+        try:
+            # Delete from storage (remove() takes a list of paths)
+            try:
+                self.client.storage.from_(bucket_name).remove(storage_paths)
+                logger.info("%s audio files deleted from Supabase Storage", len(storage_paths))
+            except Exception as e:
+                logger.warning("Storage deletion warning: %s", e)
+
+            # Delete from database
+            self.client.table('direct_script_audio')\
+                .delete()\
+                .in_('id', audio_ids)\
+                .execute()
+            logger.debug("Audio metadata deleted from database (%d rows)", len(audio_ids))
+            return True
+        except Exception:
+            logger.exception("Error deleting direct script audio")
             return False
 
     # =============================================================================
@@ -832,32 +1656,23 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             return None
 
         try:
-            import os
             filename = os.path.basename(file_path)
 
-            # Read file
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
-
-            # Upload to storage
+            # Upload to storage (upsert overwrites an existing file in place)
             storage_path = f"default/{filename}"
 
-            # Delete old file if exists (replace)
-            try:
-                self.client.storage.from_(bucket_name).remove([storage_path])
-            except:
-                pass  # Ignore if doesn't exist
-
-            result = self.client.storage.from_(bucket_name).upload(
-                path=storage_path,
-                file=file_data,
-                file_options={"content-type": "audio/wav", "upsert": "true"}
-            )
+            # Stream from the file handle (never held fully in RAM)
+            with open(file_path, 'rb') as f:
+                result = self.client.storage.from_(bucket_name).upload(
+                    path=storage_path,
+                    file=f,
+                    file_options={"content-type": "audio/wav", "upsert": "true"}
+                )
 
-            print(f"✅ Default reference uploaded to Supabase Storage: {storage_path}")
+            logger.info("Default reference uploaded to Supabase Storage: %s", storage_path)
             return storage_path
-        except Exception as e:
-            print(f"❌ Error uploading default reference to Supabase: {e}")
+        except Exception:
+            logger.exception("Error uploading default reference to Supabase")
             return None
 
     def save_default_reference_metadata(self, filename: str, storage_path: str) -> bool:
@@ -870,16 +1685,17 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
 
         try:
             # Upsert (replace if exists)
-            self.client.table('default_reference_audio').upsert({
-                'id': 1,
+            metadata = {
                 'filename': filename,
                 'storage_path': storage_path,
-                'uploaded_at': datetime.now().isoformat()
-            }).execute()
-            print(f"✅ Default reference metadata saved")
+                'uploaded_at': datetime.now(timezone.utc).isoformat()
+            }
+            self._t_default_ref.upsert({'id': 1, **metadata}).execute()
+            self._default_ref_cache = (time.monotonic() + DEFAULT_REFERENCE_CACHE_TTL, metadata)
+            logger.info("Default reference metadata saved")
             return True
-        except Exception as e:
-            print(f"❌ Error saving default reference metadata: {e}")
+        except Exception:
+            logger.exception("Error saving default reference metadata")
             return False
 
     def get_default_reference(self) -> Optional[Dict]:
@@ -890,17 +1706,23 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
         if not self.is_connected():
             return None
 
+        expires_at, cached_ref = self._default_ref_cache
+        if expires_at > time.monotonic():
+            return cached_ref
+
         try:
-            result = self.client.table('default_reference_audio')\
+            result = self._t_default_ref\
                 .select('filename, storage_path, uploaded_at')\
                 .eq('id', 1)\
+                .maybe_single()\
                 .execute()
 
-            if result.data:
-                return result.data[0]
-            return None
-        except Exception as e:
-            print(f"❌ Error getting default reference: {e}")
+            ref_data = result.data if result else None
+            if ref_data:
+                self._default_ref_cache = (time.monotonic() + DEFAULT_REFERENCE_CACHE_TTL, ref_data)
+            return ref_data
+        except Exception:
+            logger.exception("Error getting default reference")
             return None
 
     def download_default_reference(self, local_path: str, bucket_name: str = "reference_audio") -> bool:
@@ -915,31 +1737,45 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             # Get metadata first
             ref_data = self.get_default_reference()
             if not ref_data:
-                print("⚠️ No default reference audio set")
+                logger.warning("No default reference audio set")
                 return False
 
             storage_path = ref_data['storage_path']
+            self._stream_download(bucket_name, storage_path, local_path)
 
-            # Download from storage
-            result = self.client.storage.from_(bucket_name).download(storage_path)
-
-            # Save to local file
-            import os
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
-
-            with open(local_path, 'wb') as f:
-                f.write(result)
-
-            print(f"✅ Default reference downloaded: {os.path.basename(local_path)}")
+            logger.info("Default reference downloaded: %s", os.path.basename(local_path))
             return True
-        except Exception as e:
-            print(f"❌ Error downloading default reference: {e}")
+        except Exception:
+            logger.exception("Error downloading default reference")
             return False
 
     # =========================================================================
     # VIDEO GENERATION SETTINGS
     # =========================================================================
 
+    def _pgrst_get(self, path, params=None, single=False):
+        """
+        GET straight from PostgREST on the pooled httpx client, skipping the
+        SDK's per-call query builder chain (used by the per-message reads)
+
+        Args:
+            path: Path under /rest/v1 (table name or rpc/<function>)
+            params: PostgREST query parameters
+            single: Request a single object; returns None when no row matches
+
+        Returns:
+            Decoded JSON body
+        """
+        response = self._http.get(
+            f"{self._pgrst_base}/{path}",
+            params=params,
+            headers=self._pgrst_object_headers if single else self._pgrst_headers
+        )
+        if single and response.status_code == 406:
+            return None  # PGRST116: no matching row
+        response.raise_for_status()
+        return orjson.loads(response.content) if orjson else response.json()
+
     def get_video_settings(self, chat_id):
         """
         Get video generation settings for a chat
@@ -954,96 +1790,117 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             if not self.is_connected():
                 return self._default_video_settings()
 
-            result = self.client.table('video_settings').select('*').eq('chat_id', str(chat_id)).execute()
+            # On a cold folder cache, look up the global folder alongside the chat row
+            folder_future = None
+            if self._folder_cache[0] <= time.monotonic():
+                folder_future = self._io_pool.submit(self.get_current_image_folder)
 
-            if result.data and len(result.data) > 0:
-                settings = result.data[0]
+            settings = self._pgrst_get('video_settings', {
+                'select': 'chat_id,video_enabled,subtitle_style,gdrive_image_folder_id',
+                'chat_id': f'eq.{chat_id}',
+                'limit': 1
+            }, single=True)
+
+            if settings:
                 # If chat doesn't have folder ID set, use current global folder
                 if not settings.get('gdrive_image_folder_id'):
-                    settings['gdrive_image_folder_id'] = self.get_current_image_folder()
+                    settings['gdrive_image_folder_id'] = (
+                        folder_future.result() if folder_future else self.get_current_image_folder()
+                    )
                 return settings
             else:
                 # Return default settings
-                return self._default_video_settings()
+                return self._default_video_settings(
+                    folder_future.result() if folder_future else None
+                )
 
-        except Exception as e:
-            print(f"❌ Error getting video settings: {e}")
+        except Exception:
+            logger.exception("Error getting video settings")
             return self._default_video_settings()
 
-    def _default_video_settings(self):
+    def _default_video_settings(self, folder_id=None):
         """Default video settings (matches F:\Scripts\God's message\banner.ass)"""
         return {
             'chat_id': None,
             'video_enabled': True,  # Default ON
             'subtitle_style': 'Style: Banner,Arial,48,&H00FFFFFF,&H00FFFFFF,&H80000000,&H80000000,-1,0,0,0,100,100,0,0,4,0,0,5,40,40,40,1',
-            'gdrive_image_folder_id': self.get_current_image_folder()  # Use current selected folder
+            'gdrive_image_folder_id': folder_id or self.get_current_image_folder()  # Use current selected folder
         }
 
-    def set_video_enabled(self, chat_id, enabled):
+    def update_video_settings(self, chat_id, **fields):
         """
-        Enable/disable video generation for a chat
+        Upsert any number of video settings for a chat in one round trip
 
         Args:
             chat_id: Telegram chat ID
-            enabled: True to enable, False to disable
+            **fields: video_settings columns to set (video_enabled, subtitle_style, ...)
 
         Returns:
             bool: Success status
         """
         try:
             if not self.is_connected():
-                print("⚠️ Supabase not connected - cannot save video settings")
+                logger.warning("Supabase not connected - cannot save video settings")
                 return False
 
-            # Upsert (insert or update)
-            data = {
-                'chat_id': str(chat_id),
-                'video_enabled': enabled,
-                'updated_at': 'NOW()'
-            }
-
-            result = self.client.table('video_settings').upsert(data).execute()
-
-            status = "ENABLED" if enabled else "DISABLED"
-            print(f"✅ Video generation {status} for chat {chat_id}")
+            data = {'chat_id': str(chat_id), **fields}
+            self._t_video_settings.upsert(data).execute()
             return True
 
-        except Exception as e:
-            print(f"❌ Error setting video enabled: {e}")
+        except Exception:
+            logger.exception("Error updating video settings")
             return False
 
-    def set_subtitle_style(self, chat_id, style):
+    @contextmanager
+    def video_settings_batch(self, chat_id):
         """
-        Set custom subtitle style for a chat
+        Collect several video settings and save them with a single upsert on exit
+
+        Usage:
+            with client.video_settings_batch(chat_id) as settings:
+                settings['video_enabled'] = True
+                settings['subtitle_style'] = style
+        """
+        fields = {}
+        yield fields
+        if fields:
+            self.update_video_settings(chat_id, **fields)
+
+    def set_video_enabled(self, chat_id, enabled):
+        """
+        Enable/disable video generation for a chat
 
         Args:
             chat_id: Telegram chat ID
-            style: ASS style string
+            enabled: True to enable, False to disable
 
         Returns:
             bool: Success status
         """
-        try:
-            if not self.is_connected():
-                print("⚠️ Supabase not connected - cannot save subtitle style")
-                return False
+        if not self.update_video_settings(chat_id, video_enabled=enabled):
+            return False
 
-            # Upsert (insert or update)
-            data = {
-                'chat_id': str(chat_id),
-                'subtitle_style': style,
-                'updated_at': 'NOW()'
-            }
+        status = "ENABLED" if enabled else "DISABLED"
+        logger.info("Video generation %s for chat %s", status, chat_id)
+        return True
 
-            result = self.client.table('video_settings').upsert(data).execute()
+    def set_subtitle_style(self, chat_id, style):
+        """
+        Set custom subtitle style for a chat
 
-            print(f"✅ Subtitle style updated for chat {chat_id}")
-            return True
+        Args:
+            chat_id: Telegram chat ID
+            style: ASS style string
 
-        except Exception as e:
-            print(f"❌ Error setting subtitle style: {e}")
+        Returns:
+            bool: Success status
+        """
+        if not self.update_video_settings(chat_id, subtitle_style=style):
             return False
 
+        logger.info("Subtitle style updated for chat %s", chat_id)
+        return True
+
     def set_gdrive_image_folder(self, chat_id, folder_id):
         """
         Set Google Drive image folder for a chat
@@ -1055,31 +1912,18 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
         Returns:
             bool: Success status
         """
-        try:
-            if not self.is_connected():
-                print("⚠️ Supabase not connected - cannot save folder ID")
-                return False
-
-            # Upsert (insert or update)
-            data = {
-                'chat_id': str(chat_id),
-                'gdrive_image_folder_id': folder_id,
-                'updated_at': 'NOW()'
-            }
-
-            result = self.client.table('video_settings').upsert(data).execute()
-
-            print(f"✅ GDrive image folder set for chat {chat_id}: {folder_id}")
-            return True
-
-        except Exception as e:
-            print(f"❌ Error setting GDrive folder: {e}")
+        if not self.update_video_settings(chat_id, gdrive_image_folder_id=folder_id):
             return False
 
+        logger.info("GDrive image folder set for chat %s: %s", chat_id, folder_id)
+        return True
+
     def save_video_output(self, counter, chat_id, audio_path, video_path, gdrive_link, gofile_link, subtitle_style):
         """
         Save video output to database (for logging)
 
+        The insert runs in the background so the render flow never waits on it.
+
         Args:
             counter: Global counter
             chat_id: Telegram chat ID
@@ -1090,11 +1934,11 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             subtitle_style: ASS style used
 
         Returns:
-            bool: Success status
+            bool: True if the row was queued
         """
         try:
             if not self.is_connected():
-                print("⚠️ Supabase not connected - video output not saved")
+                logger.warning("Supabase not connected - video output not saved")
                 return False
 
             data = {
@@ -1107,15 +1951,21 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
                 'subtitle_style_used': subtitle_style
             }
 
-            result = self.client.table('video_outputs').insert(data).execute()
-
-            print(f"✅ Video output saved to database (counter: {counter})")
+            self._log_pool.submit(self._insert_video_output, data)
             return True
 
-        except Exception as e:
-            print(f"❌ Error saving video output: {e}")
+        except Exception:
+            logger.exception("Error saving video output")
             return False
 
+    def _insert_video_output(self, data):
+        """Background half of save_video_output"""
+        try:
+            self._t_video_outputs.insert(data).execute()
+            logger.debug("Video output saved to database (counter: %s)", data['counter'])
+        except Exception:
+            logger.exception("Error saving video output")
+
     # =========================================================================
     # IMAGE FOLDER MANAGEMENT
     # =========================================================================
@@ -1127,20 +1977,7 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
         Returns:
             dict: Folder number → {id, name} mapping
         """
-        return {
-            0: {
-                'id': os.getenv('GDRIVE_IMAGE_FOLDER_DEFAULT'),
-                'name': 'Nature'
-            },
-            1: {
-                'id': os.getenv('GDRIVE_IMAGE_FOLDER_JESUS'),
-                'name': 'Jesus'
-            },
-            2: {
-                'id': os.getenv('GDRIVE_IMAGE_FOLDER_SHORTS'),
-                'name': 'Shorts'
-            }
-        }
+        return _FOLDER_MAP
 
     def get_current_image_folder(self):
         """
@@ -1149,25 +1986,36 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
         Returns:
             str: Google Drive folder ID
         """
+        expires_at, cached_folder = self._folder_cache
+        if expires_at > time.monotonic():
+            return cached_folder
+
+        default_folder = _DEFAULT_FOLDER
         try:
             if not self.is_connected():
                 # Return default folder if not connected
-                return os.getenv('GDRIVE_IMAGE_FOLDER_DEFAULT')
+                return default_folder
 
             # Get global setting (we'll use chat_id='global' for global settings)
-            result = self.client.table('video_settings').select('gdrive_image_folder_id').eq('chat_id', 'global').execute()
-
-            if result.data and len(result.data) > 0:
-                folder_id = result.data[0].get('gdrive_image_folder_id')
-                if folder_id:
-                    return folder_id
-
-            # Return default if no setting found
-            return os.getenv('GDRIVE_IMAGE_FOLDER_DEFAULT')
-
-        except Exception as e:
-            print(f"❌ Error getting current folder: {e}")
-            return os.getenv('GDRIVE_IMAGE_FOLDER_DEFAULT')
+            try:
+                folder_id = self._pgrst_get('rpc/get_global_folder')
+            except Exception as e:
+                logger.warning("get_global_folder RPC unavailable, using fallback: %s", e)
+                row = self._pgrst_get('video_settings', {
+                    'select': 'gdrive_image_folder_id',
+                    'chat_id': 'eq.global',
+                    'limit': 1
+                }, single=True)
+                folder_id = row.get('gdrive_image_folder_id') if row else None
+
+            # Fall back to default if no setting found
+            folder_id = folder_id or default_folder
+            self._folder_cache = (time.monotonic() + IMAGE_FOLDER_CACHE_TTL, folder_id)
+            return folder_id
+
+        except Exception:
+            logger.exception("Error getting current folder")
+            return default_folder
 
     def is_jesus_folder_active(self):
         """
@@ -1177,13 +2025,59 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             bool: True if Jesus folder is active
         """
         try:
-            current_folder = self.get_current_image_folder()
-            jesus_folder = os.getenv('GDRIVE_IMAGE_FOLDER_JESUS')
-            return current_folder == jesus_folder
-        except Exception as e:
-            print(f"❌ Error checking Jesus folder: {e}")
+            return self.get_current_image_folder() == _JESUS_FOLDER
+        except Exception:
+            logger.exception("Error checking Jesus folder")
             return False
 
+    async def watch_image_folder(self):
+        """
+        Subscribe to changes of the global image folder row via Supabase Realtime,
+        so a switch made by another instance drops this instance's folder cache at
+        once instead of after IMAGE_FOLDER_CACHE_TTL. Call once from the event loop.
+
+        Returns:
+            The subscribed channel, or None if the subscription failed
+        """
+        if not self.is_connected():
+            return None
+
+        try:
+            if self._realtime is None:
+                self._realtime = AsyncRealtimeClient(f"{self.url}/realtime/v1", self.key)
+                await self._realtime.connect()
+
+            channel = self._realtime.channel('video_settings_global')
+            channel.on_postgres_changes(
+                '*',
+                schema='public',
+                table='video_settings',
+                filter='chat_id=eq.global',
+                callback=self._on_global_folder_change
+            )
+            await channel.subscribe()
+            logger.info("Watching global image folder changes")
+            return channel
+        except Exception:
+            logger.exception("Error subscribing to image folder changes")
+            return None
+
+    async def unwatch_image_folder(self):
+        """Close the Realtime connection opened by watch_image_folder"""
+        if self._realtime is None:
+            return
+
+        try:
+            await self._realtime.close()
+        except Exception:
+            logger.exception("Error closing image folder watch")
+        finally:
+            self._realtime = None
+
+    def _on_global_folder_change(self, payload):
+        """Realtime callback: the global folder row changed somewhere"""
+        self._folder_cache = (0.0, None)
+
     def set_current_image_folder(self, folder_number: int):
         """
         Set current active image folder (global setting)
@@ -1198,14 +2092,11 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             if not self.is_connected():
                 return False, "Database not connected"
 
-            folder_map = self.get_folder_mapping()
+            if not 0 <= folder_number < len(_FOLDER_TABLE):
+                return False, f"Invalid folder number. Use 0-{len(_FOLDER_TABLE)-1}"
 
-            if folder_number not in folder_map:
-                return False, f"Invalid folder number. Use 0-{len(folder_map)-1}"
-
-            folder_info = folder_map[folder_number]
-            folder_id = folder_info['id']
-            folder_name = folder_info['name']
+            folder_name = _FOLDER_TABLE[folder_number][0]
+            folder_id = _FOLDER_IDS[folder_number]
 
             if not folder_id:
                 return False, f"Folder ID not configured in .env"
@@ -1213,15 +2104,100 @@ CREATE TABLE IF NOT EXISTS default_reference_audio (
             # Upsert global setting
             data = {
                 'chat_id': 'global',
-                'gdrive_image_folder_id': folder_id,
-                'updated_at': 'NOW()'
+                'gdrive_image_folder_id': folder_id
             }
 
-            result = self.client.table('video_settings').upsert(data).execute()
+            result = self._t_video_settings.upsert(data).execute()
+            # Update our own cache right away instead of waiting for the Realtime echo
+            self._folder_cache = (time.monotonic() + IMAGE_FOLDER_CACHE_TTL, folder_id)
 
-            print(f"✅ Image folder set to: {folder_name} ({folder_id})")
+            logger.info("Image folder set to: %s (%s)", folder_name, folder_id)
             return True, folder_name
 
         except Exception as e:
-            print(f"❌ Error setting image folder: {e}")
+            logger.exception("Error setting image folder")
             return False, str(e)
+
+
+# =============================================================================
+# ASYNC TWINS
+# =============================================================================
+
+# Blocking I/O methods that get an awaitable a<name> twin. Each twin runs the
+# sync method in a worker thread, so callers on the event loop never stall on a
+# round trip and can overlap requests with asyncio.gather (bounded by the pool).
+# aget_counter / aincrement_counter / amark_video_processed are defined above
+# with the asyncpg fast path and are not replaced.
+ASYNC_TWIN_METHODS = (
+    'store_api_key', 'get_active_api_key', 'mark_key_exhausted', 'get_all_api_keys_status',
+    'store_youtube_channel', 'get_youtube_channel', 'get_youtube_channel_meta',
+    'get_youtube_channel_videos', 'mark_videos_processed', 'get_unprocessed_videos',
+    'get_channel_counter', 'increment_channel_counter',
+    'is_script_processed', 'mark_script_processed', 'get_processed_scripts',
+    'save_prompt', 'get_prompt', 'add_chat_config', 'get_active_chats',
+    'save_audio_link', 'save_audio_links', 'get_pending_audio_links', 'delete_audio_link',
+    'upload_raw_audio', 'save_direct_script_audio', 'get_pending_downloads',
+    'download_audio_file', 'delete_direct_script_audio', 'delete_direct_script_audios',
+    'upload_default_reference', 'save_default_reference_metadata',
+    'get_default_reference', 'download_default_reference',
+    'get_video_settings', 'set_video_enabled', 'set_subtitle_style',
+    'set_gdrive_image_folder', 'update_video_settings', 'save_video_output',
+    'get_current_image_folder', 'set_current_image_folder',
+)
+
+
+def _async_twin(name: str):
+    """Build the awaitable twin of SupabaseClient.<name>"""
+    async def twin(self, *args, **kwargs):
+        return await asyncio.to_thread(getattr(self, name), *args, **kwargs)
+
+    twin.__name__ = twin.__qualname__ = f"a{name}"
+    twin.__doc__ = f"Awaitable {name} (runs in a worker thread)"
+    return twin
+
+
+for _name in ASYNC_TWIN_METHODS:
+    setattr(SupabaseClient, f"a{_name}", _async_twin(_name))
+
+
+# =============================================================================
+# SHARED CLIENT
+# =============================================================================
+
+_shared_client: Optional[SupabaseClient] = None
+_http_client: Optional[httpx.Client] = None
+
+# Keep-alive pool behind every SupabaseClient. Managers call Supabase from
+# worker threads (asyncio.to_thread); httpx.Client is thread-safe.
+SUPABASE_HTTP_LIMITS = httpx.Limits(max_connections=40, max_keepalive_connections=20)
+
+# Fail fast on connect, but leave room for large storage uploads/downloads
+SUPABASE_HTTP_TIMEOUT = httpx.Timeout(120, connect=10)
+
+# HTTP/2 multiplexes requests over one connection; needs the optional h2 package
+SUPABASE_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the process-wide keep-alive httpx.Client (created on first use)"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            http2=SUPABASE_HTTP2,
+            limits=SUPABASE_HTTP_LIMITS,
+            timeout=SUPABASE_HTTP_TIMEOUT
+        )
+    return _http_client
+
+
+def get_supabase_client() -> SupabaseClient:
+    """
+    Get the process-wide SupabaseClient (created on first use).
+
+    It runs on the pooled keep-alive httpx.Client, so all managers should
+    share this instance instead of building their own.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = SupabaseClient()
+    return _shared_client